@@ -0,0 +1,127 @@
+'''
+Compares how long a cold Lambda takes to load the courses of a term from each format the web scraper writes
+(classes.json, the classes file of each term and classes.bin, each uncompressed and gzip compressed).
+The download time is estimated from the size of the file and the bandwidth, the rest is measured by running the
+S3Database and BinaryDatabase with the files in memory.
+
+Run from the root of the repository:
+python -m Backend.scripts.benchmark_cold_load [path to classes.json] [--bandwidth MB/s] [--repeat N]
+'''
+import argparse
+import gzip
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "WebScraping", "layers", "catalogue", "python"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "WebScraping", "layers", "s3_files", "python"))
+from catalogue_format import pack_catalogue
+from Backend.src.database.s3_database import S3Database
+from Backend.src.database.binary_database import BinaryDatabase
+from Backend.src.logger import logger
+
+KEY_PATH = "web-scraping-stepfunction/"
+COURSES_READ = 6 # Number of courses of a typical request
+
+def generate_classes(course_count: int = 3000, terms: list = ["Fall 2023", "Winter 2024", "Summer 2024"]) -> dict:
+    '''
+    Generates a catalogue about the size of a real term, for when there is no classes.json to benchmark.
+    '''
+    random.seed(0)
+    def get_section(section_id: str, meeting_count: int) -> dict:
+        hour = random.randint(8, 20)
+        return {
+            "SectionID": section_id, "CRN": str(random.randint(10000, 99999)), "Status": random.choice(["Open", "Registration Closed", "Full, No Waitlist"]),
+            "SectionType": random.choice(["In person", "Online", "Hybrid"]), "Instructor": f"Professor {random.randint(1, 1500)}",
+            "MeetingDates": [{"DayOfWeek": day, "StartTime": f"{hour:02}:35", "EndTime": f"{hour + 1:02}:25"} for day in random.sample(["Mon", "Tue", "Wed", "Thu", "Fri"], meeting_count)],
+            "TermDuration": "Full Term", "AlsoRegister": [[f"L{j}" for j in range(1, random.randint(2, 6))]], "StartDate": "2023-09-06", "EndDate": "2023-12-08"
+        }
+
+    return {f"TEST {1000 + i}-{term}": {
+        "Subject": f"TEST {1000 + i}", "Term": term, "Title": f"Course Title {random.randint(1, 10 ** 6)}",
+        "Prerequisite": f"second-year status in Program {random.randint(1, 200)} or permission of the department.",
+        "LectureSections": [get_section(section_id, 2) for section_id in "AB"],
+        "LabSections": [{**get_section(f"L{j}", 1), "WeekSchedule": "Every Week"} for j in range(1, 5)]
+    } for term in terms for i in range(course_count)}
+
+def get_files(classes: dict, compress: bool) -> dict:
+    terms_courses = {}
+    term_classes = {}
+    for key, course in classes.items():
+        terms_courses.setdefault(course["Term"], []).append(course["Subject"])
+        term_classes.setdefault(course["Term"], {})[key] = course
+
+    files = {
+        "classes.json": json.dumps(classes).encode("UTF-8"),
+        "terms.json": json.dumps({term: {} for term in terms_courses}).encode("UTF-8"),
+        "terms_courses.json": json.dumps(terms_courses).encode("UTF-8"),
+        "classes.bin": pack_catalogue(classes),
+        **{f"classes/{term}.json": json.dumps(term_classes).encode("UTF-8") for term, term_classes in term_classes.items()}
+    }
+    return {KEY_PATH + name: gzip.compress(body, 6) if compress else body for name, body in files.items()}
+
+def benchmark(database_class: type, files: dict, compress: bool, classes: dict, bandwidth: float) -> tuple:
+    '''
+    Returns the bytes downloaded and the estimated cold load time (in seconds) of reading a few courses.
+    '''
+    downloaded = []
+    def get_object(bucket_name: str, key: str) -> Mock:
+        s3_object = Mock()
+        if key in files:
+            s3_object.get.side_effect = lambda: downloaded.append(len(files[key])) or {
+                "Body": io.BytesIO(files[key]), "ETag": key, "ContentEncoding": "gzip" if compress else ""
+            }
+        else:
+            s3_object.get.side_effect = ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return s3_object
+
+    with patch("boto3.resource") as mock_resource:
+        mock_resource.return_value.Object.side_effect = get_object
+        start = time.perf_counter()
+        database = database_class(prefetch=False)
+        # The courses of a request are all from the same term
+        term = next(iter(classes.values()))["Term"]
+        term_courses = [course["Subject"] for course in classes.values() if course["Term"] == term]
+        for course_code in term_courses[::max(len(term_courses) // COURSES_READ, 1)][:COURSES_READ]:
+            database.get_course(course_code, term)
+        elapsed = time.perf_counter() - start
+
+    return sum(downloaded), elapsed + sum(downloaded) / (bandwidth * 1e6)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks the cold load time of each course catalogue format.")
+    parser.add_argument("classes", nargs="?", help="path to a classes.json (a synthetic one is generated otherwise)")
+    parser.add_argument("--bandwidth", type=float, default=50, help="estimated download bandwidth from S3 in MB/s")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.classes:
+        with open(args.classes) as classes_file:
+            classes = json.load(classes_file)
+    else:
+        classes = generate_classes()
+
+    logger.disabled = True # e.g. the warnings of the classes.json fallback
+    BinaryDatabase.catalogue_directory = tempfile.mkdtemp()
+    print(f"{len(classes)} courses, {args.bandwidth} MB/s, best of {args.repeat}")
+    print(f"{'format':<28}{'downloaded (KB)':>16}{'cold load (ms)':>16}")
+    for compress in [False, True]:
+        files = get_files(classes, compress)
+        all_terms_files = {key: body for key, body in files.items() if not key.startswith(KEY_PATH + "classes/")}
+        for name, database_class, database_files in [
+            ("classes.json", S3Database, all_terms_files), 
+            ("classes/<term>.json", S3Database, files), 
+            ("classes.bin", BinaryDatabase, files)
+        ]:
+            results = [benchmark(database_class, database_files, compress, classes, args.bandwidth) for _ in range(args.repeat)]
+            size, seconds = min(results, key=lambda result: result[1])
+            print(f"{name + (' (gzip)' if compress else ''):<28}{size / 1000:>16.0f}{seconds * 1000:>16.1f}")
+
+if __name__ == "__main__":
+    main()
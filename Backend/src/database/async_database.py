@@ -0,0 +1,72 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+from ..model.course import Course
+from .database import CourseDatabase
+from .course_cache import course_cache
+
+# Runs the blocking calls of the databases (boto3 has no async client). It is not the executor of S3Database, since these
+# calls wait for its downloads and would block them if they shared its threads.
+executor = ThreadPoolExecutor(max_workers=8)
+
+class AsyncCourseDatabase:
+    '''
+    Async version of a CourseDatabase, so lookups can be awaited together (e.g. with asyncio.gather) instead of one
+    after another. The calls to the database are run in threads.
+    '''
+    def __init__(self, database: CourseDatabase, batch_size: int | None = None):
+        self.database = database
+        # Course codes read by each of the get_courses calls that run at the same time (all of them in one call by default)
+        self.batch_size = batch_size or getattr(database, "MAX_BATCH_GET_KEYS", None)
+
+    async def run(self, function: Callable, *args) -> object:
+        return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+    async def get_course(self, course_code: str, term: str) -> Course | None:
+        '''
+        Gets the Course object associated with a given course code and term.
+        Returns None if the course code does not exist for the given term.
+        '''
+        return await self.run(self.database.get_course, course_code, term)
+
+    async def get_courses(self, course_codes: List[str], term: str) -> Dict[str, Course]:
+        '''
+        Gets the Course objects associated with the given course codes and term, by course code.
+        The course codes are split into batches of batch_size, which are all read at the same time.
+        '''
+        course_codes = list(dict.fromkeys(course_codes))
+        batch_size = self.batch_size or len(course_codes) or 1
+        batches = await asyncio.gather(*[
+            self.run(self.database.get_courses, course_codes[i:i + batch_size], term)
+            for i in range(0, len(course_codes), batch_size)
+        ])
+
+        courses = {}
+        for batch in batches:
+            courses.update(batch)
+        return courses
+
+    async def get_cached_courses(self, course_codes: List[str], term: str) -> Dict[str, Course]:
+        '''
+        Same as get_courses, but uses the process-wide course cache (see CourseDatabase.get_cached_courses).
+        '''
+        data_version = await self.get_data_version(term)
+        courses, missing_course_codes = course_cache.get_courses(course_codes, term, data_version)
+        if missing_course_codes:
+            courses.update(course_cache.put_courses(await self.get_courses(missing_course_codes, term), term, data_version))
+        return courses
+
+    async def get_data_version(self, term: str) -> str:
+        return await self.run(self.database.get_data_version, term)
+
+    async def get_terms(self) -> dict:
+        '''
+        Gets the dict of terms from the database.
+        '''
+        return await self.run(self.database.get_terms)
+
+    async def get_course_code_and_section_list(self, term: str) -> List[str]:
+        '''
+        Gets a list of the course codes and sections for a given term.
+        '''
+        return await self.run(self.database.get_course_code_and_section_list, term)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+from concurrent.futures import Future
+from typing import Tuple
+import mmap
+import os
+import shutil
+import tempfile
+import botocore.exceptions
+from ..model.course import Course
+from ..logger import logger
+from .s3_database import S3Database
+
+try:
+    from catalogue_format import CatalogueReader # from the CatalogueLayer (see backend-template.yaml)
+except ImportError: # the layer is only needed when the database_type is "binary"
+    CatalogueReader = None
+
+class BinaryDatabase(S3Database):
+    '''
+    Same as S3Database, but the courses are read from the binary catalogue written by the parser (classes.bin),
+    which is downloaded once and mapped into memory so that only the courses that are requested are decoded.
+    Falls back to the JSON classes files while there is no catalogue.
+    '''
+    catalogue_file = "web-scraping-stepfunction/classes.bin"
+    catalogue_directory = tempfile.gettempdir()
+
+    def __init__(self, prefetch: bool = True):
+        if CatalogueReader is None:
+            raise ImportError("BinaryDatabase requires the catalogue_format module (CatalogueLayer)!")
+        super().__init__(prefetch)
+        if prefetch:
+            self.get_file(self.catalogue_file)
+
+    def read_file(self, key: str, response: dict) -> Tuple[object, str]:
+        '''
+        Writes the catalogue into a temporary file and maps it into memory (other files are read as JSON).
+        Returns the catalogue reader and the ETag of the catalogue.
+        '''
+        if key != self.catalogue_file:
+            return super().read_file(key, response)
+
+        path = os.path.join(self.catalogue_directory, os.path.basename(key))
+        # Written next to the catalogue and then moved, so a catalogue that is still mapped (e.g. while the catalogue
+        # is refreshed) is never overwritten
+        with tempfile.NamedTemporaryFile(dir=self.catalogue_directory, delete=False) as catalogue_file:
+            shutil.copyfileobj(self.get_body(response), catalogue_file)
+        os.replace(catalogue_file.name, path)
+
+        with open(path, "rb") as catalogue_file:
+            buffer = mmap.mmap(catalogue_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return CatalogueReader(buffer), response.get("ETag", "")
+
+    def get_catalogue(self) -> Tuple[CatalogueReader | None, str]:
+        '''
+        Gets the catalogue reader and its ETag, or None if there is no catalogue.
+        '''
+        try:
+            return self.load_json(self.catalogue_file)
+        except botocore.exceptions.ClientError as error:
+            if error.response.get("Error", {}).get("Code") != "NoSuchKey":
+                raise
+            logger.warning(f"There is no catalogue: {self.catalogue_file}, using the JSON classes files!")
+            # Remembered, so the catalogue is not requested again for every course
+            missing_catalogue = Future()
+            missing_catalogue.set_result((None, ""))
+            with self.lock:
+                self.files[self.catalogue_file] = missing_catalogue
+            return None, ""
+
+    def get_course(self, course_code: str, term: str) -> Course | None:
+        '''
+        Gets the Course object associated with a given course code and term.
+        Returns None if the course code does not exist for the given term.
+        '''
+        catalogue = self.get_catalogue()[0]
+        if catalogue is None:
+            return super().get_course(course_code, term)
+
+        course_map = catalogue.get(f"{course_code}-{term}")
+        if course_map is None:
+            logger.warning(f"There are no courses with code: {course_code} and term: {term}!")
+            return None
+
+        return self.convert_to_course(course_map)
+
+    def get_data_version(self, term: str) -> str:
+        '''
+        Gets the ETag of the catalogue that was loaded (or of the JSON classes file of the term if there is no catalogue).
+        '''
+        catalogue, version = self.get_catalogue()
+        if catalogue is None:
+            return super().get_data_version(term)
+        return version
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from ..model.course import Course
+
+MAX_CACHED_COURSES = 512 # Maximum number of courses kept in memory between requests
+
+class CourseCache:
+    '''
+    Least recently used cache of the courses read from the database, keyed by (course code, term, data version).
+    It lives as long as the process (i.e. a warm Lambda container), so the cached courses are shared between
+    requests and must not be modified (see Course.get_filtered_course).
+    '''
+    def __init__(self, max_size: int = MAX_CACHED_COURSES):
+        self.max_size = max_size
+        self.courses: OrderedDict[Tuple[str, str, str], Course] = OrderedDict()
+
+    def get(self, course_code: str, term: str, data_version: str) -> Course | None:
+        '''
+        Returns the cached course, or None if the course is not cached for the given data version.
+        '''
+        key = (course_code, term, data_version)
+        course = self.courses.get(key)
+        if course is not None:
+            self.courses.move_to_end(key)
+        return course
+
+    def put(self, course: Course, course_code: str, term: str, data_version: str) -> None:
+        key = (course_code, term, data_version)
+        self.courses[key] = course
+        self.courses.move_to_end(key)
+        if len(self.courses) > self.max_size:
+            self.courses.popitem(last=False)
+
+    def get_courses(self, course_codes: List[str], term: str, data_version: str) -> Tuple[Dict[str, Course], List[str]]:
+        '''
+        Returns the cached courses by course code, and the course codes that are not cached and have to be read from
+        the database (which are then added with put_courses).
+        '''
+        courses = {}
+        for course_code in course_codes:
+            course = self.get(course_code, term, data_version)
+            if course is not None:
+                courses[course_code] = course
+        return courses, [course_code for course_code in course_codes if course_code not in courses]
+
+    def put_courses(self, courses: Dict[str, Course], term: str, data_version: str) -> Dict[str, Course]:
+        for course_code, course in courses.items():
+            self.put(course, course_code, term, data_version)
+        return courses
+
+    def clear(self) -> None:
+        self.courses.clear()
+
+course_cache = CourseCache()
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List
+import time
 from ..model.course import Course
 from ..model.section import Section
 from ..model.term_duration import TermDuration
 from ..model.week_schedule import WeekSchedule
 from ..model.day_of_week import DayOfWeek
 from ..model.date import ClassTime
+from .course_cache import course_cache
+
+DATA_VERSION_SECONDS = 15 * 60 # How long courses are cached for when the database cannot tell when its data changed
 
 class CourseDatabase(ABC):
     region = 'us-east-1'
@@ -43,6 +47,49 @@ class CourseDatabase(ABC):
         Returns None if the course code does not exist for the given term.
         '''
 
+    def get_courses(self, course_codes: List[str], term: str) -> Dict[str, Course]:
+        '''
+        Gets the Course objects associated with the given course codes and term, by course code.
+        Course codes that do not exist for the given term are left out.
+        '''
+        courses = {}
+        for course_code in course_codes:
+            course = self.get_course(course_code, term)
+            if course is not None:
+                courses[course_code] = course
+        return courses
+
+    def get_cached_courses(self, course_codes: List[str], term: str) -> Dict[str, Course]:
+        '''
+        Same as get_courses, but uses the process-wide course cache like get_cached_course (only the 
+        courses that are not cached are read from the database).
+        '''
+        data_version = self.get_data_version(term)
+        courses, missing_course_codes = course_cache.get_courses(course_codes, term, data_version)
+        if missing_course_codes:
+            courses.update(course_cache.put_courses(self.get_courses(missing_course_codes, term), term, data_version))
+        return courses
+
+    def get_cached_course(self, course_code: str, term: str) -> Course | None:
+        '''
+        Same as get_course, but the course is kept in the process-wide course cache for the current
+        data version, so it is shared with later requests and must not be modified.
+        '''
+        data_version = self.get_data_version(term)
+        course = course_cache.get(course_code, term, data_version)
+        if course is None:
+            course = self.get_course(course_code, term)
+            if course is not None:
+                course_cache.put(course, course_code, term, data_version)
+        return course
+
+    def get_data_version(self, term: str) -> str:
+        '''
+        Gets a version that changes whenever the courses of the term in the database may have changed. By default the 
+        version changes every DATA_VERSION_SECONDS, so cached courses are read again after that long.
+        '''
+        return str(int(time.time() // DATA_VERSION_SECONDS))
+
     @abstractmethod
     def get_terms(self) -> dict:
         '''
@@ -20,6 +20,18 @@ class ErrorCourseDatabase(CourseDatabase):
     def get_course(self, course_code: str, term: str):
         self.exception()
 
+    def get_cached_course(self, course_code: str, term: str):
+        self.exception()
+
+    def get_courses(self, course_codes, term: str):
+        self.exception()
+
+    def get_cached_courses(self, course_codes, term: str):
+        self.exception()
+
+    def get_data_version(self, term: str):
+        self.exception()
+
     def get_terms(self):
         self.exception()
     
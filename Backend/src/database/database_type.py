@@ -4,11 +4,14 @@ import botocore.exceptions
 from .database import CourseDatabase
 from .dynamo_database import DynamoDatabase
 from .s3_database import S3Database
+from .binary_database import BinaryDatabase
 from .database_error import ErrorCourseDatabase
+from .async_database import AsyncCourseDatabase
 
 S3_DATABASE = "s3"
 DYNAMO_DATABASE = "dynamodb"
-databases = {S3_DATABASE: S3Database, DYNAMO_DATABASE: DynamoDatabase}
+BINARY_DATABASE = "binary"
+databases = {S3_DATABASE: S3Database, DYNAMO_DATABASE: DynamoDatabase, BINARY_DATABASE: BinaryDatabase}
 
 def get_database_class(db_type):
     return databases[db_type]
@@ -20,4 +23,5 @@ def create_course_database(db_type) -> CourseDatabase:
         return ErrorCourseDatabase()
 
 db_type = os.environ.get('database_type', S3_DATABASE)
-course_database: CourseDatabase = create_course_database(db_type)
\ No newline at end of file
+course_database: CourseDatabase = create_course_database(db_type)
+async_course_database = AsyncCourseDatabase(course_database)
@@ -1,10 +1,12 @@
-from typing import List
+from typing import Dict, List
 import boto3
 from boto3.dynamodb.types import TypeDeserializer
 import os
+import time
 from ..model.course import Course
 from ..logger import logger
 from .database import CourseDatabase
+from .database_error import CouresDatabaseException
 from .s3_database import S3Database
 
 class DynamoDatabase(CourseDatabase):
@@ -12,7 +14,16 @@ class DynamoDatabase(CourseDatabase):
     test_table_name = "carleton-courses-test"
     prod_table_name = "carleton-courses"
     deserializer = TypeDeserializer()
+    term_index_name = "TermIndex" # Global secondary index keyed by Term (see the createTable function)
+    lecture_section_ids_column = "LectureSectionIDs" # Written by the insertData function and projected into the term index
     ITEMS_CONSTANT = "Items"
+    ITEM_CONSTANT = "Item"
+    RESPONSES_CONSTANT = "Responses"
+    UNPROCESSED_KEYS_CONSTANT = "UnprocessedKeys"
+    MAX_BATCH_GET_KEYS = 100 # Maximum number of keys in one BatchGetItem request
+    BATCH_RETRY_DELAY = 0.05 # Seconds to wait before requesting unprocessed keys again (doubled on every retry)
+    MAX_BATCH_RETRY_DELAY = 1
+    MAX_BATCH_RETRIES = 5 # Keeps the retries well within the timeout of the Lambda functions
     
     def __init__(self):
         aws_test_db_access_key_id = os.environ.get('aws_test_db_access_key_id', None)
@@ -36,82 +47,91 @@ class DynamoDatabase(CourseDatabase):
         return 'dynamodb'
     
     def deserialize_response(self, response: List[dict]) -> List[dict]:
-        deserialized_response = []
-        for item in response[self.ITEMS_CONSTANT]:
-            data = {k: self.deserializer.deserialize(v) for k,v in item.items()}
-            deserialized_response.append(data)
+        return [self.deserialize_item(item) for item in response[self.ITEMS_CONSTANT]]
 
-        return deserialized_response
+    def deserialize_item(self, item: dict) -> dict:
+        return {k: self.deserializer.deserialize(v) for k,v in item.items()}
+
+    def get_key(self, course_code: str, term: str) -> dict:
+        return {self.subject_column: {"S": course_code}, self.term_column: {"S": term}}
 
     def get_course(self, course_code: str, term: str) -> Course | None:
         '''
         Gets the Course object associated with a given course code and term.
         Returns None if the course code does not exist for the given term.
         '''
-        filter_expression = "#subject = :subject AND #term = :term"
-        attribute_names = {"#subject": self.subject_column, "#term": self.term_column}
-        attribute_values = {":subject": {"S": course_code}, ":term": {"S": term}}
-
-        last_evaluated_key = None
-        while True:
-            if last_evaluated_key is not None:
-                response = self.dynamodb.scan(
-                    TableName=self.table_name,
-                    FilterExpression=filter_expression,
-                    ExpressionAttributeNames=attribute_names,
-                    ExpressionAttributeValues=attribute_values,
-                    ExclusiveStartKey = last_evaluated_key
-                )
-            else:
-                response = self.dynamodb.scan(
-                    TableName=self.table_name,
-                    FilterExpression=filter_expression,
-                    ExpressionAttributeNames=attribute_names,
-                    ExpressionAttributeValues=attribute_values
-                )
-            courses = self.deserialize_response(response)
-            last_evaluated_key = response.get("LastEvaluatedKey")
-            if len(courses) != 0 or last_evaluated_key is None:
-                break
+        if not course_code: # DynamoDB rejects empty keys
+            logger.warning("There are no courses with an empty code!")
+            return None
 
-        if len(courses) == 0:
+        response = self.dynamodb.get_item(TableName=self.table_name, Key=self.get_key(course_code, term))
+        item = response.get(self.ITEM_CONSTANT)
+        if item is None:
+            logger.warning(f"There are no courses with code: {course_code} and term: {term}!")
             return None
-        if len(courses) > 1:
-            logger.warning(f"There are more than one courses with code: {course_code} and term {term}!")
-        
-        course_map = courses[0]
-        return self.convert_to_course(course_map)
+
+        return self.convert_to_course(self.deserialize_item(item))
+
+    def get_courses(self, course_codes: List[str], term: str) -> Dict[str, Course]:
+        '''
+        Gets the Course objects associated with the given course codes and term (in as few requests as possible),
+        by course code. Course codes that do not exist for the given term are left out.
+        '''
+        # A batch cannot request the same key twice, and DynamoDB rejects empty keys (such a course does not exist)
+        course_codes = [course_code for course_code in dict.fromkeys(course_codes) if course_code]
+        courses = {}
+        for i in range(0, len(course_codes), self.MAX_BATCH_GET_KEYS):
+            request_items = {self.table_name: {"Keys": [self.get_key(course_code, term) for course_code in course_codes[i:i + self.MAX_BATCH_GET_KEYS]]}}
+            retries = 0
+            while request_items:
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get(self.RESPONSES_CONSTANT, {}).get(self.table_name, []):
+                    course = self.convert_to_course(self.deserialize_item(item))
+                    courses[course.code] = course
+
+                # Keys that were not read (e.g. because of throttling) are requested again after a backoff
+                request_items = response.get(self.UNPROCESSED_KEYS_CONSTANT)
+                if request_items:
+                    if retries >= self.MAX_BATCH_RETRIES:
+                        raise CouresDatabaseException(f"Could not read {len(request_items[self.table_name]['Keys'])} courses from {self.table_name} after {self.MAX_BATCH_RETRIES} retries!")
+                    time.sleep(min(self.BATCH_RETRY_DELAY * 2 ** retries, self.MAX_BATCH_RETRY_DELAY))
+                    retries += 1
+
+        return courses
 
     def get_terms(self) -> dict:
         '''
         Gets the current terms in the database.
         '''
         # just read from JSON file to get terms since we also need to get reading week info (which is not currently in a DynamoDB table)
-        return S3Database().get_terms()  
+        return S3Database(prefetch=False).get_terms()  
     
     def get_course_code_and_section_list(self, term: str) -> List[str]:
         '''
         Gets a list of the course codes and sections for a given term.
         '''
-        filter_expression = "#term = :term"
+        # The term index only projects the key and the lecture section IDs, so the query reads just the listing
+        key_condition = "#term = :term"
         attribute_names = {"#term": self.term_column}
         attribute_values = {":term": {"S": term}}
-        
+
         last_evaluated_key = None
         all_courses = []
         while True:
             if last_evaluated_key is not None:
-                response = self.dynamodb.scan(
+                response = self.dynamodb.query(
                     TableName=self.table_name,
-                    FilterExpression=filter_expression,
+                    IndexName=self.term_index_name,
+                    KeyConditionExpression=key_condition,
                     ExpressionAttributeNames=attribute_names,
                     ExpressionAttributeValues=attribute_values,
-                    ExclusiveStartKey = last_evaluated_key
+                    ExclusiveStartKey=last_evaluated_key
                 )
             else:
-                response = self.dynamodb.scan(
+                response = self.dynamodb.query(
                     TableName=self.table_name,
-                    FilterExpression=filter_expression,
+                    IndexName=self.term_index_name,
+                    KeyConditionExpression=key_condition,
                     ExpressionAttributeNames=attribute_names,
                     ExpressionAttributeValues=attribute_values
                 )
@@ -120,5 +140,4 @@ class DynamoDatabase(CourseDatabase):
             last_evaluated_key = response.get("LastEvaluatedKey")
             if last_evaluated_key is None:
                 break
-        return list({combination for course in all_courses for section in course.get(self.lecture_sections_column) for combination in (course.get(self.subject_column), course.get(self.subject_column) + " " + section.get(self.section_id_column))})
-
+        return list({combination for course in all_courses for section_id in course.get(self.lecture_section_ids_column, []) for combination in (course.get(self.subject_column), course.get(self.subject_column) + " " + section_id)})
@@ -1,63 +1,197 @@
-from typing import List, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Tuple
 import boto3
+import botocore.exceptions
 import os
+import threading
+import time
 from ..model.course import Course
 from ..logger import logger
 from .database import CourseDatabase
 import json
+from s3_files import open_body # from the S3FilesLayer (see backend-template.yaml)
+
+# Downloads the files in the background, so they are fetched at the same time as each other (and as the Lambda initializes)
+executor = ThreadPoolExecutor(max_workers=4)
 
 class S3Database(CourseDatabase):
-    def __init__(self):
+    bucket_name = "carletonschedulingtool"
+    classes_json_file = "web-scraping-stepfunction/classes.json"
+    terms_json_file = "web-scraping-stepfunction/terms.json"
+    terms_courses_json_file = "web-scraping-stepfunction/terms_courses.json"
+    term_classes_json_path = "web-scraping-stepfunction/classes/" # classes of each term, written by the parser as <term>.json
+    not_modified_codes = ["304", "NotModified"]
+    # Seconds between checks of whether a loaded file has changed in s3 (0 to never check, e.g. until a cold start)
+    refresh_seconds = float(os.environ.get("refresh_seconds", 300))
+
+    def __init__(self, prefetch: bool = True):
         aws_test_db_access_key_id = os.environ.get('aws_test_db_access_key_id', None)
         aws_test_db_secret_access_key = os.environ.get('aws_test_db_secret_access_key', None)
-        bucket_name = "carletonschedulingtool"
-        classes_json_file = "web-scraping-stepfunction/classes.json"
-        terms_json_file = "web-scraping-stepfunction/terms.json"
-        terms_courses_json_file = "web-scraping-stepfunction/terms_courses.json"
 
         # If running locally
         if (
-            aws_test_db_access_key_id is not None and 
+            aws_test_db_access_key_id is not None and
             aws_test_db_secret_access_key is not None
             ):
-            s3 = boto3.resource(self.get_resource(), 
-                                aws_access_key_id=aws_test_db_access_key_id, 
-                                aws_secret_access_key=aws_test_db_secret_access_key, 
+            self.s3 = boto3.resource(self.get_resource(),
+                                aws_access_key_id=aws_test_db_access_key_id,
+                                aws_secret_access_key=aws_test_db_secret_access_key,
                                 region_name=self.region)
         else:
-            s3 = boto3.resource(self.get_resource())
+            self.s3 = boto3.resource(self.get_resource())
 
-        classes_file = s3.Object(bucket_name, classes_json_file)
-        terms_file = s3.Object(bucket_name, terms_json_file)
-        terms_courses_file = s3.Object(bucket_name, terms_courses_json_file)
-        self.classes_dict: Dict[str, dict] = json.load(classes_file.get()["Body"])
-        self.terms_dict: Dict[str, dict] = json.load(terms_file.get()["Body"])
-        self.terms_courses_dict: Dict[str, List] = json.load(terms_courses_file.get()["Body"])
+        # Every file is only downloaded the first time it is needed (the classes of a term when one of its courses is)
+        self.lock = threading.Lock()
+        self.files: Dict[str, Future] = {}
+        self.checked: Dict[str, float] = {} # time.monotonic() of when each file was last loaded or checked
+        self.refreshes: Dict[str, Future] = {}
+        if prefetch:
+            self.get_file(self.terms_json_file)
+            self.get_file(self.terms_courses_json_file)
 
     def get_resource(self):
         return 's3'
 
+    def get_file(self, key: str) -> Future:
+        '''
+        Gets the future of the (JSON, ETag) of a file, starting to download it if it was not already.
+        '''
+        with self.lock:
+            future = self.files.get(key)
+            if future is None:
+                future = self.files[key] = executor.submit(self.load_file, key)
+        return future
+
+    def load_file(self, key: str) -> Tuple[dict, str]:
+        '''
+        Downloads a JSON file. Returns the JSON and the ETag of the file.
+        '''
+        response = self.s3.Object(self.bucket_name, key).get()
+        with self.lock:
+            self.checked[key] = time.monotonic()
+        return self.read_file(key, response)
+
+    def read_file(self, key: str, response: dict) -> Tuple[dict, str]:
+        return json.load(self.get_body(response)), response.get("ETag", "")
+
+    def get_body(self, response: dict) -> object:
+        '''
+        Gets the Body of a downloaded file, which is decompressed while it is read if the file was written
+        compressed (the web scraper writes its files with a ContentEncoding of gzip).
+        '''
+        return open_body(response)
+
+    def load_json(self, key: str) -> Tuple[dict, str]:
+        '''
+        Waits for a file to be downloaded. Downloads that fail are retried the next time the file is needed.
+        '''
+        future = self.get_file(key)
+        try:
+            result = future.result()
+        except Exception:
+            with self.lock:
+                # The same download can be used for several keys (see get_term_classes)
+                for failed_key in [file_key for file_key, file in self.files.items() if file is future]:
+                    del self.files[failed_key]
+            raise
+
+        self.refresh_if_stale(key, future, result[1])
+        return result
+
+    def refresh_if_stale(self, key: str, future: Future, etag: str) -> None:
+        '''
+        Starts checking whether a file has changed in s3 if it was not checked in the last refresh_seconds.
+        The file that was loaded is still used until the check is done.
+        '''
+        if self.refresh_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        with self.lock:
+            checked = self.checked.setdefault(key, now)
+            refresh = self.refreshes.get(key)
+            if now - checked < self.refresh_seconds or (refresh is not None and not refresh.done()):
+                return
+            self.refreshes[key] = executor.submit(self.refresh_file, key, future, etag)
+
+    def refresh_file(self, key: str, future: Future, etag: str) -> None:
+        '''
+        Downloads a file again only if its ETag changed (a conditional GET), and replaces the loaded file with it.
+        '''
+        try:
+            s3_object = self.s3.Object(self.bucket_name, key)
+            response = s3_object.get(IfNoneMatch=etag) if etag else s3_object.get()
+            refreshed = Future()
+            refreshed.set_result(self.read_file(key, response))
+            with self.lock:
+                # Only replaced if the file was not replaced (or dropped) in the meantime
+                if self.files.get(key) is future:
+                    self.files[key] = refreshed
+            logger.info(f"Refreshed {key}, its ETag changed from {etag} to {response.get('ETag', '')}")
+        except botocore.exceptions.ClientError as error:
+            if error.response.get("Error", {}).get("Code") not in self.not_modified_codes:
+                logger.warning(f"Could not refresh {key}: {error}")
+        except Exception as error:
+            logger.warning(f"Could not refresh {key}: {error}")
+        finally:
+            with self.lock:
+                self.checked[key] = time.monotonic()
+
+    def get_term_classes(self, term: str) -> Tuple[Dict[str, dict], str]:
+        '''
+        Gets the classes of a term (keyed by "<course code>-<term>") and the ETag of their file.
+        '''
+        key = f"{self.term_classes_json_path}{term}.json"
+        self.get_file(key) # started before waiting for the terms, so both files are downloaded at the same time
+        if term not in self.get_terms_courses():
+            with self.lock:
+                future = self.files.pop(key, None)
+            if future is not None:
+                future.cancel()
+            return {}, ""
+
+        try:
+            return self.load_json(key)
+        except botocore.exceptions.ClientError as error:
+            if error.response.get("Error", {}).get("Code") != "NoSuchKey":
+                raise
+            # The classes of every term are still in one file until the parser has written the files of each term
+            logger.warning(f"There is no classes file for term: {term}, using {self.classes_json_file}!")
+            with self.lock:
+                self.files[key] = self.files.get(self.classes_json_file) or executor.submit(self.load_file, self.classes_json_file)
+                self.files[self.classes_json_file] = self.files[key]
+            return self.load_json(key)
+
+    def get_terms_courses(self) -> Dict[str, List]:
+        return self.load_json(self.terms_courses_json_file)[0]
+
     def get_course(self, course_code: str, term: str) -> Course | None:
         '''
         Gets the Course object associated with a given course code and term.
         Returns None if the course code does not exist for the given term.
         '''
-        course_map = self.classes_dict.get(f"{course_code}-{term}", None)
+        course_map = self.get_term_classes(term)[0].get(f"{course_code}-{term}", None)
         if course_map is None:
             logger.warning(f"There are no courses with code: {course_code} and term: {term}!")
             return None
-        
+
         return self.convert_to_course(course_map)
 
+    def get_data_version(self, term: str) -> str:
+        '''
+        Gets the ETag of the classes file of the term that was loaded (each file is only loaded once).
+        '''
+        return self.get_term_classes(term)[1]
+
     def get_terms(self) -> dict:
         '''
         Gets the terms dict in the database.
         '''
-        return self.terms_dict
+        return self.load_json(self.terms_json_file)[0]
 
 
     def get_course_code_and_section_list(self, term: str) -> List[str]:
         '''
         Gets a list of the course codes and sections for a given term.
         '''
-        return self.terms_courses_dict.get(term, [])
+        return self.get_terms_courses().get(term, [])
@@ -8,4 +8,7 @@ class MissingCourseException(RequestBodyException):
     pass
 
 class FiltersFormatException(RequestBodyException):
+    pass
+
+class PreferenceFormatException(RequestBodyException):
     pass
\ No newline at end of file
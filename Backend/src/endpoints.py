@@ -1,7 +1,9 @@
+import asyncio
 import json
+import dataclasses
 import botocore.exceptions
 from typing import Any, Dict, List
-from .database.database_type import course_database
+from .database.database_type import course_database, async_course_database
 from .database.database_error import CouresDatabaseException
 from .model.course import Course
 from .model.date import ClassTime
@@ -9,14 +11,18 @@ from .model.day_of_week import DayOfWeek
 from .model.term_duration import TermDuration
 from .model.week_schedule import WeekSchedule
 from .model.filter import Filter
-from .scheduler import generate_schedules, MAX_SCHEDULES
+from .model.schedule_preference import SchedulePreference
+from .model.search_budget import SearchBudget
+from .scheduler import COUNT_TIME_BUDGET, generate_schedules, count_schedules, get_conflict_graph
 from .logger import logger
-from .endpoint_exceptions import RequestBodyException, MissingCourseException, MissingCoursesKeyException, FiltersFormatException
+from .endpoint_exceptions import RequestBodyException, MissingCourseException, MissingCoursesKeyException, FiltersFormatException, PreferenceFormatException
 
 SUCCESS_CODE = 200
 BAD_REQUEST_CODE = 400
 SERVICE_UNAVAILABLE_CODE = 503
 QUERY_STRING_PARAMETERS = "queryStringParameters"
+MAX_SEARCH_NODES = 200000 # Maximum number of options the schedule search may try per request
+SEARCH_RESERVED_MILLIS = 2000 # Time left for building the response when the search has to stop before the Lambda times out
 
 def generate_schedules_lambda_handler(event: dict, context: object) -> dict:
     try:
@@ -29,14 +35,28 @@ def generate_schedules_lambda_handler(event: dict, context: object) -> dict:
         
         try:
             inputted_courses = get_inputted_courses(body, term)
-            filter_inputted_courses(body, inputted_courses)
+            inputted_courses = filter_inputted_courses(body, inputted_courses)
+            preference = get_schedule_preference(body)
         except RequestBodyException as error:
             return lambda_response(BAD_REQUEST_CODE, True, str(error))
             
         #Generate Schedules
-        schedules, reached_schedule_limit = generate_schedules(inputted_courses)
-        schedules = schedules[:MAX_SCHEDULES]
-        return lambda_response(SUCCESS_CODE, False, "", {"Schedules": [[section.to_dict() for section in schedule] for schedule in schedules], "ReachedScheduleLimit": reached_schedule_limit})
+        # Building the conflict graph, the search and the count all share the deadline of the request
+        budget = SearchBudget.from_lambda_context(context, SEARCH_RESERVED_MILLIS, MAX_SEARCH_NODES)
+        conflict_graph = get_conflict_graph(inputted_courses, budget=budget)
+        schedules, reached_schedule_limit = generate_schedules(inputted_courses, preference=preference, budget=budget, conflict_graph=conflict_graph)
+        # Counting gets the time the search left (the default time budget only applies without a deadline, e.g. in tests)
+        count_time_budget = budget.get_remaining_seconds()
+        if count_time_budget is None:
+            count_time_budget = COUNT_TIME_BUDGET
+        schedule_count, is_schedule_count_exact = count_schedules(inputted_courses, time_budget=count_time_budget, conflict_graph=conflict_graph)
+        return lambda_response(SUCCESS_CODE, False, "", {
+            "Schedules": [[section.to_dict() for section in schedule] for schedule in schedules], 
+            "ReachedScheduleLimit": reached_schedule_limit, 
+            "SearchTruncated": budget.is_exhausted or conflict_graph.is_truncated, 
+            "ScheduleCount": schedule_count, 
+            "IsScheduleCountExact": is_schedule_count_exact
+        })
 
     except (botocore.exceptions.ClientError, CouresDatabaseException) as error:
         logger.error(error)
@@ -94,49 +114,72 @@ def get_inputted_courses(request_body: dict, term: str) -> List[Course]:
         logger.error(error_message)
         raise MissingCoursesKeyException(error_message)
 
+    # All of the courses are read at once (in batches that are read at the same time for databases that support them)
+    course_codes = [course.get("Name", "").strip() for course in courses]
+    database_courses = asyncio.run(async_course_database.get_cached_courses(course_codes, term))
+
     inputted_courses = []
-    for course in courses:
-        course_code = course.get("Name", "").strip()
-        inputted_course = course_database.get_course(course_code, term)
+    for course, course_code in zip(courses, course_codes):
+        inputted_course = database_courses.get(course_code)
         if inputted_course is None:
             error_message = f"Course {course_code} does not exist for term {term}!"
             logger.error(error_message)
             raise MissingCourseException(error_message)
         
-        inputted_course.section_id_filter = course.get("SectionFilter")
-        inputted_courses.append(inputted_course)
+        # The course is shared with later requests, so it is copied instead of modified
+        inputted_courses.append(dataclasses.replace(inputted_course, section_id_filter=course.get("SectionFilter")))
 
     return inputted_courses
 
-def filter_inputted_courses(request_body: dict, inputted_courses: List[Course]) -> None:
+def filter_inputted_courses(request_body: dict, inputted_courses: List[Course]) -> List[Course]:
     '''
     Helper function to filter all of the inputted courses by using the filters included in the request body.
+    Returns filtered copies of the courses (the inputted courses are not modified).
     '''
     filters_object: dict = request_body.get("Filters")
     if filters_object:
         before_time_input = filters_object.get("BeforeTime")
         after_time_input = filters_object.get("AfterTime")
         day_input = filters_object.get("DayOfWeek")
+        days_input = filters_object.get("DaysOfWeek")
         between_times_input = filters_object.get("BetweenTimes")
         try:
             day_of_week = None
+            days_of_week = []
             between_times = []
             if before_time_input is not None:
-                ClassTime.convert_time_to_float(before_time_input)
+                ClassTime.convert_time_to_minutes(before_time_input)
             if after_time_input is not None:
-                ClassTime.convert_time_to_float(after_time_input)
+                ClassTime.convert_time_to_minutes(after_time_input)
             if day_input is not None:
                 day_of_week = DayOfWeek(day_input)
+            if days_input is not None:
+                days_of_week = [DayOfWeek(day) for day in days_input]
             if between_times_input is not None:
                 between_times = [convert_to_classtime(between_time) for between_time in between_times_input]
-            class_filter = Filter(before_time=before_time_input, after_time=after_time_input, day_of_week=day_of_week, between_times=between_times)
-            Course.filter_all_courses(inputted_courses, class_filter)
+            class_filter = Filter(before_time=before_time_input, after_time=after_time_input, day_of_week=day_of_week, days_of_week=days_of_week, between_times=between_times)
+            return Course.get_filtered_courses(inputted_courses, class_filter)
         except:
             error_message = f"One or more of the filters are formatted incorrectly!"
             logger.error(error_message)
             raise FiltersFormatException(error_message)
     else:
-        Course.filter_all_courses(inputted_courses, Filter())
+        return Course.get_filtered_courses(inputted_courses, Filter())
+
+def get_schedule_preference(request_body: dict) -> SchedulePreference | None:
+    '''
+    Helper function to get the preference used to rank the schedules from a user's request (None if there is no preference).
+    '''
+    preference_input = request_body.get("Preference")
+    if preference_input is None:
+        return None
+    
+    try:
+        return SchedulePreference(preference_input)
+    except ValueError:
+        error_message = f"The Preference must be one of: {', '.join(preference.value for preference in SchedulePreference)}!"
+        logger.error(error_message)
+        raise PreferenceFormatException(error_message)
 
 def convert_to_classtime(between_time: dict) -> ClassTime:
     '''
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Tuple
+import itertools
+from .section import Section
+from .course_option import CourseOption
+
+if TYPE_CHECKING:
+    from .course import Course
+
+@dataclass(frozen=True)
+class CompiledCourse:
+    '''
+    A view of a (filtered) course that resolves each lecture section to the combinations of related 
+    sections it can be taken with, so the scheduler does not have to rebuild them while searching.
+    '''
+    course: Course
+    related_sections: List[Tuple[Section, List[Tuple[Section, ...]]]] # (lecture section, valid related section combinations)
+    options: List[CourseOption]
+
+    @staticmethod
+    def compile(course: Course) -> CompiledCourse:
+        # The first lab section with a given ID is used (same as Course.get_lab_section)
+        lab_options: Dict[str, CourseOption] = {}
+        for lab_section in course.lab_sections:
+            lab_options.setdefault(lab_section.section_id, CourseOption.from_sections([lab_section]))
+
+        related_sections = []
+        options = []
+        for lecture_section in course.lecture_sections:
+            # lecture section has related sections (e.g. labs) that must be taken 
+            if lecture_section.related_section_ids:
+                combinations = CompiledCourse._get_valid_combinations(lecture_section, lab_options)
+                related_sections.append((lecture_section, combinations))
+                options.extend(CourseOption.from_sections([lecture_section, *combination]) for combination in combinations)
+
+            # There are no related sections
+            else:
+                related_sections.append((lecture_section, [()]))
+                options.append(CourseOption.from_sections([lecture_section]))
+
+        return CompiledCourse(course, related_sections, options)
+
+    @staticmethod
+    def _get_valid_combinations(lecture_section: Section, lab_options: Dict[str, CourseOption]) -> List[Tuple[Section, ...]]:
+        '''
+        Gets the combinations of related sections where all of the sections exist (i.e. none were filtered out)
+        and none of the sections (including the lecture section) overlap with each other.
+        '''
+        lecture_option = CourseOption.from_sections([lecture_section])
+        combinations = []
+        for id_combination in itertools.product(*lecture_section.related_section_ids):
+            section_options = [lab_options.get(section_id) for section_id in id_combination]
+            if None in section_options:
+                continue
+
+            section_options.insert(0, lecture_option)
+            if all(
+                section_options[i].is_compatible(section_options[j]) 
+                for i in range(len(section_options)) 
+                for j in range(i + 1, len(section_options))
+            ):
+                combinations.append(tuple(option.sections[0] for option in section_options[1:]))
+
+        return combinations
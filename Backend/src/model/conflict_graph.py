@@ -0,0 +1,97 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterator, List
+from .section import Section
+from .course_option import CourseOption
+from .search_budget import SearchBudget
+
+MAX_OPTIONS = 2000 # Maximum number of options in a graph (every pair of options of different courses is compared)
+
+@dataclass(frozen=True)
+class ConflictGraph:
+    '''
+    The options of every requested course numbered by ordinal, along with the options each one conflicts
+    with. Sets of options are bitsets of ordinals, so a search only has to intersect integers. The graph is
+    built once per request (after filtering) and can be shared by every kind of search on the same courses.
+    '''
+    options: List[CourseOption] # options of every course, by ordinal
+    domains: List[int] # bitset of each course's options, in the order the courses are placed
+    positions: List[int] # position of each course's options in a schedule, in the order the courses are placed
+    conflicts: List[int] # bitset of the options each option conflicts with, by ordinal
+    current_schedule: List[Section]
+    is_truncated: bool = False # True if options were left out, so the graph only has some of the schedules
+
+    @staticmethod
+    def build(domains: List[List[CourseOption]], positions: List[int], current_schedule: List[Section], 
+              budget: SearchBudget | None = None, max_options: int = MAX_OPTIONS) -> ConflictGraph:
+        '''
+        Builds the graph from the options of each course (in the order the courses are placed). The options
+        of a course get consecutive ordinals, so iterating over a bitset visits them in their original order.
+        If there are more than max_options options, only the first options of each course are kept (in
+        proportion to its number of options). The budget (if any) is checked for every option compared; if
+        it runs out, every domain of the returned graph is empty. Both cases mark the graph as truncated.
+        '''
+        option_count = sum(len(domain) for domain in domains)
+        is_truncated = option_count > max_options
+        if is_truncated:
+            domains = [domain[:max(1, len(domain) * max_options // option_count)] for domain in domains]
+
+        options = [option for domain in domains for option in domain]
+        domain_bitsets = []
+        ordinal = 0
+        for domain in domains:
+            domain_bitsets.append(((1 << len(domain)) - 1) << ordinal)
+            ordinal += len(domain)
+
+        # Options of the same course are never taken together, so each option is only compared with the
+        # options of the courses after its own
+        conflicts = [0] * len(options)
+        first_ordinal = 0
+        for domain in domains:
+            other_ordinal = first_ordinal + len(domain)
+            for ordinal, option in enumerate(domain, first_ordinal):
+                if budget is not None and not budget.check():
+                    return ConflictGraph(options, [0] * len(domains), positions, [0] * len(options), current_schedule, True)
+
+                for other, other_option in enumerate(options[other_ordinal:], other_ordinal):
+                    if not option.is_compatible(other_option):
+                        conflicts[ordinal] |= 1 << other
+                        conflicts[other] |= 1 << ordinal
+            first_ordinal = other_ordinal
+
+        return ConflictGraph(options, domain_bitsets, positions, conflicts, current_schedule, is_truncated)
+
+    @staticmethod
+    def iter_ordinals(bitset: int) -> Iterator[int]:
+        '''
+        Yields the ordinals in a bitset, from smallest to largest.
+        '''
+        while bitset:
+            lowest_bit = bitset & -bitset
+            yield lowest_bit.bit_length() - 1
+            bitset ^= lowest_bit
+
+    def prune(self, domains: List[int], ordinal: int) -> List[int] | None:
+        '''
+        Removes the options that conflict with the given option from each domain.
+        Returns None if any of the domains would become empty.
+        '''
+        compatible = ~self.conflicts[ordinal]
+        pruned_domains = []
+        for domain in domains:
+            pruned_domain = domain & compatible
+            if not pruned_domain:
+                return None
+            pruned_domains.append(pruned_domain)
+
+        return pruned_domains
+
+    def get_schedule(self, ordinals: List[int]) -> List[Section]:
+        '''
+        Returns the schedule made of the current schedule and the chosen option of each course (given by
+        ordinal, in the order the courses are placed), with the options in their positions.
+        '''
+        ordered_options = [None] * len(ordinals)
+        for position, ordinal in zip(self.positions, ordinals):
+            ordered_options[position] = self.options[ordinal]
+        return self.current_schedule + [section for option in ordered_options for section in option.sections]
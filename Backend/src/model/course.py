@@ -1,7 +1,8 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Callable, List
+from dataclasses import dataclass, replace
+from typing import Callable, List, Tuple
 from .section import Section
+from .compiled_course import CompiledCourse
 from .date import ClassTime
 from .day_of_week import DayOfWeek
 from .filter import Filter
@@ -26,37 +27,55 @@ class Course:
             course.filter(filter)
 
     @staticmethod
-    def time_filter(sections: List[Section], compare_function: Callable[[ClassTime], bool]) -> None:
-        i = 0
-        while i < len(sections):
-            removed_section = False
-            for date in sections[i].times:
-                if compare_function(date):
-                    del sections[i]
-                    removed_section = True
-                    break
-                
-            if not removed_section:
-                i += 1
+    def get_filtered_courses(courses: List[Course], filter: Filter) -> List[Course]:
+        '''
+        Same as filter_all_courses, but returns filtered copies of the courses instead of modifying them.
+        '''
+        if filter is None:
+            raise ValueError("Parameter 'filter' cannot be None!")
+
+        return [course.get_filtered_course(filter) for course in courses]
+
+    @staticmethod
+    def time_filter(sections: List[Section], compare_function: Callable[[ClassTime], bool]) -> List[Section]:
+        return [section for section in sections if not any(compare_function(date) for date in section.times)]
 
     def filter(self, filter: Filter) -> None:
+        lecture_indexes, lab_indexes = self.get_filtered_section_indexes(filter)
+        # The lists are replaced rather than changed in place, since copies of the course (e.g. the ones made
+        # of the cached courses with dataclasses.replace) share them
+        self.lecture_sections = [self.lecture_sections[index] for index in lecture_indexes]
+        self.lab_sections = [self.lab_sections[index] for index in lab_indexes]
+
+    def get_filtered_section_indexes(self, filter: Filter) -> Tuple[List[int], List[int]]:
+        '''
+        Returns the indexes of the lecture sections and the lab sections that are not filtered out by the filter
+        (or, for lecture sections, the section ID filter), without modifying the course. Every filter is checked 
+        in a single pass over the sections (see Filter.rejects).
+        '''
         if not isinstance(filter, Filter):
             raise TypeError("Parameter 'filter' must be of type Filter")
+        if self.section_id_filter and not isinstance(self.section_id_filter, str):
+            raise TypeError("Attribute 'section_id_filter' must be of type str")
 
-        if filter.before_time:
-            self.filter_before_time(filter.before_time)
-        
-        if filter.after_time:
-            self.filter_after_time(filter.after_time)
-
-        if filter.day_of_week:
-            self.filter_day_off(filter.day_of_week)
+        lecture_indexes = [
+            index for index, section in enumerate(self.lecture_sections) 
+            if (not self.section_id_filter or section.section_id == self.section_id_filter) and not filter.rejects(section)
+        ]
+        lab_indexes = [index for index, section in enumerate(self.lab_sections) if not filter.rejects(section)]
+        return lecture_indexes, lab_indexes
 
-        if filter.between_times:
-            self.filter_between_times(filter.between_times)
-        
-        if self.section_id_filter:
-            self.filter_by_section()
+    def get_filtered_course(self, filter: Filter) -> Course:
+        '''
+        Returns a copy of the course with the filter applied, leaving this course unchanged.
+        The copy shares the Section objects (which are never modified by filtering).
+        '''
+        lecture_indexes, lab_indexes = self.get_filtered_section_indexes(filter)
+        return replace(
+            self, 
+            lecture_sections=[self.lecture_sections[index] for index in lecture_indexes], 
+            lab_sections=[self.lab_sections[index] for index in lab_indexes]
+        )
 
     def filter_before_time(self, time: str) -> None:
         '''
@@ -65,11 +84,12 @@ class Course:
         if not isinstance(time, str):
             raise TypeError("Parameter 'time' must be of type str")
         
+        filter_minutes = ClassTime.convert_time_to_minutes(time)
         def compare_function(date: ClassTime):
-            return date.get_start_time_as_float() < ClassTime.convert_time_to_float(time)
+            return date.start_minutes < filter_minutes
 
-        Course.time_filter(self.lecture_sections, compare_function)
-        Course.time_filter(self.lab_sections, compare_function)       
+        self.lecture_sections = Course.time_filter(self.lecture_sections, compare_function)
+        self.lab_sections = Course.time_filter(self.lab_sections, compare_function)       
 
 
 
@@ -80,11 +100,12 @@ class Course:
         if not isinstance(time, str):
             raise TypeError("Parameter 'time' must be of type str")
         
+        filter_minutes = ClassTime.convert_time_to_minutes(time)
         def compare_function(date: ClassTime):
-            return date.get_end_time_as_float() > ClassTime.convert_time_to_float(time)
+            return date.end_minutes > filter_minutes
 
-        Course.time_filter(self.lecture_sections, compare_function)
-        Course.time_filter(self.lab_sections, compare_function) 
+        self.lecture_sections = Course.time_filter(self.lecture_sections, compare_function)
+        self.lab_sections = Course.time_filter(self.lab_sections, compare_function) 
                 
 
     def filter_day_off(self, day_of_week: DayOfWeek) -> None:
@@ -97,8 +118,8 @@ class Course:
         def compare_function(date: ClassTime):
             return date.get_day_of_the_week() == day_of_week
 
-        Course.time_filter(self.lecture_sections, compare_function)
-        Course.time_filter(self.lab_sections, compare_function)
+        self.lecture_sections = Course.time_filter(self.lecture_sections, compare_function)
+        self.lab_sections = Course.time_filter(self.lab_sections, compare_function)
 
     def filter_between_times(self, between_times: List[ClassTime]) -> None:
         '''
@@ -111,20 +132,20 @@ class Course:
             def compare_function(date: ClassTime):
                 return date.does_date_overlap(between_time)
 
-            Course.time_filter(self.lecture_sections, compare_function)
-            Course.time_filter(self.lab_sections, compare_function) 
+            self.lecture_sections = Course.time_filter(self.lecture_sections, compare_function)
+            self.lab_sections = Course.time_filter(self.lab_sections, compare_function) 
 
     def filter_by_section(self):
         if not isinstance(self.section_id_filter, str):
             raise TypeError("Attribute 'section_id_filter' must be of type str")
 
-        sections = self.lecture_sections
-        i = 0
-        while i < len(sections):
-            if sections[i].section_id != self.section_id_filter:
-                del sections[i]
-            else:
-                i += 1
+        self.lecture_sections = [section for section in self.lecture_sections if section.section_id == self.section_id_filter]
+
+    def compile(self) -> CompiledCourse:
+        '''
+        Returns a compiled view of the course's current (filtered) sections for the scheduler.
+        '''
+        return CompiledCourse.compile(self)
 
     def get_lecture_section(self, id: str) -> Section:
         '''
@@ -0,0 +1,56 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Tuple
+from .section import Section
+from .day_of_week import DayOfWeek
+
+_DAY_BITS = {day: 1 << index for index, day in enumerate(DayOfWeek)}
+
+@dataclass(frozen=True)
+class CourseOption:
+    '''
+    One way of taking a course: a lecture section followed by one combination of its related sections.
+    '''
+    sections: Tuple[Section, ...]
+    mask: int
+    is_mask_exact: bool
+
+    @staticmethod
+    def from_sections(sections: Iterable[Section]) -> CourseOption:
+        sections = tuple(sections)
+        mask = 0
+        for section in sections:
+            mask |= section.get_occupancy_mask()
+        return CourseOption(sections, mask, all(section.is_occupancy_mask_exact() for section in sections))
+
+    @cached_property
+    def day_mask(self) -> int:
+        '''
+        Bitmask of the days of the week the option has meetings on (bit i is the i-th DayOfWeek).
+        '''
+        day_mask = 0
+        for section in self.sections:
+            for time in section.times:
+                day_mask |= _DAY_BITS[time.day]
+        return day_mask
+
+    def get_meeting_minutes(self) -> int:
+        return sum(time.get_duration_in_minutes() for section in self.sections for time in section.times)
+
+    def is_compatible(self, other: CourseOption) -> bool:
+        '''
+        Returns True if none of the sections in this option overlap with the sections in the other option.
+        '''
+        if not self.mask & other.mask:
+            return True
+        if self.is_mask_exact and other.is_mask_exact:
+            return False
+
+        return not any(
+            time1.does_date_overlap(time2)
+            for section1 in self.sections
+            for time1 in section1.times
+            for section2 in other.sections
+            for time2 in section2.times
+        )
@@ -3,7 +3,17 @@ from .day_of_week import DayOfWeek
 from .term_duration import TermDuration
 from .week_schedule import WeekSchedule
 
+# Occupancy masks pack a week into one integer: every (day, term half, week parity) block
+# holds one bit per SLOT_MINUTES slot of the day, so two meeting times can only overlap
+# if their masks share a bit.
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+_DAY_INDEXES = {day: index for index, day in enumerate(DayOfWeek)}
+_TERM_HALVES = {TermDuration.EARLY_TERM: (0,), TermDuration.LATE_TERM: (1,), TermDuration.FULL_TERM: (0, 1)}
+_WEEK_PARITIES = {WeekSchedule.EVEN_WEEK: (0,), WeekSchedule.ODD_WEEK: (1,), WeekSchedule.EVERY_WEEK: (0, 1)}
+
 class ClassTime:
+    __slots__ = ("day", "term_duration", "week_schedule", "_start_time", "_end_time", "_start_minutes", "_end_minutes")
 
     def __init__(self, day: DayOfWeek, term_duration: TermDuration, start_time: str, 
                  end_time: str, week_schedule: WeekSchedule = WeekSchedule.EVERY_WEEK):
@@ -18,10 +28,36 @@ class ClassTime:
 
         self.day = day
         self.term_duration = term_duration
-        self.start_time = start_time
-        self.end_time = end_time
         self.week_schedule = week_schedule # class is scheduled every week by default
 
+        # The times are parsed once and cannot be changed afterwards
+        self._start_time = start_time
+        self._end_time = end_time
+        self._start_minutes = ClassTime._parse_minutes(start_time)
+        self._end_minutes = ClassTime._parse_minutes(end_time)
+
+    @property
+    def start_time(self) -> str:
+        return self._start_time
+
+    @property
+    def end_time(self) -> str:
+        return self._end_time
+
+    @property
+    def start_minutes(self) -> int:
+        '''
+        The start time as the number of minutes since midnight.
+        '''
+        return self._start_minutes
+
+    @property
+    def end_minutes(self) -> int:
+        '''
+        The end time as the number of minutes since midnight.
+        '''
+        return self._end_minutes
+
     @staticmethod
     def _is_valid_time(time: str) -> bool:
         if len(time) != 5:
@@ -41,8 +77,13 @@ class ClassTime:
         return (
             ClassTime._is_valid_time(start_time) and
             ClassTime._is_valid_time(end_time) and
-            ClassTime.convert_time_to_float(start_time) < ClassTime.convert_time_to_float(end_time)
+            ClassTime._parse_minutes(start_time) < ClassTime._parse_minutes(end_time)
         )
+
+    @staticmethod
+    def _parse_minutes(time: str) -> int:
+        # Assumes the time has already been validated
+        return int(time[0:2]) * 60 + int(time[3:5])
     
     @staticmethod
     def convert_time_to_float(time: str) -> float:
@@ -50,6 +91,12 @@ class ClassTime:
             raise ValueError("Invalid time cannot be converted to float representation.")
         return float(time[0:2]) + float(time[3:5]) / 100
 
+    @staticmethod
+    def convert_time_to_minutes(time: str) -> int:
+        if not ClassTime._is_valid_time(time):
+            raise ValueError("Invalid time cannot be converted to minutes.")
+        return ClassTime._parse_minutes(time)
+
     def does_date_overlap(self, other_date: ClassTime) -> bool:
         if ((self.day != other_date.day) or 
             (self.term_duration == TermDuration.EARLY_TERM and 
@@ -62,21 +109,41 @@ class ClassTime:
              other_date.week_schedule == WeekSchedule.EVEN_WEEK)):
             return False
 
-        start_time_1, end_time_1 = ClassTime.convert_time_to_float(self.start_time), ClassTime.convert_time_to_float(self.end_time)
-        start_time_2, end_time_2 = ClassTime.convert_time_to_float(other_date.start_time), ClassTime.convert_time_to_float(other_date.end_time)
-        return (
-            start_time_2 <= start_time_1 < end_time_2 or 
-            start_time_2 < end_time_1 <= end_time_2 or
-            start_time_1 <= start_time_2 < end_time_1 or 
-            start_time_1 < end_time_2 <= end_time_1
-        )
+        return self._start_minutes < other_date._end_minutes and other_date._start_minutes < self._end_minutes
     
     def get_start_time_as_float(self) -> float:
-        return ClassTime.convert_time_to_float(self.start_time)
+        return self._start_minutes // 60 + (self._start_minutes % 60) / 100
     
     def get_end_time_as_float(self) -> float:
-        return ClassTime.convert_time_to_float(self.end_time)
-    
+        return self._end_minutes // 60 + (self._end_minutes % 60) / 100
+
+    def get_duration_in_minutes(self) -> int:
+        return self._end_minutes - self._start_minutes
+
+    def get_occupancy_mask(self) -> int:
+        '''
+        Returns the bitmask of the time slots this meeting time occupies. Times that are not
+        on a slot boundary are rounded outwards, so the mask may over-approximate the meeting.
+        '''
+        first_slot = self._start_minutes // SLOT_MINUTES
+        last_slot = -(-self._end_minutes // SLOT_MINUTES)
+        day_mask = ((1 << (last_slot - first_slot)) - 1) << first_slot
+
+        mask = 0
+        day_index = _DAY_INDEXES[self.day]
+        for term_half in _TERM_HALVES[self.term_duration]:
+            for week_parity in _WEEK_PARITIES[self.week_schedule]:
+                block = (day_index * 2 + term_half) * 2 + week_parity
+                mask |= day_mask << (block * SLOTS_PER_DAY)
+        return mask
+
+    def is_occupancy_mask_exact(self) -> bool:
+        '''
+        Returns True if the occupancy mask describes the meeting time exactly (i.e. the start
+        and end times both fall on a slot boundary).
+        '''
+        return self._start_minutes % SLOT_MINUTES == 0 and self._end_minutes % SLOT_MINUTES == 0
+
     def get_day_of_the_week(self) -> DayOfWeek:
         return self.day
     
@@ -1,13 +1,15 @@
 from __future__ import annotations
-from typing import List
+from typing import FrozenSet, List
 from .day_of_week import DayOfWeek
 from .date import ClassTime
+from .section import Section
 
 
 class Filter:
     before_time: str = None
     after_time: str = None
     day_of_week: DayOfWeek = None
+    days_of_week: List[DayOfWeek] = []
     between_times: List[ClassTime] = []
 
     def __init__(self, **kwargs):
@@ -17,6 +19,10 @@ class Filter:
             raise TypeError("after_time must be of type str")
         if kwargs.get('day_of_week') and not isinstance(kwargs.get('day_of_week'), DayOfWeek):
             raise TypeError("day_of_week must be of type DayOfWeek")
+        if kwargs.get('days_of_week') and not isinstance(kwargs.get('days_of_week'), list):
+            raise TypeError("days_of_week must be of type list")
+        if kwargs.get('days_of_week') and any(not isinstance(day, DayOfWeek) for day in kwargs.get('days_of_week')):
+            raise TypeError("days_of_week cannot contain objects of type other than DayOfWeek")
         if kwargs.get('between_times') and not isinstance(kwargs.get('between_times'), list):
             raise TypeError("between_times must be of type list")
         if kwargs.get('between_times') and any(not isinstance(between_time, ClassTime) for between_time in kwargs.get('between_times')):
@@ -25,5 +31,27 @@ class Filter:
         self.before_time = kwargs.get('before_time', None)
         self.after_time = kwargs.get('after_time', None)
         self.day_of_week = kwargs.get('day_of_week', None)
+        self.days_of_week = kwargs.get('days_of_week', [])
         self.between_times = kwargs.get('between_times', [])
 
+        # The inputs are parsed once here, so checking a section does not parse them again
+        self.before_minutes: int | None = ClassTime.convert_time_to_minutes(self.before_time) if self.before_time else None
+        self.after_minutes: int | None = ClassTime.convert_time_to_minutes(self.after_time) if self.after_time else None
+        self.days_off: FrozenSet[DayOfWeek] = frozenset((self.days_of_week or []) + ([self.day_of_week] if self.day_of_week else []))
+
+    def rejects_time(self, time: ClassTime) -> bool:
+        '''
+        Returns True if the meeting time is filtered out by any of the filters.
+        '''
+        return (
+            (self.before_minutes is not None and time.start_minutes < self.before_minutes) or
+            (self.after_minutes is not None and time.end_minutes > self.after_minutes) or
+            time.day in self.days_off or
+            any(time.does_date_overlap(between_time) for between_time in self.between_times)
+        )
+
+    def rejects(self, section: Section) -> bool:
+        '''
+        Returns True if any of the section's meeting times are filtered out.
+        '''
+        return any(self.rejects_time(time) for time in section.times)
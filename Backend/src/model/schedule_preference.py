@@ -0,0 +1,12 @@
+from enum import Enum
+
+class SchedulePreference(Enum):
+    '''
+    Specifies how generated schedules are ranked (best schedules first).
+    '''
+    
+    MINIMIZE_GAPS = "MinimizeGaps" # least time between classes on the same day
+    MINIMIZE_DAYS = "MinimizeDays" # fewest days on campus
+    EARLIEST_END = "EarliestEnd" # last class of the week ends as early as possible
+    LATEST_START = "LatestStart" # first class of the week starts as late as possible
+    IN_PERSON = "InPerson" # fewest sections that are not in person
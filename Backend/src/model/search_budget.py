@@ -0,0 +1,60 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+import time
+
+CHECK_INTERVAL = 256 # Number of nodes expanded between checks of the clock
+
+@dataclass
+class SearchBudget:
+    '''
+    Limits how much work a schedule search may do: the number of nodes (options tried) it may expand and/or
+    a deadline in time.monotonic() seconds. Once the budget is exhausted it stays exhausted, so the search
+    stops and returns the schedules it has found so far.
+    '''
+    max_nodes: int | None = None
+    deadline: float | None = None
+    nodes: int = field(default=0, init=False)
+    is_exhausted: bool = field(default=False, init=False)
+
+    @staticmethod
+    def from_lambda_context(context: object, reserved_millis: int, max_nodes: int | None = None) -> SearchBudget:
+        '''
+        Creates a budget that ends reserved_millis before the Lambda invocation times out (only the node
+        limit applies if the context does not have the remaining time, e.g. in tests).
+        '''
+        deadline = None
+        if hasattr(context, "get_remaining_time_in_millis"):
+            deadline = time.monotonic() + (context.get_remaining_time_in_millis() - reserved_millis) / 1000
+        return SearchBudget(max_nodes, deadline)
+
+    def expand(self) -> bool:
+        '''
+        Counts a node that the search is about to expand. Returns False if the budget is exhausted,
+        in which case the node should not be expanded.
+        '''
+        if self.is_exhausted:
+            return False
+
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            self.is_exhausted = True
+        elif self.deadline is not None and self.nodes % CHECK_INTERVAL == 0 and time.monotonic() >= self.deadline:
+            self.is_exhausted = True
+        return not self.is_exhausted
+
+    def check(self) -> bool:
+        '''
+        Checks the deadline right away without counting a node, for work that is not made of search nodes
+        (e.g. building the conflict graph). Returns False if the budget is exhausted.
+        '''
+        if not self.is_exhausted and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.is_exhausted = True
+        return not self.is_exhausted
+
+    def get_remaining_seconds(self) -> float | None:
+        '''
+        Returns the number of seconds left before the deadline (None if there is no deadline).
+        '''
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0)
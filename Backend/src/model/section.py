@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 from .date import ClassTime
 
@@ -18,6 +18,29 @@ class Section:
     start_date: str
     end_date: str
     section_type: str = ""
+    _occupancy_mask: int = field(default=None, init=False, repr=False, compare=False)
+    _is_occupancy_mask_exact: bool = field(default=None, init=False, repr=False, compare=False)
+
+    def get_occupancy_mask(self) -> int:
+        '''
+        Returns the combined occupancy bitmask of all of the section's meeting times.
+        The mask is computed once, so the section's times should not be modified afterwards.
+        '''
+        if self._occupancy_mask is None:
+            mask = 0
+            for time in self.times:
+                mask |= time.get_occupancy_mask()
+            self._occupancy_mask = mask
+            self._is_occupancy_mask_exact = all(time.is_occupancy_mask_exact() for time in self.times)
+        return self._occupancy_mask
+
+    def is_occupancy_mask_exact(self) -> bool:
+        '''
+        Returns True if the occupancy mask describes all of the section's meeting times exactly.
+        '''
+        if self._is_occupancy_mask_exact is None:
+            self.get_occupancy_mask()
+        return self._is_occupancy_mask_exact
 
     def to_dict(self) -> dict:
         return {"CourseCode":self.course_code, "SectionID":self.section_id, "CRN":self.crn, 
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+from .course import Course
+from .day_of_week import DayOfWeek
+from .filter import Filter
+from .term_duration import TermDuration
+from .week_schedule import WeekSchedule
+
+try:
+    import numpy as np
+except ImportError: # numpy is only needed for bulk analytics, not by the Lambda functions
+    np = None
+
+_DAY_INDEXES = {day: index for index, day in enumerate(DayOfWeek)}
+# Meeting times can only overlap if they share a term half and a week parity (see ClassTime.does_date_overlap)
+_TERM_HALVES = {TermDuration.EARLY_TERM: 0b01, TermDuration.LATE_TERM: 0b10, TermDuration.FULL_TERM: 0b11}
+_WEEK_PARITIES = {WeekSchedule.EVEN_WEEK: 0b01, WeekSchedule.ODD_WEEK: 0b10, WeekSchedule.EVERY_WEEK: 0b11}
+
+class TermCatalogue:
+    '''
+    Columnar (NumPy) view of the sections of many courses, used to apply the same Filter to every course of
+    a term at once. Sections are numbered by ordinal (each course's lecture sections, then its lab sections)
+    and every meeting time is one row of the time columns.
+    '''
+    def __init__(self, courses: List[Course]):
+        if np is None:
+            raise ImportError("TermCatalogue requires numpy to be installed!")
+
+        self.course_codes = [course.code for course in courses]
+        lecture_offsets, lab_offsets = [], []
+        section_id_filtered = []
+        time_sections, days, start_minutes, end_minutes, term_halves, week_parities = [], [], [], [], [], []
+        ordinal = 0
+        for course in courses:
+            lecture_offsets.append(ordinal)
+            for section in course.lecture_sections:
+                section_id_filtered.append(bool(course.section_id_filter) and section.section_id != course.section_id_filter)
+            lab_offsets.append(ordinal + len(course.lecture_sections))
+            section_id_filtered.extend(False for _ in course.lab_sections)
+
+            for section in course.lecture_sections + course.lab_sections:
+                for time in section.times:
+                    time_sections.append(ordinal)
+                    days.append(_DAY_INDEXES[time.day])
+                    start_minutes.append(time.start_minutes)
+                    end_minutes.append(time.end_minutes)
+                    term_halves.append(_TERM_HALVES[time.term_duration])
+                    week_parities.append(_WEEK_PARITIES[time.week_schedule])
+                ordinal += 1
+
+        self.section_count = ordinal
+        self.lecture_offsets = np.array(lecture_offsets + [ordinal], dtype=np.int64)
+        self.lab_offsets = np.array(lab_offsets, dtype=np.int64)
+        self.section_id_filtered = np.array(section_id_filtered, dtype=bool)
+        self.time_sections = np.array(time_sections, dtype=np.int64)
+        self.days = np.array(days, dtype=np.int8)
+        self.start_minutes = np.array(start_minutes, dtype=np.int16)
+        self.end_minutes = np.array(end_minutes, dtype=np.int16)
+        self.term_halves = np.array(term_halves, dtype=np.int8)
+        self.week_parities = np.array(week_parities, dtype=np.int8)
+
+    def get_filtered_times(self, filter: Filter) -> np.ndarray:
+        '''
+        Returns a boolean array that is True for the meeting times that are filtered out (see Filter.rejects_time).
+        '''
+        filtered = np.zeros(len(self.time_sections), dtype=bool)
+        if filter.before_minutes is not None:
+            filtered |= self.start_minutes < filter.before_minutes
+        if filter.after_minutes is not None:
+            filtered |= self.end_minutes > filter.after_minutes
+        if filter.days_off:
+            filtered |= np.isin(self.days, [_DAY_INDEXES[day] for day in filter.days_off])
+        for between_time in filter.between_times or []:
+            filtered |= (
+                (self.days == _DAY_INDEXES[between_time.day]) &
+                (self.term_halves & _TERM_HALVES[between_time.term_duration] != 0) &
+                (self.week_parities & _WEEK_PARITIES[between_time.week_schedule] != 0) &
+                (self.start_minutes < between_time.end_minutes) &
+                (self.end_minutes > between_time.start_minutes)
+            )
+        return filtered
+
+    def get_remaining_sections(self, filter: Filter) -> np.ndarray:
+        '''
+        Returns a boolean array that is True for the sections (by ordinal) that are not filtered out by the filter
+        or their course's section ID filter.
+        '''
+        if not isinstance(filter, Filter):
+            raise TypeError("Parameter 'filter' must be of type Filter")
+
+        filtered_times = self.get_filtered_times(filter)
+        filtered_sections = np.bincount(self.time_sections[filtered_times], minlength=self.section_count) > 0
+        return ~(filtered_sections | self.section_id_filtered)
+
+    def get_filtered_section_indexes(self, filter: Filter) -> Dict[str, Tuple[List[int], List[int]]]:
+        '''
+        Returns the indexes of the lecture sections and the lab sections of every course that are not filtered
+        out (the same as Course.get_filtered_section_indexes for each course), by course code.
+        '''
+        remaining_ordinals = np.flatnonzero(self.get_remaining_sections(filter))
+        lecture_starts = np.searchsorted(remaining_ordinals, self.lecture_offsets[:-1])
+        lab_starts = np.searchsorted(remaining_ordinals, self.lab_offsets)
+        lab_ends = np.searchsorted(remaining_ordinals, self.lecture_offsets[1:])
+
+        section_indexes = {}
+        for index, course_code in enumerate(self.course_codes):
+            lecture_indexes = remaining_ordinals[lecture_starts[index]:lab_starts[index]] - self.lecture_offsets[index]
+            lab_indexes = remaining_ordinals[lab_starts[index]:lab_ends[index]] - self.lab_offsets[index]
+            section_indexes[course_code] = (lecture_indexes.tolist(), lab_indexes.tolist())
+        return section_indexes
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import concurrent.futures
+import itertools
+import multiprocessing
+from typing import List, Tuple
+from .model.section import Section
+from .model.course import Course
+from .model.conflict_graph import ConflictGraph
+from .model.search_budget import SearchBudget
+from .scheduler import MAX_SCHEDULES, get_conflict_graph, search_options, iter_schedules
+from .logger import logger
+
+CHECK_INTERVAL = 1024 # Number of nodes a worker expands between checks of whether its subtree is still needed
+
+# State of a worker process, set once by _init_worker so the conflict graph is only sent to each process once
+_worker_conflict_graph: ConflictGraph = None
+_worker_limit: int = 0
+_worker_counts = None
+
+def generate_schedules_parallel(courses: List[Course], limit: int = MAX_SCHEDULES, max_workers: int | None = None,
+                                current_schedule: List[Section] = [], order_courses: bool = True) -> Tuple[List[List[Section]], bool]:
+    '''
+    Generates the same schedules as generate_schedules (in the same order), but splits the search at the options
+    of the first course that is placed and searches each subtree in a separate process. Meant for batch runs on
+    multi-core machines; falls back to a single process if a process pool cannot be created (e.g. on Lambda).
+    Also returns True if the limit was reached.
+    '''
+    conflict_graph = get_conflict_graph(courses, current_schedule, order_courses)
+    if len(conflict_graph.domains) == 0 or not all(conflict_graph.domains) or limit <= 0:
+        return _generate_schedules_sequential(conflict_graph, limit)
+
+    first_ordinals = list(ConflictGraph.iter_ordinals(conflict_graph.domains[0]))
+    try:
+        context = multiprocessing.get_context()
+        # Number of schedules found so far in each subtree (updated as they are found). Workers use it to stop
+        # searching a subtree once it and the subtrees before it have found enough schedules.
+        counts = context.Array('i', [0] * len(first_ordinals))
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker,
+                                                          initargs=(conflict_graph, limit, counts))
+    except (OSError, NotImplementedError) as error:
+        logger.warning(f"Could not create a process pool, generating schedules in a single process: {error}")
+        return _generate_schedules_sequential(conflict_graph, limit)
+
+    schedules = []
+    with executor:
+        futures = [executor.submit(_search_subtree, index, ordinal) for index, ordinal in enumerate(first_ordinals)]
+        # Merge the subtrees in order so the result does not depend on which worker finishes first
+        for future in futures:
+            if len(schedules) >= limit:
+                future.cancel()
+                continue
+
+            schedules.extend(conflict_graph.get_schedule(ordinals) for ordinals in future.result())
+
+    schedules = schedules[:limit]
+    return schedules, len(schedules) >= limit
+
+def _generate_schedules_sequential(conflict_graph: ConflictGraph, limit: int) -> Tuple[List[List[Section]], bool]:
+    schedules = list(itertools.islice(iter_schedules([], conflict_graph=conflict_graph), max(limit, 0)))
+    return schedules, len(schedules) >= limit
+
+def _init_worker(conflict_graph: ConflictGraph, limit: int, counts) -> None:
+    global _worker_conflict_graph, _worker_limit, _worker_counts
+    _worker_conflict_graph = conflict_graph
+    _worker_limit = limit
+    _worker_counts = counts
+
+def _is_subtree_needed(index: int, found: int) -> bool:
+    '''
+    Returns False if the schedules found so far in the subtrees before the given one, along with the found schedules
+    of the given subtree, already reach the limit, in which case no more schedules of the given subtree will be used.
+    '''
+    with _worker_counts.get_lock():
+        earlier_count = sum(_worker_counts[:index])
+    return earlier_count + found < _worker_limit
+
+class _SubtreeBudget(SearchBudget):
+    '''
+    Budget of the search of a subtree, which runs out once the subtree is no longer needed. It is checked every 
+    CHECK_INTERVAL nodes, so a subtree that is mostly dead ends also stops once the limit has been reached.
+    '''
+    def __init__(self, index: int, results: List[Tuple[int, ...]]):
+        super().__init__()
+        self.index = index
+        self.results = results
+
+    def expand(self) -> bool:
+        if super().expand() and self.nodes % CHECK_INTERVAL == 0 and not _is_subtree_needed(self.index, len(self.results)):
+            self.is_exhausted = True
+        return not self.is_exhausted
+
+def _search_subtree(index: int, ordinal: int) -> List[Tuple[int, ...]]:
+    '''
+    Searches the subtree where the option with the given ordinal is placed first (the index-th subtree). 
+    Returns the schedules as the ordinals of the chosen options (in the order the courses are placed).
+    '''
+    results = []
+    conflict_graph = _worker_conflict_graph
+    remaining_domains = conflict_graph.prune(conflict_graph.domains[1:], ordinal)
+    if remaining_domains is not None and _is_subtree_needed(index, 0):
+        chosen_ordinals: List[int] = [None] * len(conflict_graph.domains)
+        chosen_ordinals[0] = ordinal
+        for _ in search_options(conflict_graph, 1, remaining_domains, chosen_ordinals, _SubtreeBudget(index, results)):
+            results.append(tuple(chosen_ordinals))
+            with _worker_counts.get_lock():
+                _worker_counts[index] = len(results)
+            if not _is_subtree_needed(index, len(results)):
+                break
+
+    return results
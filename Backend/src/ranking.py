@@ -0,0 +1,207 @@
+import bisect
+from typing import Dict, Iterable, Iterator, List, Tuple
+from .model.section import Section
+from .model.course_option import CourseOption
+from .model.conflict_graph import ConflictGraph
+from .model.day_of_week import DayOfWeek
+from .model.term_duration import TermDuration
+from .model.schedule_preference import SchedulePreference
+
+IN_PERSON_SECTION_TYPE = "In person"
+MINUTES_PER_DAY = 24 * 60
+_TERM_HALVES = {TermDuration.EARLY_TERM: (0,), TermDuration.LATE_TERM: (1,), TermDuration.FULL_TERM: (0, 1)}
+_DAY_INDEXES = {day: index for index, day in enumerate(DayOfWeek)}
+DAY_HALVES = 2 * len(DayOfWeek) # Number of (day, half of the term) pairs, which are numbered by day_half = 2 * day index + term half
+
+def get_schedule_cost(sections: Iterable[Section], preference: SchedulePreference) -> int:
+    '''
+    Returns the cost of a (partial) schedule for the given preference, where a lower cost is better.
+    '''
+    if preference == SchedulePreference.MINIMIZE_GAPS:
+        return get_gap_minutes(sections)
+    if preference == SchedulePreference.MINIMIZE_DAYS:
+        return len({time.day for section in sections for time in section.times})
+    if preference == SchedulePreference.EARLIEST_END:
+        return max((time.end_minutes for section in sections for time in section.times), default=0)
+    if preference == SchedulePreference.LATEST_START:
+        return -min((time.start_minutes for section in sections for time in section.times), default=MINUTES_PER_DAY)
+    if preference == SchedulePreference.IN_PERSON:
+        return sum(1 for section in sections if section.section_type != IN_PERSON_SECTION_TYPE)
+
+    raise ValueError(f"Unsupported schedule preference: {preference}")
+
+def get_gap_minutes(sections: Iterable[Section]) -> int:
+    '''
+    Returns the total number of minutes between classes on the same day (in each half of the term).
+    '''
+    day_halves: Dict[int, List[Tuple[int, int]]] = {}
+    for day_half, interval in iter_day_half_intervals(sections):
+        day_halves.setdefault(day_half, []).append(interval)
+
+    return sum(get_interval_gap_minutes(sorted(intervals)) for intervals in day_halves.values())
+
+def get_interval_gap_minutes(intervals: List[Tuple[int, int]]) -> int:
+    '''
+    Returns the number of minutes between the sorted (start, end) intervals that none of them cover.
+    '''
+    gap_minutes = 0
+    latest_end = intervals[0][1] if intervals else 0
+    for start, end in intervals:
+        if start > latest_end:
+            gap_minutes += start - latest_end
+        if end > latest_end:
+            latest_end = end
+    return gap_minutes
+
+def iter_day_half_intervals(sections: Iterable[Section]) -> Iterator[Tuple[int, Tuple[int, int]]]:
+    '''
+    Yields the (start, end) minutes of every meeting of the sections along with its day_half (see DAY_HALVES),
+    so a full term meeting is yielded for both halves of the term.
+    '''
+    for section in sections:
+        for time in section.times:
+            for term_half in _TERM_HALVES[time.term_duration]:
+                yield 2 * _DAY_INDEXES[time.day] + term_half, (time.start_minutes, time.end_minutes)
+
+def get_day_count_lower_bound(days: int, domains: List[int], day_masks: List[int]) -> int:
+    '''
+    Returns a lower bound on the number of days used by any schedule that extends a partial schedule using 
+    the given days (as a day mask) with one option from each of the domains (bitsets of ordinals), where
+    day_masks holds the day mask of each option by ordinal.
+    '''
+    # Days that a course has meetings on whichever option is chosen
+    domain_day_masks = [[day_masks[ordinal] for ordinal in ConflictGraph.iter_ordinals(domain)] for domain in domains]
+    for option_day_masks in domain_day_masks:
+        forced_days = option_day_masks[0]
+        for option_days in option_day_masks[1:]:
+            forced_days &= option_days
+        days |= forced_days
+
+    # Each course also needs at least one option on top of the forced days
+    return max((min((days | option_days).bit_count() for option_days in option_day_masks) for option_day_masks in domain_day_masks), default=days.bit_count())
+
+
+class DayGaps:
+    '''
+    The gap minutes of a schedule on each day_half, which are updated as meetings are added and removed (in 
+    reverse order) instead of being computed again from every section.
+    '''
+    def __init__(self, sections: Iterable[Section] = ()):
+        self.intervals: List[List[Tuple[int, int]]] = [[] for _ in range(DAY_HALVES)] # sorted meetings of each day_half
+        self.gaps = [0] * DAY_HALVES
+        self.total = 0
+        self.previous_gaps: List[List[Tuple[int, int]]] = [] # (day_half, gap minutes) before each add
+        self.add(list(iter_day_half_intervals(sections)))
+
+    def add(self, day_half_intervals: List[Tuple[int, Tuple[int, int]]]) -> None:
+        for day_half, interval in day_half_intervals:
+            bisect.insort(self.intervals[day_half], interval)
+
+        previous_gaps = []
+        for day_half in {day_half for day_half, _ in day_half_intervals}:
+            gap_minutes = get_interval_gap_minutes(self.intervals[day_half])
+            previous_gaps.append((day_half, self.gaps[day_half]))
+            self.total += gap_minutes - self.gaps[day_half]
+            self.gaps[day_half] = gap_minutes
+        self.previous_gaps.append(previous_gaps)
+
+    def remove(self, day_half_intervals: List[Tuple[int, Tuple[int, int]]]) -> None:
+        '''
+        Removes the meetings that were added last.
+        '''
+        for day_half, interval in day_half_intervals:
+            self.intervals[day_half].remove(interval)
+        for day_half, gap_minutes in self.previous_gaps.pop():
+            self.total += gap_minutes - self.gaps[day_half]
+            self.gaps[day_half] = gap_minutes
+
+
+class ScheduleCosts:
+    '''
+    The cost of a partial schedule for a preference while a search over a conflict graph places the options of 
+    the courses (in the order of its domains) and removes them again in reverse, along with a lower bound on the
+    cost of any complete schedule that extends it.
+    '''
+    def __init__(self, conflict_graph: ConflictGraph, preference: SchedulePreference):
+        self.preference = preference
+        self.option_costs = [get_schedule_cost(option.sections, preference) for option in conflict_graph.options]
+        self.day_masks = [option.day_mask for option in conflict_graph.options]
+        self.costs = [get_schedule_cost(conflict_graph.current_schedule, preference)] # cost after each option placed
+        self.days = [CourseOption.from_sections(conflict_graph.current_schedule).day_mask] # days after each option placed
+        self.day_gaps = DayGaps(conflict_graph.current_schedule) if preference == SchedulePreference.MINIMIZE_GAPS else None
+        self.option_intervals = [list(iter_day_half_intervals(option.sections)) for option in conflict_graph.options] if self.day_gaps else []
+
+        # The remaining courses add at least the cheapest option of each (in total for IN_PERSON, or as the maximum
+        # for EARLIEST_END and LATEST_START), from the course at each depth onwards
+        domain_costs = [min(self.option_costs[ordinal] for ordinal in ConflictGraph.iter_ordinals(domain)) for domain in conflict_graph.domains]
+        self.remaining_costs = [get_schedule_cost([], preference)] * (len(domain_costs) + 1)
+        for depth in range(len(domain_costs) - 1, -1, -1):
+            self.remaining_costs[depth] = self.combine(self.remaining_costs[depth + 1], domain_costs[depth])
+
+        # The most meeting minutes the remaining courses can add on each day_half, from the course at each depth onwards
+        self.remaining_minutes = [[0] * DAY_HALVES for _ in range(len(conflict_graph.domains) + 1)] if self.day_gaps else []
+        self.remaining_total_minutes = [0] * len(self.remaining_minutes) # the same, but on all the day_halves together
+        for depth in range(len(self.remaining_minutes) - 2, -1, -1):
+            domain_minutes = self.get_domain_minutes(conflict_graph.domains[depth])
+            self.remaining_minutes[depth] = [minutes + domain_minutes[day_half] for day_half, minutes in enumerate(self.remaining_minutes[depth + 1])]
+            domain_total_minutes = max(sum(end - start for _, (start, end) in self.option_intervals[ordinal]) for ordinal in ConflictGraph.iter_ordinals(conflict_graph.domains[depth]))
+            self.remaining_total_minutes[depth] = self.remaining_total_minutes[depth + 1] + domain_total_minutes
+
+    def combine(self, cost: int, other_cost: int) -> int:
+        '''
+        Returns the cost of a schedule made of two parts with the given costs (for IN_PERSON, EARLIEST_END and LATEST_START).
+        '''
+        if self.preference == SchedulePreference.IN_PERSON:
+            return cost + other_cost
+        return max(cost, other_cost)
+
+    def place(self, ordinal: int) -> None:
+        if self.day_gaps is not None:
+            self.day_gaps.add(self.option_intervals[ordinal])
+        elif self.preference == SchedulePreference.MINIMIZE_DAYS:
+            self.days.append(self.days[-1] | self.day_masks[ordinal])
+        else:
+            self.costs.append(self.combine(self.costs[-1], self.option_costs[ordinal]))
+
+    def remove(self, ordinal: int) -> None:
+        if self.day_gaps is not None:
+            self.day_gaps.remove(self.option_intervals[ordinal])
+        elif self.preference == SchedulePreference.MINIMIZE_DAYS:
+            self.days.pop()
+        else:
+            self.costs.pop()
+
+    def get_cost(self) -> int:
+        '''
+        Returns the cost of the partial schedule.
+        '''
+        if self.day_gaps is not None:
+            return self.day_gaps.total
+        if self.preference == SchedulePreference.MINIMIZE_DAYS:
+            return self.days[-1].bit_count()
+        return self.costs[-1]
+
+    def get_lower_bound(self, depth: int, remaining_domains: List[int]) -> int:
+        '''
+        Returns a lower bound on the cost of any complete schedule that extends the partial schedule, where the 
+        remaining domains are the options left for the courses from the given depth onwards.
+        '''
+        if self.day_gaps is not None:
+            # A meeting can fill at most its own length of the gaps on its day_half
+            day_half_bound = sum(max(0, gap_minutes - minutes) for gap_minutes, minutes in zip(self.day_gaps.gaps, self.remaining_minutes[depth]))
+            return max(day_half_bound, self.day_gaps.total - self.remaining_total_minutes[depth])
+        if self.preference == SchedulePreference.MINIMIZE_DAYS:
+            return get_day_count_lower_bound(self.days[-1], remaining_domains, self.day_masks)
+        return self.combine(self.costs[-1], self.remaining_costs[depth])
+
+    def get_domain_minutes(self, domain: int) -> List[int]:
+        '''
+        Returns the most meeting minutes any of the options in the domain (a bitset of ordinals) has on each day_half.
+        '''
+        domain_minutes = [0] * DAY_HALVES
+        for ordinal in ConflictGraph.iter_ordinals(domain):
+            option_minutes = [0] * DAY_HALVES
+            for day_half, (start, end) in self.option_intervals[ordinal]:
+                option_minutes[day_half] += end - start
+            domain_minutes = list(map(max, domain_minutes, option_minutes))
+        return domain_minutes
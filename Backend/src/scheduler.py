@@ -1,44 +1,285 @@
-from typing import Iterable, List, Tuple
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Tuple
 from .model.section import Section
 from .model.course import Course
+from .model.course_option import CourseOption
+from .model.conflict_graph import ConflictGraph
+from .model.day_of_week import DayOfWeek
+from .model.schedule_preference import SchedulePreference
+from .model.search_budget import SearchBudget
+from .ranking import ScheduleCosts, get_day_count_lower_bound
+import heapq
 import itertools
+import time
 
 MAX_SCHEDULES = 25 # Maximum number of schedules to generate (to avoid overwhelming the user)
+COUNT_TIME_BUDGET = 1.0 # Default number of seconds count_schedules may spend before returning a lower bound
+COUNT_CHECK_INTERVAL = 1024 # Number of search nodes count_schedules visits between checks of the time budget
+COUNT_MAX_STATES = 20000 # Maximum number of partial schedule counts count_schedules remembers (to bound its memory)
 
 # Note: filter sections (based on times, etc.) before passing to this function
-def generate_schedules(courses: List[Course], current_schedule: List[Section] = []) -> Tuple[List[List[Section]], bool]:
-    if len(courses) == 0:
-        return [current_schedule[:]], False
-
-    res = []
-    for lecture_section in courses[-1].lecture_sections:
-        if is_section_schedulable(lecture_section, current_schedule):
-            current_schedule.append(lecture_section)
-          
-            # lecture section has related sections (e.g. labs) that must be taken 
-            if lecture_section.related_section_ids:
-                related_section_combinations = get_related_section_combinations(courses[-1], lecture_section)
-                for related_sections in related_section_combinations:
-                    # Must check to make sure that all related sections exists (i.e. none were filtered out)
-                    if None not in related_sections and not do_section_times_overlap(related_sections) and are_sections_schedulable(related_sections, current_schedule):
-                        current_schedule.extend(related_sections)
-                        schedules, _ = generate_schedules(courses[:-1], current_schedule)
-                        res.extend(schedules)
-                        for _ in range(len(related_sections)):
-                            current_schedule.pop()
-            
-            # There are no related sections
-            else:
-                schedules, _ = generate_schedules(courses[:-1], current_schedule)
-                res.extend(schedules)
-            
-            # remove lecture section from current schedule
-            current_schedule.pop()
-
-        if len(res) >= MAX_SCHEDULES: # Limit number of schedule results
-            return res, True
-
-    return res, False
+def generate_schedules(courses: List[Course], current_schedule: List[Section] = [], order_courses: bool = True, 
+                       preference: SchedulePreference | None = None, budget: SearchBudget | None = None, 
+                       conflict_graph: ConflictGraph | None = None) -> Tuple[List[List[Section]], bool]:
+    '''
+    Generates up to MAX_SCHEDULES schedules (see iter_schedules), or the best MAX_SCHEDULES schedules for 
+    the given preference (see rank_schedules). Also returns True if the limit was reached. If the search 
+    budget runs out, the schedules found so far are returned (and the budget is marked as exhausted).
+    '''
+    if preference is not None:
+        schedules = rank_schedules(courses, preference, MAX_SCHEDULES, current_schedule, order_courses, budget, conflict_graph)
+    else:
+        schedules = list(itertools.islice(iter_schedules(courses, current_schedule, order_courses, budget, conflict_graph), MAX_SCHEDULES))
+    return schedules, len(schedules) >= MAX_SCHEDULES
+
+def iter_schedules(courses: List[Course], current_schedule: List[Section] = [], order_courses: bool = True, 
+                   budget: SearchBudget | None = None, conflict_graph: ConflictGraph | None = None) -> Iterator[List[Section]]:
+    '''
+    Lazily yields the schedules that contain one option of every course, so the caller can stop after any 
+    number of schedules without the rest being searched. If order_courses is True, the courses with the fewest 
+    options are placed first, which only changes the order the schedules are found in; the sections of each 
+    schedule are always in the same order. The search stops early if the budget runs out. The conflict graph
+    of the courses is built from the other arguments unless it is given.
+    '''
+    if conflict_graph is None:
+        conflict_graph = get_conflict_graph(courses, current_schedule, order_courses)
+    if not all(conflict_graph.domains):
+        return
+
+    chosen_ordinals = [None] * len(conflict_graph.domains)
+    for _ in search_options(conflict_graph, 0, conflict_graph.domains, chosen_ordinals, budget):
+        yield conflict_graph.get_schedule(chosen_ordinals)
+
+def rank_schedules(courses: List[Course], preference: SchedulePreference, limit: int, current_schedule: List[Section] = [], 
+                   order_courses: bool = True, budget: SearchBudget | None = None, 
+                   conflict_graph: ConflictGraph | None = None) -> List[List[Section]]:
+    '''
+    Returns the (up to) limit best schedules for the given preference, best first (schedules with the same
+    cost are kept in the order they were found). Only the current best schedules are kept (in a bounded 
+    heap) and a branch is skipped when its cost lower bound cannot beat the worst of them. If the budget 
+    runs out, the best of the schedules found so far are returned.
+    '''
+    if limit <= 0:
+        return []
+    if conflict_graph is None:
+        conflict_graph = get_conflict_graph(courses, current_schedule, order_courses)
+    if not all(conflict_graph.domains):
+        return []
+
+    # Trying the cheapest options first finds good schedules early, which makes the bound prune more
+    costs = ScheduleCosts(conflict_graph, preference)
+    sorted_domains = [sorted(ConflictGraph.iter_ordinals(domain), key=lambda ordinal: costs.option_costs[ordinal]) for domain in conflict_graph.domains]
+    best_schedules: List[Tuple[int, int, List[int]]] = [] # heap of (-cost, -order found, chosen ordinals), worst on top
+    chosen_ordinals: List[int] = [None] * len(conflict_graph.domains)
+    found = 0
+
+    def search(depth: int, remaining_domains: List[int]) -> None:
+        nonlocal found
+        if len(remaining_domains) == 0:
+            entry = (-costs.get_cost(), -found, chosen_ordinals[:])
+            found += 1
+            if len(best_schedules) < limit:
+                heapq.heappush(best_schedules, entry)
+            elif entry > best_schedules[0]:
+                heapq.heapreplace(best_schedules, entry)
+            return
+
+        if len(best_schedules) == limit and costs.get_lower_bound(depth, remaining_domains) >= -best_schedules[0][0]:
+            return
+
+        for ordinal in sorted_domains[depth]:
+            if not remaining_domains[0] >> ordinal & 1:
+                continue
+            if budget is not None and not budget.expand():
+                return
+
+            pruned_domains = conflict_graph.prune(remaining_domains[1:], ordinal)
+            if pruned_domains is None:
+                continue
+
+            chosen_ordinals[depth] = ordinal
+            costs.place(ordinal)
+            search(depth + 1, pruned_domains)
+            costs.remove(ordinal)
+
+    search(0, conflict_graph.domains)
+    return [conflict_graph.get_schedule(ordinals) for _, _, ordinals in sorted(best_schedules, reverse=True)]
+
+def find_fewest_days_schedule(courses: List[Course], current_schedule: List[Section] = [], order_courses: bool = True, 
+                              budget: SearchBudget | None = None, conflict_graph: ConflictGraph | None = None) -> List[Section] | None:
+    '''
+    Returns a schedule with the fewest days on campus (the first one found if there are ties), or None if there 
+    is no valid schedule. This is a branch and bound search on the set of days used: a branch is skipped as 
+    soon as the days it must use (see get_day_count_lower_bound) are not fewer than the best schedule found,
+    so the optimum is found without enumerating every schedule. If the budget runs out, the best schedule 
+    found so far is returned (None if none was found).
+    '''
+    if conflict_graph is None:
+        conflict_graph = get_conflict_graph(courses, current_schedule, order_courses)
+    if not all(conflict_graph.domains):
+        return None
+
+    day_masks = [option.day_mask for option in conflict_graph.options]
+    current_days = CourseOption.from_sections(conflict_graph.current_schedule).day_mask
+    chosen_ordinals: List[int] = [None] * len(conflict_graph.domains)
+    best_day_count = len(DayOfWeek) + 1
+    best_ordinals: List[int] = None
+
+    def search(depth: int, days: int, remaining_domains: List[int]) -> None:
+        nonlocal best_day_count, best_ordinals
+        if len(remaining_domains) == 0:
+            best_day_count = days.bit_count()
+            best_ordinals = chosen_ordinals[:]
+            return
+
+        # Try the options that add the fewest new days first
+        for ordinal in sorted(ConflictGraph.iter_ordinals(remaining_domains[0]), key=lambda ordinal: (days | day_masks[ordinal]).bit_count()):
+            option_days = days | day_masks[ordinal]
+            if option_days.bit_count() >= best_day_count:
+                break
+            if budget is not None and not budget.expand():
+                return
+
+            pruned_domains = conflict_graph.prune(remaining_domains[1:], ordinal)
+            if pruned_domains is None or get_day_count_lower_bound(option_days, pruned_domains, day_masks) >= best_day_count:
+                continue
+
+            chosen_ordinals[depth] = ordinal
+            search(depth + 1, option_days, pruned_domains)
+
+    search(0, current_days, conflict_graph.domains)
+    if best_ordinals is None:
+        return None
+    return conflict_graph.get_schedule(best_ordinals)
+
+def count_schedules(courses: List[Course], current_schedule: List[Section] = [], time_budget: float | None = COUNT_TIME_BUDGET, 
+                    conflict_graph: ConflictGraph | None = None) -> Tuple[int, bool]:
+    '''
+    Counts the schedules iter_schedules would generate without building them. Returns the count and True if it 
+    is exact; if counting takes longer than time_budget seconds (or the conflict graph is truncated), the schedules
+    counted so far are returned as a lower bound. The options left for the remaining courses only depend on the placed options they conflict 
+    with, so partial schedules that conflict with the same remaining options are only counted once.
+    '''
+    if conflict_graph is None:
+        conflict_graph = get_conflict_graph(courses, current_schedule)
+    domains = conflict_graph.domains
+    if not all(domains):
+        return 0, not conflict_graph.is_truncated
+    if len(domains) == 0:
+        return 1, True
+
+    # Options of the remaining courses at each depth
+    remaining_options = [0] * (len(domains) + 1)
+    for depth in range(len(domains) - 1, -1, -1):
+        remaining_options[depth] = remaining_options[depth + 1] | domains[depth]
+
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    counts: Dict[Tuple[int, int], int] = {}
+    nodes = 0
+    is_exact = True
+
+    # conflicts holds the options that conflict with any of the placed options
+    def count(depth: int, conflicts: int, remaining_domains: List[int]) -> int:
+        nonlocal nodes, is_exact
+        # The remaining domains have already been pruned, so every option of the last course fits
+        if len(remaining_domains) == 1:
+            return remaining_domains[0].bit_count()
+
+        key = (depth, conflicts & remaining_options[depth])
+        if key in counts:
+            return counts[key]
+
+        total = 0
+        for ordinal in ConflictGraph.iter_ordinals(remaining_domains[0]):
+            nodes += 1
+            if deadline is not None and nodes % COUNT_CHECK_INTERVAL == 0 and time.monotonic() > deadline:
+                is_exact = False
+            if not is_exact:
+                return total
+
+            pruned_domains = conflict_graph.prune(remaining_domains[1:], ordinal)
+            if pruned_domains is None:
+                continue
+
+            total += count(depth + 1, conflicts | conflict_graph.conflicts[ordinal], pruned_domains)
+
+        # A subtree that ran out of time has only been partly counted
+        if is_exact and len(counts) < COUNT_MAX_STATES:
+            counts[key] = total
+        return total
+
+    schedule_count = count(0, 0, domains)
+    return schedule_count, is_exact and not conflict_graph.is_truncated
+
+def get_conflict_graph(courses: List[Course], current_schedule: List[Section] = [], order_courses: bool = True, 
+                       budget: SearchBudget | None = None) -> ConflictGraph:
+    '''
+    Builds the conflict graph of the options of every course that fit in the current schedule. The graph 
+    can be passed to iter_schedules, rank_schedules and count_schedules so it is only built once per request.
+    Building the graph stops if the budget runs out (see ConflictGraph.build).
+    '''
+    positions, domains = get_search_domains(courses, current_schedule, order_courses)
+    return ConflictGraph.build(domains, positions, current_schedule[:], budget)
+
+def get_search_domains(courses: List[Course], current_schedule: List[Section], order_courses: bool) -> Tuple[List[int], List[List[CourseOption]]]:
+    '''
+    Gets the options of every course that fit in the current schedule (the domains), in the order the courses 
+    should be placed, along with the position of each course's options in a schedule. Courses are placed starting
+    from the last one in the list, or the most constrained one if order_courses is True.
+    '''
+    schedule_option = CourseOption.from_sections(current_schedule)
+    domains = [get_course_options(course, schedule_option) for course in reversed(courses)]
+    positions = list(range(len(domains)))
+    if order_courses and all(domains):
+        positions = order_domains(domains)
+
+    return positions, [domains[position] for position in positions]
+
+def order_domains(domains: List[List[CourseOption]]) -> List[int]:
+    '''
+    Returns the positions of the domains ordered so that the most constrained course comes first: the fewest 
+    options, with ties broken by the most meeting minutes the course is guaranteed to take up.
+    '''
+    def key(position: int) -> Tuple[int, int]:
+        domain = domains[position]
+        return len(domain), -min(option.get_meeting_minutes() for option in domain)
+    
+    return sorted(range(len(domains)), key=key)
+
+def search_options(conflict_graph: ConflictGraph, depth: int, domains: List[int], chosen_ordinals: List[int], 
+                   budget: SearchBudget | None = None) -> Iterator[None]:
+    '''
+    Depth-first search that places an option of the first course in domains (the course at the given depth) 
+    and then removes the options of the remaining courses that conflict with it (forward checking). A branch
+    is abandoned as soon as one of the remaining courses has no options left. The ordinal of each course's 
+    chosen option is stored at its depth in chosen_ordinals, and the generator yields every time chosen_ordinals
+    is complete. Every option tried is counted against the budget (if any), and the search stops once it runs out.
+    '''
+    if len(domains) == 0:
+        yield
+        return
+
+    for ordinal in ConflictGraph.iter_ordinals(domains[0]):
+        if budget is not None and not budget.expand():
+            return
+
+        remaining_domains = conflict_graph.prune(domains[1:], ordinal)
+        if remaining_domains is None:
+            continue
+
+        chosen_ordinals[depth] = ordinal
+        yield from search_options(conflict_graph, depth + 1, remaining_domains, chosen_ordinals, budget)
+
+def get_course_options(course: Course, schedule_option: CourseOption) -> List[CourseOption]:
+    '''
+    Gets every valid way of taking a course (lecture section plus one combination of its related sections) 
+    that fits in the current schedule, given as the option made of its sections.
+    '''
+    options = course.compile().options
+    if len(schedule_option.sections) == 0:
+        return options
+
+    return [option for option in options if option.is_compatible(schedule_option)]
 
 
 def is_section_schedulable(section: Section, current_schedule: List[Section]) -> bool:
@@ -46,38 +287,20 @@ def is_section_schedulable(section: Section, current_schedule: List[Section]) ->
     Checks if time overlaps with any time in current schedule.
     Note that if the section has no meeting times, the function will return True.
     '''
-    return all(
-        not time1.does_date_overlap(time2) 
-        for time1 in section.times 
-        for scheduled_section in current_schedule 
-        for time2 in scheduled_section.times
-    )
+    return CourseOption.from_sections([section]).is_compatible(CourseOption.from_sections(current_schedule))
 
 def are_sections_schedulable(sections: Iterable[Section], current_schedule: List[Section]) -> bool:
     '''
     Checks if a list of sections is schedulable given the current schedule.
     '''
-    for section in sections:
-        if not is_section_schedulable(section, current_schedule):
-            return False
-        
-    return True
+    return CourseOption.from_sections(sections).is_compatible(CourseOption.from_sections(current_schedule))
 
 def do_section_times_overlap(sections: List[Section]) -> bool:
     '''
     Checks if a list of Sections have overlapping times.
     '''
-    for i in range(len(sections)):
-        for j in range(i+1, len(sections)):
-            is_schedulable = all(
-                not time1.does_date_overlap(time2) 
-                for time1 in sections[i].times 
-                for time2 in sections[j].times
-            )
-            if not is_schedulable:
-                return True
-            
-    return False
+    options = [CourseOption.from_sections([section]) for section in sections]
+    return any(not options[i].is_compatible(options[j]) for i in range(len(options)) for j in range(i + 1, len(options)))
 
 def can_take_together(lecture_section: Section, lab_section: Section) -> bool:
     '''
@@ -90,14 +313,3 @@ def can_take_together(lecture_section: Section, lab_section: Section) -> bool:
     
     return False
 
-
-def get_related_section_combinations(course: Course, lecture_section: Section) -> List[List[Section]]:
-    '''
-    Gets a list combinations of "related sections" for a given lecture section.
-    '''
-
-    if course is None or lecture_section is None or not lecture_section.related_section_ids:
-        raise ValueError("Parameters course and lecture_section cannot be None. Also lecture_section must not be empty.")
-
-    related_section_id_combinations = list(itertools.product(*lecture_section.related_section_ids))
-    return [[course.get_lab_section(section_id) for section_id in combination] for combination in related_section_id_combinations]
\ No newline at end of file
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The catalogue and s3 files layers are shared with the web scraper (see backend-template.yaml)
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "..", "WebScraping", "layers", "catalogue", "python"))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "..", "WebScraping", "layers", "s3_files", "python"))
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from typing import Dict, List
+import pytest
+from Backend.src.model.course import Course
+from Backend.src.database.database import CourseDatabase
+from Backend.src.database.async_database import AsyncCourseDatabase
+from Backend.src.database.database_error import ErrorCourseDatabase, CouresDatabaseException
+from Backend.src.database.course_cache import course_cache
+
+test_term = "Fall 2023"
+test_terms = {"202330": test_term}
+
+class FakeDatabase(CourseDatabase):
+    '''
+    In-process database that waits for batch_count get_courses calls to run at the same time before returning.
+    '''
+    def __init__(self, course_codes: List[str], batch_count: int = 1):
+        self.courses = {course_code: Course(course_code, "Title", test_term, "", [], [], None) for course_code in course_codes}
+        self.barrier = threading.Barrier(batch_count, timeout=5)
+        self.requested_batches = []
+
+    def get_resource(self):
+        return "fake"
+
+    def get_course(self, course_code: str, term: str) -> Course | None:
+        return self.courses.get(course_code) if term == test_term else None
+
+    def get_courses(self, course_codes: List[str], term: str) -> Dict[str, Course]:
+        self.requested_batches.append(course_codes)
+        self.barrier.wait()
+        return super().get_courses(course_codes, term)
+
+    def get_data_version(self, term: str) -> str:
+        return "1"
+
+    def get_terms(self) -> dict:
+        return test_terms
+
+    def get_course_code_and_section_list(self, term: str) -> List[str]:
+        return [f"{course_code} A" for course_code in self.courses]
+
+@pytest.fixture(autouse=True)
+def clear_course_cache():
+    course_cache.clear()
+
+def test_get_course():
+    db = AsyncCourseDatabase(FakeDatabase(["SYSC 4001"]))
+    assert asyncio.run(db.get_course("SYSC 4001", test_term)).code == "SYSC 4001"
+    assert asyncio.run(db.get_course("INVALID CODE", test_term)) is None
+
+def test_get_courses_in_batches():
+    course_codes = ["SYSC 4001", "SYSC 4002", "SYSC 4003", "SYSC 4004", "SYSC 4005"]
+    fake_db = FakeDatabase(course_codes, batch_count=3)
+    db = AsyncCourseDatabase(fake_db, batch_size=2)
+
+    # The barrier only lets the batches return once all 3 of them are being read at the same time
+    courses = asyncio.run(db.get_courses(course_codes + ["SYSC 4001", "INVALID CODE"], test_term))
+
+    assert list(courses) == course_codes
+    assert sorted(fake_db.requested_batches) == [["SYSC 4001", "SYSC 4002"], ["SYSC 4003", "SYSC 4004"], ["SYSC 4005", "INVALID CODE"]]
+
+def test_get_courses_in_one_batch():
+    fake_db = FakeDatabase(["SYSC 4001", "SYSC 4002"])
+    db = AsyncCourseDatabase(fake_db)
+
+    assert list(asyncio.run(db.get_courses(["SYSC 4001", "SYSC 4002"], test_term))) == ["SYSC 4001", "SYSC 4002"]
+    assert fake_db.requested_batches == [["SYSC 4001", "SYSC 4002"]]
+    assert asyncio.run(db.get_courses([], test_term)) == {}
+
+def test_batch_size_of_database():
+    class BatchDatabase(FakeDatabase):
+        MAX_BATCH_GET_KEYS = 100
+
+    assert AsyncCourseDatabase(BatchDatabase([])).batch_size == 100
+    assert AsyncCourseDatabase(FakeDatabase([])).batch_size is None
+
+def test_get_cached_courses():
+    fake_db = FakeDatabase(["SYSC 4001", "SYSC 4002"])
+    db = AsyncCourseDatabase(fake_db)
+
+    course = fake_db.get_cached_course("SYSC 4001", test_term)
+    courses = asyncio.run(db.get_cached_courses(["SYSC 4001", "SYSC 4002", "INVALID CODE"], test_term))
+    assert asyncio.run(db.get_cached_courses(["SYSC 4002"], test_term)) == {"SYSC 4002": courses["SYSC 4002"]}
+
+    assert list(courses) == ["SYSC 4001", "SYSC 4002"]
+    assert courses["SYSC 4001"] is course
+    assert fake_db.requested_batches == [["SYSC 4002", "INVALID CODE"]]
+
+def test_get_terms():
+    db = AsyncCourseDatabase(FakeDatabase(["SYSC 4001"]))
+    assert asyncio.run(db.get_terms()) == test_terms
+    assert asyncio.run(db.get_course_code_and_section_list(test_term)) == ["SYSC 4001 A"]
+
+def test_gather():
+    db = AsyncCourseDatabase(FakeDatabase(["SYSC 4001"]))
+
+    async def gather():
+        return await asyncio.gather(db.get_terms(), db.get_course("SYSC 4001", test_term), db.get_course_code_and_section_list(test_term))
+
+    terms, course, course_list = asyncio.run(gather())
+    assert terms == test_terms
+    assert course.code == "SYSC 4001"
+    assert course_list == ["SYSC 4001 A"]
+
+def test_error_database():
+    db = AsyncCourseDatabase(ErrorCourseDatabase())
+    with pytest.raises(CouresDatabaseException):
+        asyncio.run(db.get_course("", ""))
+    with pytest.raises(CouresDatabaseException):
+        asyncio.run(db.get_courses(["SYSC 4001"], ""))
+    with pytest.raises(CouresDatabaseException):
+        asyncio.run(db.get_terms())
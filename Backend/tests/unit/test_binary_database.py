@@ -0,0 +1,81 @@
+import pytest
+import time
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+import boto3
+boto3.setup_default_session(region_name="us-east-1")
+from catalogue_format import pack_catalogue
+from Backend.src.database.binary_database import BinaryDatabase
+from Backend.src.database.s3_database import S3Database
+from Backend.tests.unit.test_s3_database import CLASSES_DICT, FILES, TERMS_DICT, test_term, get_s3_object, get_downloaded_keys, wait_for_refreshes
+
+CATALOGUE_KEY = "web-scraping-stepfunction/classes.bin"
+CATALOGUE_FILES = {**FILES, CATALOGUE_KEY: pack_catalogue(CLASSES_DICT)}
+
+@pytest.fixture(autouse=True)
+def catalogue_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(BinaryDatabase, "catalogue_directory", str(tmp_path))
+    return tmp_path
+
+def generate_db(files: dict = CATALOGUE_FILES, content_encoding: str = "", etags: dict = {}) -> BinaryDatabase:
+    with patch('boto3.resource') as mock_boto3_resource:
+        mock_boto3_resource.return_value.Object.side_effect = lambda bucket_name, key: get_s3_object(files, key, content_encoding, etags)
+        return BinaryDatabase()
+
+def test_get_course(catalogue_directory):
+    db = generate_db()
+    code = "AERO 2001"
+    course = db.get_course(code, test_term)
+
+    expected_course = S3Database.convert_to_course(db, CLASSES_DICT[f"{code}-{test_term}"])
+    assert (course.code, course.title, course.term, course.prerequisite) == (expected_course.code, expected_course.title, expected_course.term, expected_course.prerequisite)
+    assert [section.to_dict() for section in course.lecture_sections + course.lab_sections] == [section.to_dict() for section in expected_course.lecture_sections + expected_course.lab_sections]
+    assert db.get_course(code, "Winter 1999") == None
+    assert db.get_course("INVALID CODE", test_term) == None
+    assert db.get_terms() == TERMS_DICT
+    assert db.get_data_version(test_term) == f'"{CATALOGUE_KEY}"'
+    assert (catalogue_directory / "classes.bin").read_bytes() == CATALOGUE_FILES[CATALOGUE_KEY]
+    # The classes of the term are only read from the catalogue
+    assert "web-scraping-stepfunction/classes/Fall 2023.json" not in get_downloaded_keys(db)
+
+def test_get_course_compressed(catalogue_directory):
+    db = generate_db(content_encoding="gzip")
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+    assert (catalogue_directory / "classes.bin").read_bytes() == CATALOGUE_FILES[CATALOGUE_KEY]
+
+def test_refresh(monkeypatch):
+    files, etags = dict(CATALOGUE_FILES), {}
+    db = generate_db(files, etags=etags)
+    monkeypatch.setattr(db, "refresh_seconds", 60)
+    start = time.monotonic()
+    old_catalogue = db.get_catalogue()[0]
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+
+    new_classes = {f"AERO 2002-{test_term}": {**CLASSES_DICT[f"AERO 2001-{test_term}"], "Subject": "AERO 2002"}}
+    files[CATALOGUE_KEY] = pack_catalogue(new_classes)
+    etags[CATALOGUE_KEY] = '"NEW VERSION"'
+    with patch('Backend.src.database.s3_database.time.monotonic', return_value=start + 61):
+        assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+        wait_for_refreshes(db)
+        assert db.get_course("AERO 2001", test_term) == None
+        assert db.get_course("AERO 2002", test_term).code == "AERO 2002"
+        assert db.get_data_version(test_term) == '"NEW VERSION"'
+
+    # The catalogue that was replaced can still be read
+    assert old_catalogue.get(f"AERO 2001-{test_term}") is not None
+
+def test_get_course_without_catalogue():
+    db = generate_db(FILES)
+    code = "AERO 2001"
+    assert db.get_course(code, test_term).code == code
+    assert db.get_course(code, test_term).code == code
+    assert db.get_data_version(test_term) == '"web-scraping-stepfunction/classes/Fall 2023.json"'
+    assert get_downloaded_keys(db).count(CATALOGUE_KEY) == 1 # a missing catalogue is only requested once
+
+def test_get_course_errors():
+    db = generate_db({**FILES, CATALOGUE_KEY: b"NOT A CATALOGUE"})
+    with pytest.raises(ValueError):
+        db.get_course("AERO 2001", test_term)
+
+    with patch('Backend.src.database.binary_database.CatalogueReader', None), pytest.raises(ImportError):
+        generate_db()
@@ -0,0 +1,28 @@
+from Backend.src.model.date import ClassTime
+from Backend.src.model.day_of_week import DayOfWeek
+from Backend.src.model.section import Section
+from Backend.src.model.course import Course
+from Backend.src.model.compiled_course import CompiledCourse
+from Backend.src.model.term_duration import TermDuration
+
+def test_compile():
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "TITLE", "TERM", "NONE", [["ETU"], ["L1", "L2", "L3", "L4"]], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE1000", "C", "11113", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "TITLE", "TERM", "NONE", [["L4"]], "2023-09-06", "2023-12-08")
+    tutorial = Section("CODE1000", "ETU", "22221", "Bob", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "20:05", "21:35")], "", "TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    lab1 = Section("CODE1000", "L1", "22222", "Bob", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    lab2 = Section("CODE1000", "L2", "22223", "Bob", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "19:05", "20:35")], "", "TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    lab3 = Section("CODE1000", "L3", "22224", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    course = Course("CODE1000", "TITLE", "Fall 2023", "NONE", [section1, section2, section3], [tutorial, lab1, lab2, lab3], None)
+
+    compiled_course = CompiledCourse.compile(course)
+    assert compiled_course.course == course
+    # L2 overlaps the tutorial, L3 overlaps the lecture and L4 does not exist
+    assert compiled_course.related_sections == [(section1, [(tutorial, lab1)]), (section2, [()]), (section3, [])]
+    assert [option.sections for option in compiled_course.options] == [(section1, tutorial, lab1), (section2,)]
+    assert course.compile() == compiled_course
+
+def test_compile_empty_course():
+    compiled_course = Course("CODE1000", "TITLE", "Fall 2023", "NONE", [], [], None).compile()
+    assert compiled_course.related_sections == []
+    assert compiled_course.options == []
@@ -0,0 +1,78 @@
+from Backend.src.model.date import ClassTime
+from Backend.src.model.day_of_week import DayOfWeek
+from Backend.src.model.section import Section
+from Backend.src.model.course_option import CourseOption
+from Backend.src.model.conflict_graph import ConflictGraph
+from Backend.src.model.term_duration import TermDuration
+from Backend.src.model.search_budget import SearchBudget
+
+section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+section3 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:32", "11:35")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+section4 = Section("CODE2000", "B", "22223", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:35", "11:35")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+section5 = Section("CODE3000", "A", "33333", "Charlie", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "08:35", "09:25")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+section6 = Section("CODE4000", "A", "44444", "Dom", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "08:35", "09:25")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+option1, option2, option3, option4, option5 = (CourseOption.from_sections([section]) for section in (section1, section2, section3, section4, section5))
+
+def test_build():
+    conflict_graph = ConflictGraph.build([[option1, option2], [option3, option4], [option5]], [2, 0, 1], [section6])
+    assert conflict_graph.options == [option1, option2, option3, option4, option5]
+    assert conflict_graph.domains == [0b00011, 0b01100, 0b10000]
+    # option1 overlaps option3 (which is not on a slot boundary) and option5, but not option4
+    assert conflict_graph.conflicts == [0b10100, 0b00000, 0b00001, 0b00000, 0b00001]
+    assert conflict_graph.positions == [2, 0, 1]
+    assert conflict_graph.current_schedule == [section6]
+
+def test_build_without_options():
+    conflict_graph = ConflictGraph.build([[option1], []], [0, 1], [])
+    assert conflict_graph.domains == [0b1, 0]
+    assert conflict_graph.conflicts == [0]
+    assert ConflictGraph.build([], [], []).domains == []
+
+def test_build_with_too_many_options():
+    '''
+    Tests that only the first options of each course are kept when there are more than MAX_OPTIONS options
+    '''
+    conflict_graph = ConflictGraph.build([[option2] * 1500, [option5] * 1500], [0, 1], [])
+    assert conflict_graph.is_truncated == True
+    assert len(conflict_graph.options) == 2000
+    assert [domain.bit_count() for domain in conflict_graph.domains] == [1000, 1000]
+
+    conflict_graph = ConflictGraph.build([[option1, option2] * 5, [option3, option4] * 5, [option5]], [0, 1, 2], [], max_options=7)
+    assert conflict_graph.is_truncated == True
+    assert conflict_graph.options == [option1, option2, option1, option3, option4, option3, option5]
+    assert conflict_graph.conflicts[0] == 0b1101000
+    assert ConflictGraph.build([[option1, option2]], [0], [], max_options=2).is_truncated == False
+
+def test_build_out_of_budget():
+    '''
+    Tests that building the graph stops once the budget runs out, leaving every course without options
+    '''
+    budget = SearchBudget(deadline=0)
+    conflict_graph = ConflictGraph.build([[option1, option2], [option3, option4], [option5]], [0, 1, 2], [], budget)
+    assert budget.is_exhausted == True
+    assert conflict_graph.is_truncated == True
+    assert conflict_graph.domains == [0, 0, 0]
+    assert len(conflict_graph.conflicts) == len(conflict_graph.options)
+
+    budget = SearchBudget(deadline=float("inf"))
+    assert ConflictGraph.build([[option1, option2], [option3, option4], [option5]], [0, 1, 2], [], budget).is_truncated == False
+    assert budget.is_exhausted == False
+
+def test_iter_ordinals():
+    assert list(ConflictGraph.iter_ordinals(0b101100)) == [2, 3, 5]
+    assert list(ConflictGraph.iter_ordinals(0)) == []
+
+def test_prune():
+    '''
+    Tests that prune removes conflicting options and detects when a course has no options left
+    '''
+    conflict_graph = ConflictGraph.build([[option1, option2], [option3, option4], [option5]], [0, 1, 2], [])
+    assert conflict_graph.prune([0b01100], 0) == [0b01000]
+    assert conflict_graph.prune([0b01100, 0b10000], 0) == None
+    assert conflict_graph.prune([0b01100, 0b10000], 1) == [0b01100, 0b10000]
+    assert conflict_graph.prune([], 0) == []
+
+def test_get_schedule():
+    conflict_graph = ConflictGraph.build([[option1, option2], [option3, option4], [option5]], [2, 0, 1], [section6])
+    assert conflict_graph.get_schedule([1, 2, 4]) == [section6, section3, section5, section2]
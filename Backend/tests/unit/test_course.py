@@ -1,3 +1,4 @@
+import dataclasses
 import pytest
 from Backend.src.model.date import ClassTime
 from Backend.src.model.day_of_week import DayOfWeek
@@ -85,6 +86,68 @@ def test_filter_all_courses():
         Course.filter_all_courses([], None)
     
 
+def test_filter_copy_of_course():
+    '''
+    Tests that filtering a copy of a course (e.g. of a cached course) does not change the sections of the course
+    '''
+    section1 = Section("CODE1000", "A", "11111", "JON", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "22222", "JON", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    lab1 = Section("CODE1000", "L1", "44444", "JON", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "20:00", "23:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course = Course("CODE1000", "CLASS NAME", "FALL", "N/A", [section1, section2], [lab1], None)
+
+    copy = dataclasses.replace(course, section_id_filter="B")
+    Course.filter_all_courses([copy], Filter(day_of_week=DayOfWeek.FRIDAY))
+    copy.filter_by_section()
+    copy.filter_before_time("10:00")
+    copy.filter_after_time("11:00")
+    copy.filter_day_off(DayOfWeek.MONDAY)
+    copy.filter_between_times([ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "10:00", "11:00")])
+
+    assert copy.lecture_sections == []
+    assert copy.lab_sections == []
+    assert course.lecture_sections == [section1, section2]
+    assert course.lab_sections == [lab1]
+
+def test_get_filtered_section_indexes():
+    section1 = Section("CODE1000", "A", "11111", "JON", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "22222", "JON", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE1000", "C", "33333", "JON", [ClassTime(DayOfWeek.THURSDAY, TermDuration.FULL_TERM, "07:00", "08:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    lab1 = Section("CODE1000", "L1", "44444", "JON", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "20:00", "23:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    lab2 = Section("CODE1000", "L2", "55555", "JON", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "18:30", "19:30")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    lab3 = Section("CODE1000", "L3", "66666", "JON", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "13:00", "14:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course = Course("CODE1000", "CLASS NAME", "FALL", "N/A", [section1, section2, section3], [lab1, lab2, lab3], None)
+    filter = Filter(before_time = "08:00", day_of_week = DayOfWeek.MONDAY, after_time = "22:00", between_times=[ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "18:00", "23:00")])
+    assert course.get_filtered_section_indexes(filter) == ([1], [2])
+    assert course.get_filtered_section_indexes(Filter()) == ([0, 1, 2], [0, 1, 2])
+
+    course.section_id_filter = "C"
+    assert course.get_filtered_section_indexes(Filter()) == ([2], [0, 1, 2])
+    assert course.get_filtered_section_indexes(filter) == ([], [2])
+    # the course is unchanged
+    assert course.lecture_sections == [section1, section2, section3]
+    assert course.lab_sections == [lab1, lab2, lab3]
+
+    with pytest.raises(TypeError):
+        course.get_filtered_section_indexes(None)
+
+def test_get_filtered_courses():
+    section1 = Section("CODE1000", "A", "11111", "JON", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "22222", "JON", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE2000", "A", "11111", "JON", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "07:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section4 = Section("CODE2000", "B", "22222", "JON", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "CLASS NAME", "FALL", "N/A", [section1, section2], [], "B")
+    course2 = Course("CODE2000", "CLASS NAME 2", "FALL", "N/A", [section3], [section4], None)
+    filter = Filter(before_time = "08:00", day_of_week = DayOfWeek.MONDAY)
+    filtered_course1, filtered_course2 = Course.get_filtered_courses([course1, course2], filter)
+    assert filtered_course1 == Course("CODE1000", "CLASS NAME", "FALL", "N/A", [section2], [], "B")
+    assert filtered_course2 == Course("CODE2000", "CLASS NAME 2", "FALL", "N/A", [], [section4], None)
+    # the original courses are unchanged
+    assert course1.lecture_sections == [section1, section2]
+    assert course2.lecture_sections == [section3]
+
+    with pytest.raises(ValueError):
+        Course.get_filtered_courses([], None)
+
 def test_filter():
     section1 = Section("CODE1000", "A", "11111", "JON", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
     section2 = Section("CODE1000", "B", "22222", "JON", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
@@ -0,0 +1,40 @@
+from Backend.src.model.course import Course
+from Backend.src.database.course_cache import CourseCache
+
+def test_get_and_put():
+    cache = CourseCache()
+    course = Course("CODE1000", "TITLE", "Fall 2023", "NONE", [], [], None)
+    assert cache.get("CODE1000", "Fall 2023", "1") == None
+
+    cache.put(course, "CODE1000", "Fall 2023", "1")
+    assert cache.get("CODE1000", "Fall 2023", "1") is course
+    assert cache.get("CODE1000", "Fall 2023", "2") == None
+    assert cache.get("CODE1000", "Winter 2024", "1") == None
+
+    cache.clear()
+    assert cache.get("CODE1000", "Fall 2023", "1") == None
+
+def test_least_recently_used_course_is_evicted():
+    cache = CourseCache(max_size=2)
+    course1 = Course("CODE1000", "TITLE", "Fall 2023", "NONE", [], [], None)
+    course2 = Course("CODE2000", "TITLE", "Fall 2023", "NONE", [], [], None)
+    course3 = Course("CODE3000", "TITLE", "Fall 2023", "NONE", [], [], None)
+    cache.put(course1, "CODE1000", "Fall 2023", "1")
+    cache.put(course2, "CODE2000", "Fall 2023", "1")
+    assert cache.get("CODE1000", "Fall 2023", "1") is course1
+
+    cache.put(course3, "CODE3000", "Fall 2023", "1")
+    assert cache.get("CODE1000", "Fall 2023", "1") is course1
+    assert cache.get("CODE2000", "Fall 2023", "1") == None
+    assert cache.get("CODE3000", "Fall 2023", "1") is course3
+
+def test_get_and_put_courses():
+    cache = CourseCache()
+    course1 = Course("CODE1000", "TITLE", "Fall 2023", "NONE", [], [], None)
+    course2 = Course("CODE2000", "TITLE", "Fall 2023", "NONE", [], [], None)
+    cache.put(course1, "CODE1000", "Fall 2023", "1")
+
+    assert cache.get_courses(["CODE1000", "CODE2000"], "Fall 2023", "1") == ({"CODE1000": course1}, ["CODE2000"])
+    assert cache.put_courses({"CODE2000": course2}, "Fall 2023", "1") == {"CODE2000": course2}
+    assert cache.get_courses(["CODE1000", "CODE2000"], "Fall 2023", "1") == ({"CODE1000": course1, "CODE2000": course2}, [])
+    assert cache.get_courses(["CODE1000"], "Fall 2023", "2") == ({}, ["CODE1000"])
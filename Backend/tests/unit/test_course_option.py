@@ -0,0 +1,24 @@
+from Backend.src.model.date import ClassTime
+from Backend.src.model.day_of_week import DayOfWeek
+from Backend.src.model.section import Section
+from Backend.src.model.course_option import CourseOption
+from Backend.src.model.term_duration import TermDuration
+
+def test_from_sections():
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "L1", "22222", "Bob", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:00", "09:51")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    option = CourseOption.from_sections([section1, section2])
+    assert option.sections == (section1, section2)
+    assert option.mask == section1.get_occupancy_mask() | section2.get_occupancy_mask()
+    assert option.is_mask_exact == False
+    assert option.get_meeting_minutes() == 90 + 51
+
+def test_is_compatible():
+    option1 = CourseOption.from_sections([Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "10:32")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    option2 = CourseOption.from_sections([Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:32", "11:00")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    option3 = CourseOption.from_sections([Section("CODE3000", "A", "33333", "Charlie", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:00", "11:00")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    option4 = CourseOption.from_sections([Section("CODE4000", "A", "44444", "Dom", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "11:00", "12:00")], "", "TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    assert option1.is_compatible(option2) == True
+    assert option1.is_compatible(option3) == False
+    assert option2.is_compatible(option3) == False
+    assert option3.is_compatible(option4) == True
@@ -44,6 +44,26 @@ def testConvertTimeToFloat():
     with pytest.raises(ValueError):
         ClassTime.convert_time_to_float("12345")
 
+def testConvertTimeToMinutes():
+    assert ClassTime.convert_time_to_minutes("22:19") == 22 * 60 + 19
+    assert ClassTime.convert_time_to_minutes("00:00") == 0
+    with pytest.raises(ValueError):
+        ClassTime.convert_time_to_minutes("12345")
+
+def testMinutes():
+    date = ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:03", "12:54")
+    assert date.start_minutes == 9 * 60 + 3
+    assert date.end_minutes == 12 * 60 + 54
+    assert date.get_duration_in_minutes() == 231
+
+    # the times cannot be changed after construction
+    with pytest.raises(AttributeError):
+        date.start_time = "10:00"
+    with pytest.raises(AttributeError):
+        date.end_minutes = 600
+    with pytest.raises(AttributeError):
+        date.other_attribute = True
+
 def testDoesDateOverlap():
     date = ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:03", "12:54")
     assert date.does_date_overlap(ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "01:34", "10:17")) == False
@@ -91,4 +111,21 @@ def test_to_dict():
     day = DayOfWeek.MONDAY
     duration = TermDuration.FULL_TERM
     start_time, end_time = "09:00", "12:00"
-    assert ClassTime(day, duration, start_time, end_time).to_dict() == {"DayOfWeek":day.value, "TermDuration":duration.value, "WeekSchedule":WeekSchedule.EVERY_WEEK.value, "StartTime":start_time, "EndTime":end_time}
\ No newline at end of file
+    assert ClassTime(day, duration, start_time, end_time).to_dict() == {"DayOfWeek":day.value, "TermDuration":duration.value, "WeekSchedule":WeekSchedule.EVERY_WEEK.value, "StartTime":start_time, "EndTime":end_time}
+
+def test_get_occupancy_mask():
+    date = ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")
+    assert date.is_occupancy_mask_exact() == True
+    assert (date.get_occupancy_mask() & ClassTime(DayOfWeek.MONDAY, TermDuration.EARLY_TERM, "10:30", "11:00", WeekSchedule.ODD_WEEK).get_occupancy_mask()) != 0
+    assert (date.get_occupancy_mask() & ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:35", "11:00").get_occupancy_mask()) == 0
+    assert (date.get_occupancy_mask() & ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35").get_occupancy_mask()) == 0
+    early_date = ClassTime(DayOfWeek.MONDAY, TermDuration.EARLY_TERM, "09:05", "10:35", WeekSchedule.EVEN_WEEK)
+    assert (early_date.get_occupancy_mask() & ClassTime(DayOfWeek.MONDAY, TermDuration.LATE_TERM, "09:05", "10:35").get_occupancy_mask()) == 0
+    assert (early_date.get_occupancy_mask() & ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35", WeekSchedule.ODD_WEEK).get_occupancy_mask()) == 0
+
+    # times that are not on a slot boundary are rounded outwards
+    inexact_date1 = ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "10:36")
+    inexact_date2 = ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:36", "11:00")
+    assert inexact_date1.is_occupancy_mask_exact() == False
+    assert (inexact_date1.get_occupancy_mask() & inexact_date2.get_occupancy_mask()) != 0
+    assert inexact_date1.does_date_overlap(inexact_date2) == False
@@ -1,9 +1,11 @@
 import pytest
 import boto3
+from unittest.mock import patch
 from botocore.stub import Stubber
 boto3.setup_default_session(region_name="us-east-1")
 from Backend.src.database.dynamo_database import DynamoDatabase
 from Backend.src.database.database_type import course_database
+from Backend.src.database.database_error import CouresDatabaseException
 from Backend.tests.unit.test_s3_database import generate_db
 
 test_term = "Fall 2023"
@@ -68,10 +70,31 @@ def test_create_db(monkeypatch):
     db2 = DynamoDatabase()
     assert db2.table_name == db2.prod_table_name
 
+test_query_response1 = {
+    "Items": [
+        {'Term': {'S': test_term}, 'Subject': {'S': 'ARCH 4505'}, 'LectureSectionIDs': {'L': [{'S': 'A'}]}}
+    ],
+    "LastEvaluatedKey": {'Term': {'S': test_term}, 'Subject': {'S': 'ARCH 4505'}}
+}
+
+test_query_response2 = {
+    "Items": [
+        {'Term': {'S': test_term}, 'Subject': {'S': 'SYSC 4001'}, 'LectureSectionIDs': {'L': [{'S': 'B'}]}},
+        {'Term': {'S': test_term}, 'Subject': {'S': 'SYSC 4002'}, 'LectureSectionIDs': {'L': []}}
+    ]
+}
+
 def test_get_course_code_and_section_list():
     stubber = Stubber(course_database.dynamodb)
-    stubber.add_response('scan', test_scan_response1)
-    stubber.add_response('scan', test_scan_response2)
+    query_params = {
+        'TableName': course_database.table_name,
+        'IndexName': 'TermIndex',
+        'KeyConditionExpression': '#term = :term',
+        'ExpressionAttributeNames': {'#term': 'Term'},
+        'ExpressionAttributeValues': {':term': {'S': test_term}}
+    }
+    stubber.add_response('query', test_query_response1, query_params)
+    stubber.add_response('query', test_query_response2, {**query_params, 'ExclusiveStartKey': test_query_response1['LastEvaluatedKey']})
 
     with stubber:
         result = course_database.get_course_code_and_section_list(test_term)
@@ -89,23 +112,72 @@ def test_get_terms():
     }
     assert db.get_terms() == expected_dict
 
+def get_batch_get_item_response(items: list, unprocessed_keys: list = []) -> dict:
+    response = {"Responses": {course_database.table_name: items}}
+    if unprocessed_keys:
+        response["UnprocessedKeys"] = {course_database.table_name: {"Keys": unprocessed_keys}}
+    return response
+
 def test_get_course():
     stubber = Stubber(course_database.dynamodb)
-    stubber.add_response('scan', {'Items': [], "LastEvaluatedKey": {'Key': {'S': 'TEST KEY'}}})
-    stubber.add_response('scan', test_scan_response2)
-    stubber.add_response('scan', {'Items': []})
-    stubber.add_response('scan', {'Items': [item for item in (test_scan_response1['Items'][0], test_scan_response2['Items'][0])]})
+    stubber.add_response('get_item', {'Item': test_scan_response2['Items'][0]}, {'TableName': course_database.table_name, 'Key': {'Subject': {'S': 'SYSC 4001'}, 'Term': {'S': test_term}}})
+    stubber.add_response('get_item', {})
 
     with stubber:
         course1 = course_database.get_course("SYSC 4001", test_term) # test valid case
         course2 = course_database.get_course("INVALID CODE", test_term) # test invalid case
-        course3 = course_database.get_course("ARCH 4505", test_term) # test case where duplicate course in database
 
     assert course1.code == "SYSC 4001"
     assert course1.term == test_term
     assert course1.section_id_filter == None
     assert course2 == None
-    assert course3.code == "ARCH 4505"
-    assert course3.term == test_term
-    assert course3.section_id_filter == None
 
+def test_get_courses():
+    sysc_key = {'Subject': {'S': 'SYSC 4001'}, 'Term': {'S': test_term}}
+    arch_key = {'Subject': {'S': 'ARCH 4505'}, 'Term': {'S': test_term}}
+    invalid_key = {'Subject': {'S': 'INVALID CODE'}, 'Term': {'S': test_term}}
+    stubber = Stubber(course_database.dynamodb)
+    stubber.add_response(
+        'batch_get_item', 
+        get_batch_get_item_response(test_scan_response2['Items'], [arch_key]), 
+        {'RequestItems': {course_database.table_name: {'Keys': [sysc_key, invalid_key, arch_key]}}}
+    )
+    stubber.add_response('batch_get_item', get_batch_get_item_response(test_scan_response1['Items']), {'RequestItems': {course_database.table_name: {'Keys': [arch_key]}}})
+
+    with stubber:
+        courses = course_database.get_courses(["SYSC 4001", "INVALID CODE", "ARCH 4505", "SYSC 4001"], test_term)
+        stubber.assert_no_pending_responses()
+        assert course_database.get_courses([], test_term) == {}
+
+    assert sorted(courses) == ["ARCH 4505", "SYSC 4001"]
+    assert courses["SYSC 4001"].code == "SYSC 4001"
+    assert courses["ARCH 4505"].term == test_term
+
+def test_get_courses_with_empty_codes():
+    sysc_key = {'Subject': {'S': 'SYSC 4001'}, 'Term': {'S': test_term}}
+    stubber = Stubber(course_database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(test_scan_response2['Items']), {'RequestItems': {course_database.table_name: {'Keys': [sysc_key]}}})
+
+    with stubber:
+        courses = course_database.get_courses(["", "SYSC 4001"], test_term)
+        assert course_database.get_courses([""], test_term) == {}
+        assert course_database.get_course("", test_term) is None
+        stubber.assert_no_pending_responses()
+
+    assert list(courses) == ["SYSC 4001"]
+
+@patch('Backend.src.database.dynamo_database.time.sleep')
+def test_get_courses_retry_limit(sleep_patch):
+    sysc_key = {'Subject': {'S': 'SYSC 4001'}, 'Term': {'S': test_term}}
+    stubber = Stubber(course_database.dynamodb)
+    for _ in range(DynamoDatabase.MAX_BATCH_RETRIES + 1):
+        stubber.add_response('batch_get_item', get_batch_get_item_response([], [sysc_key]))
+
+    with stubber:
+        with pytest.raises(CouresDatabaseException):
+            course_database.get_courses(["SYSC 4001"], test_term)
+        stubber.assert_no_pending_responses()
+
+    delays = [call.args[0] for call in sleep_patch.call_args_list]
+    assert len(delays) == DynamoDatabase.MAX_BATCH_RETRIES
+    assert max(delays) <= DynamoDatabase.MAX_BATCH_RETRY_DELAY
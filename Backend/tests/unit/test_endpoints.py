@@ -12,12 +12,17 @@ from Backend.src.model.term_duration import TermDuration
 from Backend.src import endpoints
 from Backend.src.database.database_type import course_database as database
 from Backend.src.database.database_error import CouresDatabaseException
-from Backend.tests.unit.test_dynamo_database import test_scan_response1 as response1, test_scan_response2 as response2
+from Backend.src.database.course_cache import course_cache
+from Backend.tests.unit.test_dynamo_database import test_scan_response2 as response2, get_batch_get_item_response, test_query_response1, test_query_response2
 from Backend.tests.unit.test_s3_database import generate_db
 
 TEST_TERM = "Fall 2023"
 SAMPLE_SCHEDULE = [[Section("SYSC 4001", "B", "35905", "Test Prof 2", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "08:35", "11:25")], "Registration Closed", "Operating Systems", TEST_TERM, "fourth-year standing.", [], "2023-09-06", "2023-12-08", "Online").to_dict()]]
 
+@pytest.fixture(autouse=True)
+def clear_course_cache():
+    course_cache.clear()
+
 @pytest.fixture()
 def empty_json_event():
     return {
@@ -54,6 +59,18 @@ def generate_schedules_with_invalid_filter_event():
         "body": f"{{\"Term\": \"{TEST_TERM}\", \"Filters\": {{\"BeforeTime\": \"INVALID\"}}, \"Courses\": [{{\"SectionFilter\":\"B\", \"Name\":\"SYSC 4001\"}}]}}"
     }
 
+@pytest.fixture()
+def generate_schedules_with_preference_event():
+    return {
+        "body": f"{{\"Term\": \"{TEST_TERM}\", \"Preference\": \"MinimizeDays\", \"Courses\": [{{\"SectionFilter\":\"B\", \"Name\":\"SYSC 4001\"}}]}}"
+    }
+
+@pytest.fixture()
+def generate_schedules_with_invalid_preference_event():
+    return {
+        "body": f"{{\"Term\": \"{TEST_TERM}\", \"Preference\": \"INVALID\", \"Courses\": [{{\"SectionFilter\":\"B\", \"Name\":\"SYSC 4001\"}}]}}"
+    }
+
 @pytest.fixture()
 def get_courses_without_term_event():
     return {
@@ -109,7 +126,7 @@ def test_generate_schedules_without_courses(no_courses_event):
 
 def test_generate_schedules_with_invalid_courses(generate_schedules_event):
     stubber = Stubber(database.dynamodb)
-    stubber.add_response('scan', {'Items': []})
+    stubber.add_response('batch_get_item', get_batch_get_item_response([]))
     
     with stubber:
         ret = endpoints.generate_schedules_lambda_handler(generate_schedules_event, "")
@@ -121,9 +138,22 @@ def test_generate_schedules_with_invalid_courses(generate_schedules_event):
     assert data["Error"] == True
     assert data["ErrorReason"] == f"Course SYSC 4001 does not exist for term {TEST_TERM}!"
 
+def test_generate_schedules_with_empty_course_name():
+    event = {"body": json.dumps({"Term": TEST_TERM, "Courses": [{"Name": " "}]})}
+    stubber = Stubber(database.dynamodb)
+
+    with stubber:
+        ret = endpoints.generate_schedules_lambda_handler(event, "")
+        stubber.assert_no_pending_responses()
+
+    data = json.loads(ret["body"])
+    assert ret["statusCode"] == 400
+    assert data["Error"] == True
+    assert data["ErrorReason"] == f"Course  does not exist for term {TEST_TERM}!"
+
 def test_generate_schedules_success(generate_schedules_event):
     stubber = Stubber(database.dynamodb)
-    stubber.add_response('scan', response2)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
     
     with stubber:
         ret = endpoints.generate_schedules_lambda_handler(generate_schedules_event, "")
@@ -138,10 +168,74 @@ def test_generate_schedules_success(generate_schedules_event):
     assert data["ErrorReason"] == ""
     assert data["Schedules"] == SAMPLE_SCHEDULE
     assert data["ReachedScheduleLimit"] == False
+    assert data["SearchTruncated"] == False
+    assert data["ScheduleCount"] == len(SAMPLE_SCHEDULE)
+    assert data["IsScheduleCountExact"] == True
+
+def test_generate_schedules_with_cached_course(generate_schedules_event, generate_schedules_with_filters_event):
+    stubber = Stubber(database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
+    
+    with stubber:
+        filtered_ret = endpoints.generate_schedules_lambda_handler(generate_schedules_with_filters_event, "")
+        ret = endpoints.generate_schedules_lambda_handler(generate_schedules_event, "")
+        stubber.assert_no_pending_responses()
+    
+    # The second request uses the cached course, which the filters of the first request did not change
+    assert json.loads(filtered_ret["body"])["Schedules"] == []
+    assert json.loads(ret["body"])["Schedules"] == SAMPLE_SCHEDULE
+
+@patch('Backend.src.endpoints.MAX_SEARCH_NODES', 0)
+def test_generate_schedules_with_truncated_search(generate_schedules_event):
+    stubber = Stubber(database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
+    context = mock.Mock()
+    context.get_remaining_time_in_millis.return_value = 10000
+    
+    with stubber:
+        ret = endpoints.generate_schedules_lambda_handler(generate_schedules_event, context)
+    
+    data = json.loads(ret["body"])
+    assert ret["statusCode"] == 200
+    assert data["Error"] == False
+    assert data["Schedules"] == []
+    assert data["ReachedScheduleLimit"] == False
+    assert data["SearchTruncated"] == True
+    assert data["ScheduleCount"] == len(SAMPLE_SCHEDULE)
+
+def test_generate_schedules_with_truncated_conflict_graph(generate_schedules_event):
+    stubber = Stubber(database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
+    context = mock.Mock()
+    context.get_remaining_time_in_millis.return_value = endpoints.SEARCH_RESERVED_MILLIS # no time left to build the conflict graph
+    
+    with stubber:
+        ret = endpoints.generate_schedules_lambda_handler(generate_schedules_event, context)
+    
+    data = json.loads(ret["body"])
+    assert ret["statusCode"] == 200
+    assert data["Error"] == False
+    assert data["Schedules"] == []
+    assert data["SearchTruncated"] == True
+    assert data["ScheduleCount"] == 0
+    assert data["IsScheduleCountExact"] == False
+
+def test_generate_schedules_counts_with_remaining_time(generate_schedules_event):
+    stubber = Stubber(database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
+    context = mock.Mock()
+    context.get_remaining_time_in_millis.return_value = endpoints.SEARCH_RESERVED_MILLIS + 10000
+    
+    with stubber, patch.object(endpoints, "count_schedules", wraps=endpoints.count_schedules) as mock_count_schedules:
+        ret = endpoints.generate_schedules_lambda_handler(generate_schedules_event, context)
+    
+    # Counting gets the time left before the deadline of the request instead of COUNT_TIME_BUDGET
+    assert 9 < mock_count_schedules.call_args.kwargs["time_budget"] <= 10
+    assert json.loads(ret["body"])["IsScheduleCountExact"] == True
 
 def test_generate_schedules_with_filters(generate_schedules_with_filters_event):
     stubber = Stubber(database.dynamodb)
-    stubber.add_response('scan', response2)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
     
     with stubber:
         ret = endpoints.generate_schedules_lambda_handler(generate_schedules_with_filters_event, "")
@@ -156,10 +250,29 @@ def test_generate_schedules_with_filters(generate_schedules_with_filters_event):
     assert data["ErrorReason"] == ""
     assert data["Schedules"] == []
     assert data["ReachedScheduleLimit"] == False
+    assert data["ScheduleCount"] == 0
+
+def test_generate_schedules_with_days_off():
+    def get_event(days_off: str) -> dict:
+        return {
+            "body": f"{{\"Term\": \"{TEST_TERM}\", \"Filters\": {{\"DaysOfWeek\": {days_off}}}, \"Courses\": [{{\"SectionFilter\":\"B\", \"Name\":\"SYSC 4001\"}}]}}"
+        }
+
+    stubber = Stubber(database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
+    with stubber:
+        ret1 = endpoints.generate_schedules_lambda_handler(get_event('["Mon", "Wed"]'), "")
+        ret2 = endpoints.generate_schedules_lambda_handler(get_event('["Mon", "Tue"]'), "")
+        ret3 = endpoints.generate_schedules_lambda_handler(get_event('["Mon", "INVALID"]'), "")
+    
+    assert json.loads(ret1["body"])["Schedules"] == SAMPLE_SCHEDULE
+    assert json.loads(ret2["body"])["Schedules"] == []
+    assert ret3["statusCode"] == 400
+    assert json.loads(ret3["body"])["ErrorReason"] == "One or more of the filters are formatted incorrectly!"
 
 def test_generate_schedules_with_empty_filters(generate_schedules_with_empty_filters_event):
     stubber = Stubber(database.dynamodb)
-    stubber.add_response('scan', response2)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
     
     with stubber:
         ret = endpoints.generate_schedules_lambda_handler(generate_schedules_with_empty_filters_event, "")
@@ -177,7 +290,7 @@ def test_generate_schedules_with_empty_filters(generate_schedules_with_empty_fil
 
 def test_generate_schedules_with_invalid_filters(generate_schedules_with_invalid_filter_event):
     stubber = Stubber(database.dynamodb)
-    stubber.add_response('scan', response2)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
     
     with stubber:
         ret = endpoints.generate_schedules_lambda_handler(generate_schedules_with_invalid_filter_event, "")
@@ -189,6 +302,32 @@ def test_generate_schedules_with_invalid_filters(generate_schedules_with_invalid
     assert data["Error"] == True
     assert data["ErrorReason"] == "One or more of the filters are formatted incorrectly!"
 
+def test_generate_schedules_with_preference(generate_schedules_with_preference_event):
+    stubber = Stubber(database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
+    
+    with stubber:
+        ret = endpoints.generate_schedules_lambda_handler(generate_schedules_with_preference_event, "")
+    
+    data = json.loads(ret["body"])
+    assert ret["statusCode"] == 200
+    assert data["Error"] == False
+    assert data["ErrorReason"] == ""
+    assert data["Schedules"] == SAMPLE_SCHEDULE
+    assert data["ReachedScheduleLimit"] == False
+
+def test_generate_schedules_with_invalid_preference(generate_schedules_with_invalid_preference_event):
+    stubber = Stubber(database.dynamodb)
+    stubber.add_response('batch_get_item', get_batch_get_item_response(response2['Items']))
+    
+    with stubber:
+        ret = endpoints.generate_schedules_lambda_handler(generate_schedules_with_invalid_preference_event, "")
+    
+    data = json.loads(ret["body"])
+    assert ret["statusCode"] == 400
+    assert data["Error"] == True
+    assert data["ErrorReason"] == "The Preference must be one of: MinimizeGaps, MinimizeDays, EarliestEnd, LatestStart, InPerson!"
+
 @mock.patch('Backend.src.database.dynamo_database.S3Database')
 def test_get_terms(mock_db_class):
     mock_db_class.return_value = generate_db() 
@@ -235,8 +374,8 @@ def test_get_courses_without_term(get_courses_without_term_event):
 
 def test_get_courses(get_courses_event):
     stubber = Stubber(database.dynamodb)
-    stubber.add_response('scan', response1)
-    stubber.add_response('scan', response2)
+    stubber.add_response('query', test_query_response1)
+    stubber.add_response('query', test_query_response2)
     
     with stubber:
         ret = endpoints.get_courses_lambda_handler(get_courses_event, "")
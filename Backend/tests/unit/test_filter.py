@@ -3,13 +3,18 @@ from Backend.src.model.filter import Filter
 from Backend.src.model.day_of_week import DayOfWeek
 from Backend.src.model.term_duration import TermDuration
 from Backend.src.model.date import ClassTime
+from Backend.src.model.section import Section
 
 def test_create_empty_filter():
     filter = Filter()
     assert filter.before_time == None
     assert filter.after_time == None
     assert filter.day_of_week == None
+    assert filter.days_of_week == []
     assert filter.between_times == []
+    assert filter.before_minutes == None
+    assert filter.after_minutes == None
+    assert filter.days_off == frozenset()
 
 def test_create_filter():
     classtime = ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "10:00", "14:00")
@@ -18,6 +23,13 @@ def test_create_filter():
     assert filter.after_time == "14:00"
     assert filter.day_of_week == DayOfWeek.MONDAY
     assert filter.between_times == [classtime]
+    assert filter.before_minutes == 9 * 60
+    assert filter.after_minutes == 14 * 60
+    assert filter.days_off == {DayOfWeek.MONDAY}
+
+    filter = Filter(day_of_week = DayOfWeek.MONDAY, days_of_week = [DayOfWeek.FRIDAY, DayOfWeek.MONDAY])
+    assert filter.days_of_week == [DayOfWeek.FRIDAY, DayOfWeek.MONDAY]
+    assert filter.days_off == {DayOfWeek.MONDAY, DayOfWeek.FRIDAY}
 
 def test_invalid_before_time():
     with pytest.raises(TypeError):
@@ -31,6 +43,31 @@ def test_invalid_day_of_week():
     with pytest.raises(TypeError):
         Filter(day_of_week = "MONDAY")
 
+def test_invalid_days_of_week():
+    with pytest.raises(TypeError):
+        Filter(days_of_week = DayOfWeek.MONDAY)
+    with pytest.raises(TypeError):
+        Filter(days_of_week = [DayOfWeek.MONDAY, "Fri"])
+
+def test_invalid_time_format():
+    with pytest.raises(ValueError):
+        Filter(before_time = "9am")
+
+def test_rejects():
+    section1 = Section("CODE1000", "A", "11111", "JON", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "22222", "JON", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "15:00", "18:00"), ClassTime(DayOfWeek.FRIDAY, TermDuration.EARLY_TERM, "15:00", "18:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE1000", "C", "33333", "JON", [], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    assert Filter().rejects(section1) == False
+    assert Filter(before_time = "09:30").rejects(section1) == True
+    assert Filter(before_time = "09:00").rejects(section1) == False
+    assert Filter(after_time = "17:00").rejects(section2) == True
+    assert Filter(after_time = "18:00").rejects(section2) == False
+    assert Filter(days_of_week = [DayOfWeek.WEDNESDAY, DayOfWeek.FRIDAY]).rejects(section2) == True
+    assert Filter(days_of_week = [DayOfWeek.WEDNESDAY, DayOfWeek.FRIDAY]).rejects(section1) == False
+    assert Filter(between_times = [ClassTime(DayOfWeek.FRIDAY, TermDuration.LATE_TERM, "14:00", "16:00")]).rejects(section2) == False
+    assert Filter(between_times = [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "14:00", "16:00")]).rejects(section2) == True
+    assert Filter(before_time = "23:00", days_of_week = list(DayOfWeek)).rejects(section3) == False
+
 def test_invalid_between_times():
     with pytest.raises(TypeError):
         Filter(between_times = "MONDAY")
@@ -0,0 +1,101 @@
+import multiprocessing
+from unittest.mock import patch
+from Backend.src import scheduler, parallel_scheduler
+from Backend.src.parallel_scheduler import generate_schedules_parallel
+from Backend.src.model.section import Section
+from Backend.src.model.course import Course
+from Backend.src.model.conflict_graph import ConflictGraph
+from Backend.src.model.date import ClassTime
+from Backend.src.model.day_of_week import DayOfWeek
+from Backend.src.model.term_duration import TermDuration
+
+def get_courses():
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2A = Section("CODE1000", "L1", "12345", "Alice", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    section2B = Section("CODE1000", "L2", "12345", "Alice", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:35", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section4 = Section("CODE2000", "B", "22223", "Bob", [ClassTime(DayOfWeek.THURSDAY, TermDuration.FULL_TERM, "09:35", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section5 = Section("CODE2000", "C", "22224", "Bob", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "09:35", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [section2A, section2B], None)
+    course2 = Course("CODE2000", "TESTCLASS", "Fall 2023", "NONE", [section3, section4, section5], [], None)
+    return [course1, course2]
+
+def test_generate_schedules_parallel():
+    '''
+    Tests that generateSchedulesParallel finds the same schedules, in the same order, as iterSchedules
+    '''
+    courses = get_courses()
+    expected_schedules = list(scheduler.iter_schedules(courses))
+    assert len(expected_schedules) == 8
+    assert generate_schedules_parallel(courses, 100, max_workers=2) == (expected_schedules, False)
+    assert generate_schedules_parallel(courses, 3, max_workers=2) == (expected_schedules[:3], True)
+    assert generate_schedules_parallel(courses, 8, max_workers=2) == (expected_schedules, True)
+    assert generate_schedules_parallel(courses, 100, max_workers=2, order_courses=False) == (list(scheduler.iter_schedules(courses, order_courses=False)), False)
+
+def test_generate_schedules_parallel_without_process_pool():
+    courses = get_courses()
+    expected_schedules = list(scheduler.iter_schedules(courses))
+    with patch('concurrent.futures.ProcessPoolExecutor', side_effect=OSError()):
+        assert generate_schedules_parallel(courses, 5, max_workers=2) == (expected_schedules[:5], True)
+
+def test_generate_schedules_parallel_without_schedules():
+    courses = get_courses()
+    assert generate_schedules_parallel([], 5) == ([[]], False)
+    assert generate_schedules_parallel(courses, 0) == ([], True)
+    assert generate_schedules_parallel(courses + [Course("CODE3000", "TESTCLASS", "Fall 2023", "NONE", [], [], None)], 5) == ([], False)
+
+def get_dead_end_courses():
+    '''
+    Gets courses where every choice of the first course leads to a subtree of dead ends: 3 courses share 2 time 
+    slots, which is only found out once 2 of them are placed, after the 3 ** 4 combinations of the other courses.
+    '''
+    def section(course_code: str, section_id: str, day: DayOfWeek, start_time: str, end_time: str) -> Section:
+        return Section(course_code, section_id, "11111", "Alice", [ClassTime(day, TermDuration.FULL_TERM, start_time, end_time)], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+
+    courses = [
+        Course(f"CODE{i}000", "TESTCLASS", "Fall 2023", "NONE", [section(f"CODE{i}000", "A", DayOfWeek.MONDAY, "09:05", "09:55"), section(f"CODE{i}000", "B", DayOfWeek.MONDAY, "10:05", "10:55")], [], None)
+        for i in range(1, 4)
+    ]
+    courses += [
+        Course(f"CODE{i}000", "TESTCLASS", "Fall 2023", "NONE", [section(f"CODE{i}000", section_id, day, f"1{i}:05", f"1{i}:55") for section_id, day in zip("ABC", [DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY, DayOfWeek.THURSDAY])], [], None)
+        for i in range(4, 8)
+    ]
+    # Courses are placed starting from the last one in the list
+    return courses + [Course("CODE8000", "TESTCLASS", "Fall 2023", "NONE", [section("CODE8000", "A", DayOfWeek.FRIDAY, "09:05", "09:55"), section("CODE8000", "B", DayOfWeek.FRIDAY, "10:05", "10:55")], [], None)]
+
+def test_search_subtree_of_dead_ends_stops():
+    '''
+    Tests that a worker stops searching a subtree without schedules once the subtrees before it have reached the limit
+    '''
+    conflict_graph = scheduler.get_conflict_graph(get_dead_end_courses(), order_courses=False)
+    counts = multiprocessing.Array('i', [0, 0])
+    parallel_scheduler._init_worker(conflict_graph, 1, counts)
+
+    is_subtree_needed = parallel_scheduler._is_subtree_needed
+    def is_subtree_needed_after_search_starts(index: int, found: int) -> bool:
+        needed = is_subtree_needed(index, found)
+        counts[0] = 1 # another worker finds a schedule in the first subtree once the search has started
+        return needed
+
+    with patch.object(parallel_scheduler, "CHECK_INTERVAL", 10), patch.object(parallel_scheduler, "search_options", wraps=scheduler.search_options) as mock_search_options:
+        assert parallel_scheduler._search_subtree(1, 1) == []
+        assert mock_search_options.call_args.args[4].nodes > 100
+
+        with patch.object(parallel_scheduler, "_is_subtree_needed", side_effect=is_subtree_needed_after_search_starts):
+            assert parallel_scheduler._search_subtree(1, 1) == []
+        budget = mock_search_options.call_args.args[4]
+        assert budget.is_exhausted == True
+        assert budget.nodes == 10
+
+def test_search_subtree_counts_schedules_as_they_are_found():
+    courses = get_courses()
+    conflict_graph = scheduler.get_conflict_graph(courses)
+    first_ordinals = list(ConflictGraph.iter_ordinals(conflict_graph.domains[0]))
+    counts = multiprocessing.Array('i', [0] * len(first_ordinals))
+    parallel_scheduler._init_worker(conflict_graph, 1, counts)
+
+    results = parallel_scheduler._search_subtree(0, first_ordinals[0])
+    assert len(results) == 1 # the subtree has more schedules, but only the limit is needed
+    assert counts[:] == [1] + [0] * (len(first_ordinals) - 1)
+    assert parallel_scheduler._search_subtree(1, first_ordinals[1]) == []
@@ -0,0 +1,77 @@
+import pytest
+from Backend.src import ranking, scheduler
+from Backend.src.model.course import Course
+from Backend.src.model.section import Section
+from Backend.src.model.date import ClassTime
+from Backend.src.model.day_of_week import DayOfWeek
+from Backend.src.model.term_duration import TermDuration
+from Backend.src.model.schedule_preference import SchedulePreference
+
+SECTION1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:25"), ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:05", "10:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08", "In person")
+SECTION2 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.EARLY_TERM, "13:05", "14:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08", "Online")
+SECTION3 = Section("CODE3000", "A", "33333", "Charlie", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "11:05", "12:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08", "In person")
+
+def test_get_gap_minutes():
+    assert ranking.get_gap_minutes([]) == 0
+    assert ranking.get_gap_minutes([SECTION1]) == 0
+    # 160 minute gap in the early term only
+    assert ranking.get_gap_minutes([SECTION1, SECTION2]) == 160
+    # 40 minute gap in both halves of the term, plus 40 more in the early term
+    assert ranking.get_gap_minutes([SECTION1, SECTION2, SECTION3]) == 40 + 40 + 40
+
+def test_get_schedule_cost():
+    schedule = [SECTION1, SECTION2]
+    assert ranking.get_schedule_cost(schedule, SchedulePreference.MINIMIZE_GAPS) == 160
+    assert ranking.get_schedule_cost(schedule, SchedulePreference.MINIMIZE_DAYS) == 2
+    assert ranking.get_schedule_cost(schedule, SchedulePreference.EARLIEST_END) == 14 * 60 + 25
+    assert ranking.get_schedule_cost(schedule, SchedulePreference.LATEST_START) == -(9 * 60 + 5)
+    assert ranking.get_schedule_cost(schedule, SchedulePreference.IN_PERSON) == 1
+
+    with pytest.raises(ValueError):
+        ranking.get_schedule_cost(schedule, None)
+
+def test_day_gaps():
+    day_gaps = ranking.DayGaps([SECTION1])
+    assert day_gaps.total == 0
+
+    day_gaps.add(list(ranking.iter_day_half_intervals([SECTION2])))
+    assert day_gaps.total == 160
+    day_gaps.add(list(ranking.iter_day_half_intervals([SECTION3])))
+    assert day_gaps.total == ranking.get_gap_minutes([SECTION1, SECTION2, SECTION3])
+
+    day_gaps.remove(list(ranking.iter_day_half_intervals([SECTION3])))
+    assert day_gaps.total == 160
+    day_gaps.remove(list(ranking.iter_day_half_intervals([SECTION2])))
+    assert day_gaps.total == 0
+    assert day_gaps.gaps == [0] * ranking.DAY_HALVES
+
+def test_schedule_costs():
+    course2 = Course("CODE2000", "CLASS TITLE", "TERM", "NONE", [SECTION2], [], None)
+    course3 = Course("CODE3000", "CLASS TITLE", "TERM", "NONE", [SECTION3], [], None)
+    conflict_graph = scheduler.get_conflict_graph([course2, course3], order_courses=False)
+
+    # Online sections are added by the remaining courses even before they are placed
+    costs = ranking.ScheduleCosts(conflict_graph, SchedulePreference.IN_PERSON)
+    assert costs.get_lower_bound(0, conflict_graph.domains) == 1
+    costs.place(0)
+    assert costs.get_cost() == 0
+    costs.place(1)
+    assert costs.get_cost() == costs.get_lower_bound(2, []) == 1
+    costs.remove(1)
+    costs.remove(0)
+    assert costs.get_cost() == 0
+
+    costs = ranking.ScheduleCosts(conflict_graph, SchedulePreference.MINIMIZE_DAYS)
+    assert costs.get_lower_bound(0, conflict_graph.domains) == 1
+    costs.place(0)
+    assert costs.get_cost() == 1
+
+    # SECTION3 can fill at most 80 minutes of the 160 minute gap in the early term
+    conflict_graph = scheduler.get_conflict_graph([course3], [SECTION1, SECTION2])
+    costs = ranking.ScheduleCosts(conflict_graph, SchedulePreference.MINIMIZE_GAPS)
+    assert costs.get_cost() == 160
+    assert costs.get_lower_bound(0, conflict_graph.domains) == 80
+    costs.place(0)
+    assert costs.get_cost() == costs.get_lower_bound(1, []) == 40 + 40 + 40
+    costs.remove(0)
+    assert costs.get_cost() == 160
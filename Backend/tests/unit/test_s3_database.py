@@ -1,6 +1,11 @@
 import pytest
 from unittest.mock import patch, Mock
+from botocore.exceptions import ClientError
 import boto3
+import gzip
+import io
+import time
+import json
 boto3.setup_default_session(region_name="us-east-1")
 from Backend.src.database.s3_database import S3Database
 
@@ -26,27 +31,137 @@ TERMS_DICT = {
 }
 TERMS_COURSES_DICT = {"Fall 2023": ["AERO 2001", "AERO 2001 A"]}
 
-@patch('boto3.resource')
-@patch('json.load')
-def generate_db(mock_json_file, mock_boto3_resource) -> S3Database:
-    mock_boto3_resource.return_value = Mock()
-    mock_json_file.side_effect = [CLASSES_DICT, TERMS_DICT, TERMS_COURSES_DICT]
-    mock_s3_object = Mock()
-    mock_boto3_resource.return_value.Object.return_value = mock_s3_object
-    mock_s3_object.get.return_value = {'Body': mock_json_file}
-    
-    return S3Database()
+FILES = {
+    "web-scraping-stepfunction/classes/Fall 2023.json": CLASSES_DICT,
+    "web-scraping-stepfunction/terms.json": TERMS_DICT,
+    "web-scraping-stepfunction/terms_courses.json": TERMS_COURSES_DICT
+}
+
+def get_s3_object(files: dict, key: str, content_encoding: str = "", etags: dict = {}) -> Mock:
+    '''
+    Mocks an s3 object of the files (the ETag of a file is its key, unless it is in etags).
+    '''
+    def get(IfNoneMatch: str | None = None) -> dict:
+        if key not in files:
+            raise ClientError({'Error': {'Code': 'NoSuchKey'}}, 'GetObject')
+        etag = etags.get(key, f'"{key}"')
+        if IfNoneMatch == etag:
+            raise ClientError({'Error': {'Code': '304'}}, 'GetObject')
+
+        body = files[key] if isinstance(files[key], bytes) else json.dumps(files[key]).encode("UTF-8")
+        if content_encoding == "gzip":
+            body = gzip.compress(body)
+        return {'Body': io.BytesIO(body), 'ETag': etag, 'ContentEncoding': content_encoding}
+
+    s3_object = Mock()
+    s3_object.get.side_effect = get
+    return s3_object
+
+def generate_db(files: dict = FILES, prefetch: bool = True, content_encoding: str = "", etags: dict = {}) -> S3Database:
+    with patch('boto3.resource') as mock_boto3_resource:
+        mock_boto3_resource.return_value.Object.side_effect = lambda bucket_name, key: get_s3_object(files, key, content_encoding, etags)
+        return S3Database(prefetch)
+
+def wait_for_refreshes(db: S3Database) -> None:
+    for refresh in list(db.refreshes.values()):
+        refresh.result()
+
+def get_downloaded_keys(db: S3Database) -> list:
+    return sorted(call.args[1] for call in db.s3.Object.call_args_list)
 
 def test_create_db(monkeypatch):
     monkeypatch.setenv("aws_test_db_access_key_id", "test_id") 
     monkeypatch.setenv("aws_test_db_secret_access_key", "test_secret")
     db1 = generate_db()
-    assert db1.classes_dict == CLASSES_DICT
+    assert db1.get_terms() == TERMS_DICT
     
     monkeypatch.delenv("aws_test_db_access_key_id") 
     monkeypatch.delenv("aws_test_db_secret_access_key")
     db2 = generate_db()
-    assert db2.classes_dict == CLASSES_DICT
+    assert db2.get_terms() == TERMS_DICT
+
+def test_lazy_loading():
+    db = generate_db()
+    assert db.get_terms() == TERMS_DICT
+    assert get_downloaded_keys(db) == ["web-scraping-stepfunction/terms.json", "web-scraping-stepfunction/terms_courses.json"]
+
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+    assert db.get_course("AERO 2001", "Winter 1999") == None
+    assert get_downloaded_keys(db).count("web-scraping-stepfunction/classes/Fall 2023.json") == 1
+    assert get_downloaded_keys(db).count("web-scraping-stepfunction/terms_courses.json") == 1
+    assert "web-scraping-stepfunction/classes/Winter 1999.json" not in db.files # terms that do not exist are not kept
+
+    db = generate_db(prefetch=False)
+    assert db.get_terms() == TERMS_DICT
+    assert get_downloaded_keys(db) == ["web-scraping-stepfunction/terms.json"]
+
+def test_refresh(monkeypatch):
+    files, etags = dict(FILES), {}
+    db = generate_db(files, etags=etags)
+    monkeypatch.setattr(db, "refresh_seconds", 60)
+    start = time.monotonic()
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+    assert db.get_data_version(test_term) == '"web-scraping-stepfunction/classes/Fall 2023.json"'
+
+    # Files that have not changed are not downloaded again
+    with patch('Backend.src.database.s3_database.time.monotonic', return_value=start + 61):
+        assert db.get_terms() == TERMS_DICT
+        wait_for_refreshes(db)
+    assert get_downloaded_keys(db).count("web-scraping-stepfunction/terms.json") == 2
+    assert db.get_terms() == TERMS_DICT
+
+    # Files that changed are replaced once they are downloaded (the loaded file is used until then)
+    new_classes = {f"AERO 2002-{test_term}": {**CLASSES_DICT[f"AERO 2001-{test_term}"], "Subject": "AERO 2002"}}
+    files["web-scraping-stepfunction/classes/Fall 2023.json"] = new_classes
+    etags["web-scraping-stepfunction/classes/Fall 2023.json"] = '"NEW VERSION"'
+    with patch('Backend.src.database.s3_database.time.monotonic', return_value=start + 122):
+        assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+        wait_for_refreshes(db)
+        assert db.get_course("AERO 2001", test_term) == None
+        assert db.get_course("AERO 2002", test_term).code == "AERO 2002"
+        assert db.get_data_version(test_term) == '"NEW VERSION"'
+        assert db.get_cached_course("AERO 2002", test_term) is not None
+
+    # Files that cannot be checked keep being used
+    del files["web-scraping-stepfunction/terms.json"]
+    with patch('Backend.src.database.s3_database.time.monotonic', return_value=start + 183):
+        assert db.get_terms() == TERMS_DICT
+        wait_for_refreshes(db)
+        assert db.get_terms() == TERMS_DICT
+
+def test_refresh_disabled(monkeypatch):
+    db = generate_db()
+    monkeypatch.setattr(db, "refresh_seconds", 0)
+    assert db.get_terms() == TERMS_DICT
+    with patch('Backend.src.database.s3_database.time.monotonic', return_value=time.monotonic() + 10 ** 6):
+        assert db.get_terms() == TERMS_DICT
+    assert db.refreshes == {}
+
+def test_compressed_files():
+    db = generate_db(content_encoding="gzip")
+    assert db.get_terms() == TERMS_DICT
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+
+    db = generate_db(content_encoding="br")
+    with pytest.raises(ValueError):
+        db.get_terms()
+
+def test_load_json_errors():
+    files = {"web-scraping-stepfunction/terms_courses.json": TERMS_COURSES_DICT, "web-scraping-stepfunction/classes.json": CLASSES_DICT}
+    db = generate_db(files)
+    with pytest.raises(ClientError):
+        db.get_terms()
+    with pytest.raises(ClientError):
+        db.get_terms()
+    assert get_downloaded_keys(db).count("web-scraping-stepfunction/terms.json") == 2 # failed downloads are retried
+
+    # Falls back to the classes of every term until the file of each term is written
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+    assert db.get_course("AERO 2001", test_term).code == "AERO 2001"
+    assert get_downloaded_keys(db).count("web-scraping-stepfunction/classes/Fall 2023.json") == 1
+    assert get_downloaded_keys(db).count("web-scraping-stepfunction/classes.json") == 1
+    assert db.get_data_version(test_term) == '"web-scraping-stepfunction/classes.json"'
 
 def test_get_course_code_and_section_list():
     db = generate_db()
@@ -77,3 +192,42 @@ def test_get_course():
     assert course2 == None
     
 
+
+def test_get_data_version():
+    db = generate_db()
+    assert db.get_data_version(test_term) == '"web-scraping-stepfunction/classes/Fall 2023.json"'
+    assert db.get_data_version("Winter 1999") == ""
+
+def test_get_cached_course():
+    db = generate_db()
+    code = "AERO 2001"
+    with patch.object(S3Database, 'get_course', wraps=db.get_course) as mock_get_course:
+        course1 = db.get_cached_course(code, test_term)
+        course2 = db.get_cached_course(code, test_term)
+        assert db.get_cached_course(code, "Winter 1999") == None
+        assert db.get_cached_course(code, "Winter 1999") == None
+
+    assert course1.code == code
+    assert course2 is course1
+    assert mock_get_course.call_count == 3 # courses that do not exist are not cached
+
+    with patch.object(S3Database, 'get_data_version', return_value="NEW VERSION"):
+        assert db.get_cached_course(code, test_term) is not course1
+
+def test_get_courses():
+    db = generate_db()
+    courses = db.get_courses(["AERO 2001", "INVALID CODE"], test_term)
+    assert list(courses) == ["AERO 2001"]
+    assert courses["AERO 2001"].code == "AERO 2001"
+    assert db.get_courses(["AERO 2001"], "Winter 1999") == {}
+
+def test_get_cached_courses():
+    db = generate_db()
+    with patch.object(S3Database, 'get_courses', wraps=db.get_courses) as mock_get_courses:
+        course = db.get_cached_course("AERO 2001", test_term)
+        courses = db.get_cached_courses(["AERO 2001", "INVALID CODE"], test_term)
+        assert db.get_cached_courses(["AERO 2001"], test_term) == courses
+
+    assert courses == {"AERO 2001": course}
+    assert courses["AERO 2001"] is course
+    mock_get_courses.assert_called_once_with(["INVALID CODE"], test_term)
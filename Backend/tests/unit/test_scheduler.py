@@ -1,10 +1,15 @@
-import pytest
+import itertools
+from unittest.mock import patch
 from Backend.src import scheduler
 from Backend.src.model.section import Section
 from Backend.src.model.course import Course
+from Backend.src.model.course_option import CourseOption
 from Backend.src.model.date import ClassTime
 from Backend.src.model.day_of_week import DayOfWeek
 from Backend.src.model.term_duration import TermDuration
+from Backend.src.model.schedule_preference import SchedulePreference
+from Backend.src.model.search_budget import SearchBudget
+from Backend.src.ranking import get_schedule_cost
 
 def test_is_section_schedulable():
     '''
@@ -48,34 +53,6 @@ def test_do_section_times_overlap():
     assert scheduler.do_section_times_overlap([section2, section3, section4]) == False
     assert scheduler.do_section_times_overlap([section1]) == False
 
-def test_get_related_section_combinations():
-    section1 = Section("CODE1000", "A", "11111", "Alice", [], "", "TITLE", "TERM", "NONE", [["B"], ["C", "D"]], "2023-09-06", "2023-12-08")
-    section2 = Section("CODE2000", "B", "22222", "Bob", [], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
-    section3 = Section("CODE3000", "C", "33333", "Charlie", [], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
-    section4 = Section("CODE3000", "D", "33333", "Charlie", [], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
-    course = Course("", "", "", "", [section1], [section2, section3, section4], "")
-    assert scheduler.get_related_section_combinations(course, section1) == [[section2, section3], [section2, section4]]
-
-    section1.related_section_ids = [["B", "C", "D"]]
-    assert scheduler.get_related_section_combinations(course, section1) == [[section2], [section3], [section4]]
-
-    section1.related_section_ids = [["B"], ["C"], ["D"]]
-    assert scheduler.get_related_section_combinations(course, section1) == [[section2, section3, section4]]
-
-    section1.related_section_ids = [["B", "C", "E"]]
-    assert scheduler.get_related_section_combinations(course, section1) == [[section2], [section3], [None]]
-
-    with pytest.raises(ValueError):    
-        scheduler.get_related_section_combinations(None, section1)
-    
-    section1.related_section_ids = []
-    with pytest.raises(ValueError):
-        scheduler.get_related_section_combinations(course, section1)
-    with pytest.raises(ValueError):    
-        scheduler.get_related_section_combinations(course, None)
-
-
-
 def test_can_take_together():
     '''
     Testing if a lecture and lab section are compatible to take together
@@ -209,3 +186,245 @@ def test_generate_schedules_with_lab_and_tutorials():
        section4, section1, section2C, section2A
     ]
     assert scheduler.generate_schedules([course1, course2]) == ([expected_schedule1, expected_schedule2], False)
+
+def test_get_course_options():
+    '''
+    Tests that getCourseOptions only returns lecture/related section combinations that fit the current schedule
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2", "L3"]], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2A = Section("CODE1000", "L1", "12345", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "CLASS TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    section2B = Section("CODE1000", "L2", "12345", "Alice", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "19:05", "20:35")], "", "CLASS TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE4000", "D", "44444", "Dom", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [section2A, section2B], None)
+
+    options = scheduler.get_course_options(course, CourseOption.from_sections([]))
+    assert [option.sections for option in options] == [(section1, section2B), (section2,)]
+
+    options = scheduler.get_course_options(course, CourseOption.from_sections([section3]))
+    assert [option.sections for option in options] == [(section1, section2B)]
+
+def test_generate_schedules_with_no_possible_schedules():
+    '''
+    Tests that generateSchedules stops early when a course has no options that fit with the others
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:05", "11:35"), ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section4 = Section("CODE3000", "A", "33333", "Charlie", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [], None)
+    course2 = Course("CODE2000", "TESTCLASS", "Fall 2023", "NONE", [section3], [], None)
+    course3 = Course("CODE3000", "TESTCLASS", "Fall 2023", "NONE", [section4], [], None)
+    assert scheduler.generate_schedules([course1, course2, course3]) == ([], False)
+    assert scheduler.generate_schedules([course1, course3]) == ([[section4, section1], [section4, section2]], False)
+    assert scheduler.generate_schedules([course1, Course("CODE4000", "TESTCLASS", "Fall 2023", "NONE", [], [], None)]) == ([], False)
+
+def test_order_domains():
+    '''
+    Tests that orderDomains puts the courses with the fewest options (and then the most meeting minutes) first
+    '''
+    short_option = scheduler.CourseOption.from_sections([Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    long_option = scheduler.CourseOption.from_sections([Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:05", "11:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    assert short_option.get_meeting_minutes() == 50
+    assert scheduler.order_domains([[short_option, long_option], [short_option], [long_option]]) == [2, 1, 0]
+    assert scheduler.order_domains([[short_option], [short_option, long_option]]) == [0, 1]
+
+def test_generate_schedules_without_ordering_courses():
+    '''
+    Tests that ordering the courses does not change the schedules found or the order of their sections
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section4 = Section("CODE2000", "B", "22223", "Bob", [ClassTime(DayOfWeek.THURSDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section5 = Section("CODE3000", "A", "33333", "Charlie", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "10:05", "11:35")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [], None)
+    course2 = Course("CODE2000", "TESTCLASS", "Fall 2023", "NONE", [section3, section4], [], None)
+    course3 = Course("CODE3000", "TESTCLASS", "Fall 2023", "NONE", [section5], [], None)
+    unordered_schedules, _ = scheduler.generate_schedules([course1, course3, course2], order_courses=False)
+    ordered_schedules, _ = scheduler.generate_schedules([course1, course3, course2])
+    assert unordered_schedules == [
+        [section3, section5, section1], [section3, section5, section2], 
+        [section4, section5, section1], [section4, section5, section2]
+    ]
+    assert sorted(ordered_schedules, key=str) == sorted(unordered_schedules, key=str)
+
+def test_iter_schedules():
+    '''
+    Tests that iterSchedules yields the same schedules as generateSchedules, one at a time
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2A = Section("CODE1000", "L1", "12345", "Alice", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    section2B = Section("CODE1000", "L2", "12345", "Alice", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "19:05", "20:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [section2A, section2B], None)
+
+    schedules = scheduler.iter_schedules([course1])
+    assert next(schedules) == [section1, section2A]
+    assert next(schedules) == [section1, section2B]
+    assert list(schedules) == [[section2, section2A], [section2, section2B]]
+    assert list(scheduler.iter_schedules([course1], [section2B])) == [[section2B, section1, section2A], [section2B, section2, section2A]]
+    assert list(scheduler.iter_schedules([])) == [[]]
+
+    max_schedules = scheduler.MAX_SCHEDULES
+    scheduler.MAX_SCHEDULES = 3
+    assert scheduler.generate_schedules([course1]) == ([[section1, section2A], [section1, section2B], [section2, section2A]], True)
+    scheduler.MAX_SCHEDULES = max_schedules # reset constant
+
+def test_generate_schedules_with_budget():
+    '''
+    Tests that generateSchedules returns the schedules found before the search budget ran out
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2A = Section("CODE1000", "L1", "12345", "Alice", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    section2B = Section("CODE1000", "L2", "12345", "Alice", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "19:05", "20:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.THURSDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [section2A, section2B], None)
+    course2 = Course("CODE2000", "TESTCLASS", "Fall 2023", "NONE", [section3], [], None)
+
+    # The single option of CODE2000 is tried first (1 node), then each option of CODE1000 (1 node each)
+    budget = SearchBudget(max_nodes=3)
+    assert scheduler.generate_schedules([course1, course2], budget=budget) == ([[section3, section1, section2A], [section3, section1, section2B]], False)
+    assert budget.is_exhausted == True
+
+    budget = SearchBudget(max_nodes=5)
+    assert scheduler.generate_schedules([course1, course2], budget=budget) == (list(scheduler.iter_schedules([course1, course2])), False)
+    assert budget.is_exhausted == False
+
+    budget = SearchBudget(max_nodes=2)
+    assert scheduler.generate_schedules([course1, course2], preference=SchedulePreference.LATEST_START, budget=budget) == ([[section3, section1, section2A]], False)
+    assert budget.is_exhausted == True
+
+def test_count_schedules():
+    '''
+    Tests that countSchedules counts the schedules iterSchedules generates, including when the masks are not exact
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:05", "10:37")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section2A = Section("CODE1000", "L1", "12345", "Alice", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:05", "10:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    section2B = Section("CODE1000", "L2", "12345", "Alice", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "19:05", "20:35")], "", "CLASS TITLE", "TERM", "NONE", [["A", "B"]], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "10:37", "11:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section4 = Section("CODE2000", "B", "22223", "Bob", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section5 = Section("CODE3000", "A", "33333", "Charlie", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section6 = Section("CODE3000", "B", "33334", "Charlie", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "11:05", "12:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [section2A, section2B], None)
+    course2 = Course("CODE2000", "TESTCLASS", "Fall 2023", "NONE", [section3, section4], [], None)
+    course3 = Course("CODE3000", "TESTCLASS", "Fall 2023", "NONE", [section5, section6], [], None)
+
+    for courses, current_schedule in [([course1, course2, course3], []), ([course1, course2, course3], [section2B]), ([course1, course2], [section5]), ([course3], [])]:
+        schedule_count = len(list(scheduler.iter_schedules(courses, current_schedule)))
+        assert scheduler.count_schedules(courses, current_schedule) == (schedule_count, True)
+    assert scheduler.count_schedules([course1, course2, course3]) == (7, True)
+    assert scheduler.count_schedules([]) == (1, True)
+    assert scheduler.count_schedules([course2], [section3, section4]) == (0, True)
+
+def test_count_schedules_with_time_budget():
+    '''
+    Tests that countSchedules returns a lower bound when it runs out of time
+    '''
+    courses = [
+        Course(f"CODE{i}000", "TESTCLASS", "Fall 2023", "NONE", [
+            Section(f"CODE{i}000", section_id, "11111", "Alice", [ClassTime(day, TermDuration.FULL_TERM, f"1{i}:05", f"1{i}:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+            for section_id, day in zip("ABCDE", DayOfWeek)
+        ], [], None)
+        for i in range(4)
+    ]
+    assert scheduler.count_schedules(courses) == (5 ** 4, True)
+
+    check_interval = scheduler.COUNT_CHECK_INTERVAL
+    scheduler.COUNT_CHECK_INTERVAL = 1
+    with patch.object(scheduler.time, "monotonic", side_effect=itertools.count()):
+        schedule_count, is_exact = scheduler.count_schedules(courses, time_budget=0.5)
+    scheduler.COUNT_CHECK_INTERVAL = check_interval # reset constant
+    assert is_exact == False
+    assert schedule_count < 5 ** 4
+
+def test_schedules_of_truncated_conflict_graph():
+    '''
+    Tests that the searches return nothing (and the count is not exact) when building the conflict graph runs out of budget
+    '''
+    courses = [
+        Course(f"CODE{i}000", "TESTCLASS", "Fall 2023", "NONE", [
+            Section(f"CODE{i}000", section_id, "11111", "Alice", [ClassTime(day, TermDuration.FULL_TERM, f"1{i}:05", f"1{i}:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+            for section_id, day in zip("ABCDE", DayOfWeek)
+        ], [], None)
+        for i in range(4)
+    ]
+    budget = SearchBudget(deadline=0)
+    conflict_graph = scheduler.get_conflict_graph(courses, budget=budget)
+    assert conflict_graph.is_truncated == True
+    assert scheduler.generate_schedules(courses, budget=budget, conflict_graph=conflict_graph) == ([], False)
+    assert scheduler.count_schedules(courses, conflict_graph=conflict_graph) == (0, False)
+    assert scheduler.get_conflict_graph(courses, budget=SearchBudget(deadline=float("inf"))).is_truncated == False
+
+def test_rank_schedules():
+    '''
+    Tests that rankSchedules returns the best schedules for a preference
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "08:35", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08", "Online")
+    section2 = Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "13:05", "14:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08", "In person")
+    section3 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08", "In person")
+    section4 = Section("CODE2000", "B", "22223", "Bob", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08", "In person")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1, section2], [], None)
+    course2 = Course("CODE2000", "TESTCLASS", "Fall 2023", "NONE", [section3, section4], [], None)
+
+    assert scheduler.rank_schedules([course1, course2], SchedulePreference.MINIMIZE_DAYS, 2) == [[section3, section2], [section4, section1]]
+    assert scheduler.rank_schedules([course1, course2], SchedulePreference.MINIMIZE_GAPS, 4)[2:] == [[section4, section1], [section3, section2]]
+    assert scheduler.rank_schedules([course1, course2], SchedulePreference.LATEST_START, 1) == [[section3, section2]]
+    assert scheduler.rank_schedules([course1, course2], SchedulePreference.EARLIEST_END, 1) == [[section3, section1]]
+    assert scheduler.rank_schedules([course1, course2], SchedulePreference.IN_PERSON, 4)[:2] == [[section3, section2], [section4, section2]]
+    assert scheduler.rank_schedules([course1, course2], SchedulePreference.IN_PERSON, 0) == []
+
+    # The bounds never skip a schedule that is better than the ones returned
+    schedules = list(scheduler.iter_schedules([course1, course2]))
+    for preference in SchedulePreference:
+        for limit in range(1, len(schedules) + 1):
+            ranked_costs = [get_schedule_cost(schedule, preference) for schedule in scheduler.rank_schedules([course1, course2], preference, limit)]
+            assert ranked_costs == sorted(get_schedule_cost(schedule, preference) for schedule in schedules)[:limit]
+    assert scheduler.rank_schedules([], SchedulePreference.IN_PERSON, 1, [section1]) == [[section1]]
+
+    max_schedules = scheduler.MAX_SCHEDULES
+    scheduler.MAX_SCHEDULES = 1
+    assert scheduler.generate_schedules([course1, course2], preference=SchedulePreference.MINIMIZE_DAYS) == ([[section3, section2]], True)
+    scheduler.MAX_SCHEDULES = max_schedules # reset constant
+
+def test_find_fewest_days_schedule():
+    '''
+    Tests that findFewestDaysSchedule finds the schedule with the fewest days on campus
+    '''
+    section1 = Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "08:35", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [["L1", "L2"]], "2023-09-06", "2023-12-08")
+    section1A = Section("CODE1000", "L1", "11112", "Alice", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "08:35", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    section1B = Section("CODE1000", "L2", "11113", "Alice", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "08:35", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [["A"]], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE2000", "B", "22223", "Bob", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section4 = Section("CODE3000", "A", "33333", "Charlie", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "08:35", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "TESTCLASS", "Fall 2023", "NONE", [section1], [section1A, section1B], None)
+    course2 = Course("CODE2000", "TESTCLASS", "Fall 2023", "NONE", [section2, section3], [], None)
+    course3 = Course("CODE3000", "TESTCLASS", "Fall 2023", "NONE", [section4], [], None)
+
+    assert scheduler.find_fewest_days_schedule([course1, course2]) == [section3, section1, section1B]
+    assert scheduler.find_fewest_days_schedule([course1, course2], order_courses=False) == [section3, section1, section1B]
+    assert scheduler.find_fewest_days_schedule([course2], [section1, section1A]) == [section1, section1A, section2]
+    assert scheduler.find_fewest_days_schedule([course1, course3]) == None
+    assert scheduler.find_fewest_days_schedule([], [section1]) == [section1]
+
+    conflict_graph = scheduler.get_conflict_graph([course1, course2])
+    assert scheduler.find_fewest_days_schedule([course1, course2], conflict_graph=conflict_graph) == [section3, section1, section1B]
+
+    # The first schedule found uses 3 days, and the budget runs out before the 2 day schedule is found
+    budget = SearchBudget(max_nodes=2)
+    assert scheduler.find_fewest_days_schedule([course1, course2], order_courses=False, budget=budget) == [section2, section1, section1A]
+    assert budget.is_exhausted == True
+    assert scheduler.find_fewest_days_schedule([course1, course2], budget=SearchBudget(max_nodes=0)) == None
+
+def test_get_day_count_lower_bound():
+    monday_option = scheduler.CourseOption.from_sections([Section("CODE1000", "A", "11111", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "08:35", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    monday_tuesday_option = scheduler.CourseOption.from_sections([Section("CODE1000", "B", "11112", "Alice", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "10:05", "11:25"), ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "10:05", "11:25")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    friday_option = scheduler.CourseOption.from_sections([Section("CODE2000", "A", "22222", "Bob", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "08:35", "09:55")], "", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")])
+    day_masks = [monday_option.day_mask, monday_tuesday_option.day_mask, friday_option.day_mask]
+    assert monday_tuesday_option.day_mask == 0b11
+    assert scheduler.get_day_count_lower_bound(0, [], day_masks) == 0
+    assert scheduler.get_day_count_lower_bound(0b100, [0b011], day_masks) == 2
+    assert scheduler.get_day_count_lower_bound(0b100, [0b011, 0b100], day_masks) == 3
+    assert scheduler.get_day_count_lower_bound(0, [0b110], day_masks) == 1
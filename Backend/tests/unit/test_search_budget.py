@@ -0,0 +1,56 @@
+from unittest import mock
+from unittest.mock import patch
+from Backend.src.model import search_budget
+from Backend.src.model.search_budget import SearchBudget
+
+def test_expand_with_max_nodes():
+    budget = SearchBudget(max_nodes=2)
+    assert budget.expand() == True
+    assert budget.expand() == True
+    assert budget.is_exhausted == False
+    assert budget.expand() == False
+    assert budget.is_exhausted == True
+    assert budget.expand() == False
+    assert budget.nodes == 3
+
+def test_expand_with_deadline():
+    budget = SearchBudget(deadline=10)
+    with patch.object(search_budget.time, "monotonic", return_value=5):
+        assert all(budget.expand() for _ in range(search_budget.CHECK_INTERVAL))
+        assert budget.get_remaining_seconds() == 5
+
+    with patch.object(search_budget.time, "monotonic", return_value=10):
+        assert all(budget.expand() for _ in range(search_budget.CHECK_INTERVAL - 1)) # the clock is only checked every CHECK_INTERVAL nodes
+        assert budget.expand() == False
+        assert budget.is_exhausted == True
+        assert budget.get_remaining_seconds() == 0
+
+    assert SearchBudget().expand() == True
+    assert SearchBudget().get_remaining_seconds() == None
+
+def test_check():
+    budget = SearchBudget(deadline=10)
+    with patch.object(search_budget.time, "monotonic", return_value=5):
+        assert budget.check() == True
+    with patch.object(search_budget.time, "monotonic", return_value=10):
+        assert budget.check() == False # the clock is checked right away
+    assert budget.is_exhausted == True
+    assert budget.nodes == 0
+
+    budget = SearchBudget(max_nodes=0)
+    assert budget.check() == True
+    budget.expand()
+    assert budget.check() == False
+    assert SearchBudget().check() == True
+
+def test_from_lambda_context():
+    context = mock.Mock()
+    context.get_remaining_time_in_millis.return_value = 10000
+    with patch.object(search_budget.time, "monotonic", return_value=100):
+        budget = SearchBudget.from_lambda_context(context, 2000, 50)
+    assert budget.max_nodes == 50
+    assert budget.deadline == 108
+
+    budget = SearchBudget.from_lambda_context("", 2000)
+    assert budget.max_nodes == None
+    assert budget.deadline == None
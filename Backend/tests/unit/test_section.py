@@ -1,5 +1,8 @@
 import pytest
 from Backend.src.model.section import Section
+from Backend.src.model.date import ClassTime
+from Backend.src.model.day_of_week import DayOfWeek
+from Backend.src.model.term_duration import TermDuration
 
 def test_to_dict():
     course_code = "CODE"
@@ -19,4 +22,15 @@ def test_to_dict():
     assert section.to_dict() == {"CourseCode":course_code, "SectionID":section_id, "CRN":crn,
                                  "Instructor":instructor, "Times":times, "Status":status, 
                                  "StartDate": start_date, "EndDate": end_date, "Title": title,
-                                 "Term": term, "Prerequisite": prerequisite, "SectionType": section_type}
\ No newline at end of file
+                                 "Term": term, "Prerequisite": prerequisite, "SectionType": section_type}
+
+def test_get_occupancy_mask():
+    time1 = ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:05", "10:35")
+    time2 = ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "09:05", "10:35")
+    section = Section("CODE", "A", "1234", "Professor X", [time1, time2], "OPEN", "COURSE TITLE", "Fall 2023", "None", [], "2023-09-06", "2023-12-08")
+    assert section.get_occupancy_mask() == time1.get_occupancy_mask() | time2.get_occupancy_mask()
+    assert section.is_occupancy_mask_exact() == True
+
+    section = Section("CODE", "A", "1234", "Professor X", [], "OPEN", "COURSE TITLE", "Fall 2023", "None", [], "2023-09-06", "2023-12-08")
+    assert section.get_occupancy_mask() == 0
+    assert section.is_occupancy_mask_exact() == True
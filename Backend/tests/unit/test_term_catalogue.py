@@ -0,0 +1,51 @@
+import pytest
+np = pytest.importorskip("numpy")
+from Backend.src.model.date import ClassTime
+from Backend.src.model.day_of_week import DayOfWeek
+from Backend.src.model.section import Section
+from Backend.src.model.course import Course
+from Backend.src.model.filter import Filter
+from Backend.src.model.term_catalogue import TermCatalogue
+from Backend.src.model.term_duration import TermDuration
+from Backend.src.model.week_schedule import WeekSchedule
+
+def get_courses():
+    section1 = Section("CODE1000", "A", "11111", "JON", [ClassTime(DayOfWeek.MONDAY, TermDuration.FULL_TERM, "09:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section2 = Section("CODE1000", "B", "22222", "JON", [ClassTime(DayOfWeek.TUESDAY, TermDuration.FULL_TERM, "09:00", "12:00"), ClassTime(DayOfWeek.FRIDAY, TermDuration.EARLY_TERM, "13:00", "14:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section3 = Section("CODE1000", "C", "33333", "JON", [], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    lab1 = Section("CODE1000", "L1", "44444", "JON", [ClassTime(DayOfWeek.FRIDAY, TermDuration.LATE_TERM, "12:00", "14:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    lab2 = Section("CODE1000", "L2", "55555", "JON", [ClassTime(DayOfWeek.FRIDAY, TermDuration.FULL_TERM, "12:00", "14:00", WeekSchedule.ODD_WEEK)], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section4 = Section("CODE2000", "A", "66666", "JON", [ClassTime(DayOfWeek.WEDNESDAY, TermDuration.FULL_TERM, "07:00", "12:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    section5 = Section("CODE2000", "B", "77777", "JON", [ClassTime(DayOfWeek.THURSDAY, TermDuration.FULL_TERM, "18:00", "21:00")], "OPEN", "CLASS TITLE", "TERM", "NONE", [], "2023-09-06", "2023-12-08")
+    course1 = Course("CODE1000", "CLASS NAME", "FALL", "N/A", [section1, section2, section3], [lab1, lab2], None)
+    course2 = Course("CODE2000", "CLASS NAME 2", "FALL", "N/A", [section4, section5], [], "B")
+    course3 = Course("CODE3000", "CLASS NAME 3", "FALL", "N/A", [], [], None)
+    return [course1, course2, course3]
+
+def test_get_filtered_section_indexes():
+    courses = get_courses()
+    catalogue = TermCatalogue(courses)
+    assert catalogue.section_count == 7
+    assert catalogue.get_filtered_section_indexes(Filter()) == {"CODE1000": ([0, 1, 2], [0, 1]), "CODE2000": ([1], []), "CODE3000": ([], [])}
+
+    filters = [
+        Filter(before_time="08:00", after_time="20:00"),
+        Filter(day_of_week=DayOfWeek.MONDAY),
+        Filter(between_times=[ClassTime(DayOfWeek.FRIDAY, TermDuration.EARLY_TERM, "13:30", "14:30", WeekSchedule.EVEN_WEEK)]),
+        Filter(before_time="09:30", day_of_week=DayOfWeek.TUESDAY, between_times=[ClassTime(DayOfWeek.FRIDAY, TermDuration.LATE_TERM, "11:00", "12:30")]),
+    ]
+    for filter in filters:
+        assert catalogue.get_filtered_section_indexes(filter) == {course.code: course.get_filtered_section_indexes(filter) for course in courses}
+    assert catalogue.get_filtered_section_indexes(filters[2]) == {"CODE1000": ([0, 2], [0, 1]), "CODE2000": ([1], []), "CODE3000": ([], [])}
+
+def test_get_remaining_sections():
+    catalogue = TermCatalogue(get_courses())
+    remaining_sections = catalogue.get_remaining_sections(Filter(after_time="13:30"))
+    assert remaining_sections.tolist() == [True, False, True, False, False, False, False]
+
+    with pytest.raises(TypeError):
+        catalogue.get_remaining_sections(None)
+
+def test_empty_catalogue():
+    catalogue = TermCatalogue([])
+    assert catalogue.get_filtered_section_indexes(Filter(day_of_week=DayOfWeek.MONDAY)) == {}
@@ -2,6 +2,7 @@ import boto3
 import json
 
 TABLE_NAME = "carleton-courses"
+TERM_INDEX_NAME = "TermIndex"
 
 def lambda_handler(event: dict, context: dict) -> str:
     '''
@@ -37,6 +38,30 @@ def lambda_handler(event: dict, context: dict) -> str:
                     'AttributeType': 'S'
                 }
             ],
+            GlobalSecondaryIndexes=[
+                {
+                    # Lists the courses of a term without reading every item (the Backend's /courses endpoint)
+                    'IndexName': TERM_INDEX_NAME,
+                    'KeySchema': [
+                        {
+                            'AttributeName': 'Term',
+                            'KeyType': 'HASH'
+                        },
+                        {
+                            'AttributeName': 'Subject',
+                            'KeyType': 'RANGE'
+                        }
+                    ],
+                    'Projection': {
+                        'ProjectionType': 'INCLUDE',
+                        'NonKeyAttributes': ['LectureSectionIDs']
+                    },
+                    'ProvisionedThroughput': {
+                        'ReadCapacityUnits': 10,
+                        'WriteCapacityUnits': 10
+                    }
+                }
+            ],
             ProvisionedThroughput={
                 'ReadCapacityUnits': 10,
                 'WriteCapacityUnits': 10
@@ -1,6 +1,8 @@
 import json
 import boto3
-from typing import List
+from typing import Iterator
+from json_stream import iter_json_object_values # from the JsonStreamLayer
+from s3_files import open_file, put_file # from the S3FilesLayer
 
 BUCKET_NAME = "carletonschedulingtool"
 KEY_PATH = "web-scraping-stepfunction/"
@@ -9,9 +11,8 @@ TERMS_COURSES_FILENAME = "terms_courses.json"
 
 def lambda_handler(event: dict, context: dict) -> str:
     terms_courses_dict = {}
-    classes_list = get_classes_list()
     
-    for course in classes_list:
+    for course in iter_classes():
         subject = course["Subject"]
         term_key = course["Term"]
         terms_courses_dict.setdefault(term_key, []).append(subject)
@@ -19,9 +20,9 @@ def lambda_handler(event: dict, context: dict) -> str:
         for lecture in course["LectureSections"]:
             terms_courses_dict.get(term_key).append(f"{subject} {lecture['SectionID']}")
 
-        for term, course in terms_courses_dict.items():
-            terms_courses_dict[term] = sorted(course)
-            
+    for term, course in terms_courses_dict.items():
+        terms_courses_dict[term] = sorted(course)
+        
     return write_terms_courses_to_s3(terms_courses_dict)
             
 
@@ -39,17 +40,15 @@ def get_s3_object(filename: str) -> object:
     return s3.Object(BUCKET_NAME, KEY_PATH + filename)
 
 
-def get_classes_list() -> List[dict]:
+def iter_classes() -> Iterator[dict]:
     '''
-    Gets the list of classes from s3.
+    Reads the classes from s3 one at a time (without loading the whole file).
     
     Returns
-    List[dict]: list of dict classes.
+    Iterator[dict]: dict classes.
     '''
     classes_file = get_s3_object(CLASSES_FILENAME)
-    classes = json.load(classes_file.get()["Body"])
-
-    return list(classes.values())
+    return iter_json_object_values(open_file(classes_file))
     
 
 def write_terms_courses_to_s3(terms_courses: dict[str, str]) -> str:
@@ -64,7 +63,7 @@ def write_terms_courses_to_s3(terms_courses: dict[str, str]) -> str:
     '''
     
     terms_courses_file = get_s3_object(TERMS_COURSES_FILENAME)
-    terms_courses_file.put(Body=(bytes(json.dumps(terms_courses).encode("UTF-8"))))
+    put_file(terms_courses_file, json.dumps(terms_courses).encode("UTF-8"))
     
     return {
         "Response": json.dumps("Terms and Courses written to s3!")
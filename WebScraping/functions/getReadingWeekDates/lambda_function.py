@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 import urllib3
 from bs4 import BeautifulSoup
 from typing import Tuple, List, Dict
+from s3_files import open_file, put_file # from the S3FilesLayer
 
 BASE_URL = "https://calendar.carleton.ca/academicyear"
 HTTP = urllib3.PoolManager()
@@ -76,7 +77,7 @@ def get_classes_dict() -> Dict:
     dict: terms course dict.
     '''
     classes_file = get_s3_object("classes.json")
-    return json.load(classes_file.get()["Body"])
+    return json.load(open_file(classes_file))
 
 
 def get_terms_from_class_dict(classes_dict: Dict) -> List:
@@ -215,7 +216,7 @@ def write_terms_file_to_s3(terms_dict: Dict) -> str:
     str: Message indicating the terms and courses file has been updated.
     '''
     terms_file = get_s3_object("terms.json")
-    terms_file.put(Body=(bytes(json.dumps(terms_dict).encode("UTF-8"))))
+    put_file(terms_file, json.dumps(terms_dict).encode("UTF-8"))
     
     return {
         "Response": json.dumps("Terms JSON written to s3 with reading week dates!")
@@ -1,36 +1,105 @@
 import json
 import boto3
-from typing import List
+import random
+import time
+import concurrent.futures
+import itertools
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from boto3.dynamodb.types import TypeSerializer
+from typing import Iterator, List
+from json_stream import iter_json_object_values # from the JsonStreamLayer
+from s3_files import open_file # from the S3FilesLayer
 
 BUCKET_NAME = "carletonschedulingtool"
 KEY_PATH = "web-scraping-stepfunction/classes.json"
 TABLE_NAME = "carleton-courses"
+MAX_BATCH_WRITE_ITEMS = 25 # Maximum number of items in one BatchWriteItem request
+MAX_WORKERS = 8
+MAX_PENDING_BATCHES = 2 * MAX_WORKERS # Batches read from S3 but not written yet (bounds the memory used)
+# Retries happen in two layers. botocore retries a request that fails as a whole (throttling errors and 5xx
+# responses) up to CLIENT_MAX_ATTEMPTS times, and write_batch retries the items of a batch that DynamoDB did not
+# process (a partial success, which botocore returns as is), as well as a request that is still throttled once
+# botocore gives up. The limits multiply, so both are kept small enough to finish well within the function timeout.
+CLIENT_MAX_ATTEMPTS = 3
+MAX_BATCH_RETRIES = 6
+BATCH_RETRY_DELAY = 0.05 # Seconds to wait before retrying a throttled batch (doubled on every retry)
+MAX_BATCH_RETRY_DELAY = 5
+THROTTLING_ERROR_CODES = ["ProvisionedThroughputExceededException", "ThrottlingException", "RequestLimitExceeded"]
+SERIALIZER = TypeSerializer()
 
 def lambda_handler(event: dict, context: dict) -> str:
-    classes_list = get_classes_list()
-    
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(TABLE_NAME)
-    
-    for course in classes_list:
-        table.put_item(Item=course)
- 
+    classes = iter_classes()
+
+    # Clients are thread safe, and adaptive retries slow every thread down together when the table is throttled
+    dynamodb = boto3.client("dynamodb", config=Config(retries={"max_attempts": CLIENT_MAX_ATTEMPTS, "mode": "adaptive"}))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pending = set()
+        while batch := list(itertools.islice(classes, MAX_BATCH_WRITE_ITEMS)):
+            if len(pending) >= MAX_PENDING_BATCHES:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                # result() re-raises the error of any batch that could not be written
+                for future in done:
+                    future.result()
+            pending.add(executor.submit(write_batch, dynamodb, batch))
+
+        for future in pending:
+            future.result()
+
     return {
         "Response": json.dumps(f"Classes inserted into {TABLE_NAME} DynamoDB table!")
     }
 
 
-def get_classes_list() -> List[dict]:
+def write_batch(dynamodb: object, courses: List[dict]) -> None:
     '''
-    Gets the list of classes from s3
-    
+    Writes up to 25 courses with one BatchWriteItem request, retrying the items DynamoDB
+    did not process (and throttled requests) with exponential backoff.
+
+    Parameters:
+    dynamodb: the DynamoDB client.
+    courses: the courses to write.
+    '''
+    request_items = {TABLE_NAME: [
+        {"PutRequest": {"Item": {k: SERIALIZER.serialize(v) for k, v in add_lecture_section_ids(course).items()}}}
+        for course in courses
+    ]}
+    retries = 0
+    while request_items:
+        try:
+            response = dynamodb.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems")
+        except ClientError as error:
+            if error.response["Error"]["Code"] not in THROTTLING_ERROR_CODES:
+                raise
+
+        if request_items:
+            if retries >= MAX_BATCH_RETRIES:
+                raise RuntimeError(f"Could not write {len(request_items[TABLE_NAME])} items to {TABLE_NAME} after {MAX_BATCH_RETRIES} retries!")
+            # Full jitter keeps the workers from retrying in lockstep
+            time.sleep(random.uniform(0, min(BATCH_RETRY_DELAY * 2 ** retries, MAX_BATCH_RETRY_DELAY)))
+            retries += 1
+
+
+def add_lecture_section_ids(course: dict) -> dict:
+    '''
+    Adds the IDs of the course's lecture sections, which are the only attribute the
+    table's term index projects (so listing a term's courses does not read whole items)
+
+    Returns
+    dict: the course with its LectureSectionIDs
+    '''
+    return {**course, "LectureSectionIDs": [section["SectionID"] for section in course.get("LectureSections", [])]}
+
+def iter_classes() -> Iterator[dict]:
+    '''
+    Reads the classes from s3 one at a time (without loading the whole file)
+
     Returns
-    List[dict]: list of dict classes
+    Iterator[dict]: dict classes
     '''
     s3 = boto3.resource("s3")
 
     classes_file = s3.Object(BUCKET_NAME, KEY_PATH)
-    classes = json.load(classes_file.get()["Body"])
-
-    return list(classes.values())
-   
\ No newline at end of file
+    return iter_json_object_values(open_file(classes_file))
@@ -10,6 +10,8 @@ from unicodedata import normalize
 from typing import List
 import json
 import boto3
+import gzip
+import os
 import re   
 
 PAGE_SOURCE = "https://central.carleton.ca/prod/bwysched.p_select_term?wsea_code=EXT"
@@ -22,6 +24,9 @@ HREF_STR = "bwysched.p_display_course?"
 LINKED_COURSE_STR = "https://carleton.ca/registrar/registration/terminology/"
 BUCKET_NAME = "carletonschedulingtool"
 KEY_PATH = "web-scraping-stepfunction/href_list.json"
+GZIP_ENCODING = "gzip"
+COMPRESSION = os.environ.get("compression", "") # "gzip" compresses the href list (the parser decompresses it when it is read)
+COMPRESSION_LEVEL = 6
 
 def handler(event=None, context=None) -> str:
     '''
@@ -78,7 +83,12 @@ def handler(event=None, context=None) -> str:
 
     s3 = boto3.resource("s3")
     href_list_file = s3.Object(BUCKET_NAME, KEY_PATH)
-    href_list_file.put(Body=(bytes(json.dumps(class_info).encode("UTF-8"))))
+    href_list = json.dumps(class_info).encode("UTF-8")
+    # The image cannot use the S3FilesLayer, so this is the same as s3_files.put_file
+    if COMPRESSION == GZIP_ENCODING:
+        href_list_file.put(Body=gzip.compress(href_list, COMPRESSION_LEVEL, mtime=0), ContentEncoding=GZIP_ENCODING)
+    else:
+        href_list_file.put(Body=href_list)
     
     return {
         "Response": json.dumps("Href list written to S3")
@@ -6,10 +6,13 @@ import urllib3
 from bs4 import BeautifulSoup
 import concurrent.futures
 import threading
+from catalogue_format import pack_catalogue # from the CatalogueLayer
+from s3_files import open_file, put_file # from the S3FilesLayer
 from datetime import datetime
 
 BUCKET_NAME = "carletonschedulingtool"
 KEY_PATH = "web-scraping-stepfunction/"
+TERM_CLASSES_PATH = "classes/" # classes of each term, so the Backend only has to load the terms it is asked about
 BASE_URL = "https://central.carleton.ca/prod/"
 TERM_START_MONTHS = ["May", "Sep", "Jan"]
 EARLY_TERM_END_MONTHS = ["Jun", "Oct", "Feb"]
@@ -20,14 +23,19 @@ classes = {}
 def lambda_handler(event: dict, context: object) -> str:
     # Get the hrefs list file from s3
     href_list_file = get_s3_object("href_list.json")
-    hrefs = json.load(href_list_file.get()["Body"])
+    hrefs = json.load(open_file(href_list_file))
     
     with concurrent.futures.ThreadPoolExecutor() as executor:
         executor.map(get_data, hrefs)
     
     # Write the classes dict into s3
     classes_file = get_s3_object("classes.json")
-    classes_file.put(Body=(bytes(json.dumps(classes).encode("UTF-8"))))
+    put_file(classes_file, json.dumps(classes).encode("UTF-8"))
+    write_term_classes(classes)
+
+    # The same classes in the binary format the Backend reads when its database_type is "binary"
+    catalogue_file = get_s3_object("classes.bin")
+    put_file(catalogue_file, pack_catalogue(classes))
 
     return {
         "Response": json.dumps("classes JSON written to s3")
@@ -48,6 +56,22 @@ def get_s3_object(filename: str) -> object:
     return s3.Object(BUCKET_NAME, KEY_PATH + filename)
 
 
+def write_term_classes(classes: dict) -> None:
+    '''
+    Writes the classes of each term into their own file (classes/<term>.json) in s3.
+
+    Parameters:
+    classes: The classes dict of every term.
+    '''
+    term_classes = {}
+    for key, course in classes.items():
+        term_classes.setdefault(course["Term"], {})[key] = course
+
+    for term, classes_dict in term_classes.items():
+        term_classes_file = get_s3_object(f"{TERM_CLASSES_PATH}{term}.json")
+        put_file(term_classes_file, json.dumps(classes_dict).encode("UTF-8"))
+
+
 def get_data(href_dict: dict) -> object:
     '''
     Gets the data of the course page by making a GET request to Carleton Public classes website.
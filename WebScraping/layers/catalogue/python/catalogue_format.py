@@ -0,0 +1,178 @@
+'''
+Binary catalogue of classes, written by the parser and read by the Backend (classes.bin). It holds the same
+classes as classes.json, but a course can be read without parsing the rest of the file (e.g. through mmap).
+
+Every number is a little-endian unsigned 32-bit integer and every string is an index into the string table
+(NONE if the key is not in the class). The file is made of:
+- the header: MAGIC, VERSION and the number of rows in each of the tables below
+- the string table: the offset of each string (and of the end of the last one), then the UTF-8 strings
+- the courses, sorted by key ("<course code>-<term>"): key, Subject, Title, Term, Prerequisite, and the
+  first section and number of sections of its LectureSections and of its LabSections
+- the sections: SectionID, CRN, Status, SectionType, Instructor, TermDuration, WeekSchedule, StartDate,
+  EndDate, the first meeting date and number of MeetingDates, and the first group and number of AlsoRegister groups
+- the meeting dates: DayOfWeek, StartTime, EndTime
+- the AlsoRegister groups: the first section ID and number of section IDs in the group
+- the section IDs of the groups
+'''
+import struct
+from typing import Dict, Iterator, List
+
+MAGIC = b"CSTC"
+VERSION = 1
+NONE = 0xFFFFFFFF
+HEADER = struct.Struct("<4sHHIIIIII")
+OFFSET = struct.Struct("<I")
+COURSE = struct.Struct("<9I")
+SECTION = struct.Struct("<13I")
+MEETING_DATE = struct.Struct("<3I")
+GROUP = struct.Struct("<2I")
+
+COURSE_COLUMNS = ["Subject", "Title", "Term", "Prerequisite"]
+SECTION_COLUMNS = ["SectionID", "CRN", "Status", "SectionType", "Instructor", "TermDuration", "WeekSchedule", "StartDate", "EndDate"]
+MEETING_DATE_COLUMNS = ["DayOfWeek", "StartTime", "EndTime"]
+
+class CatalogueFormatError(ValueError):
+    pass
+
+
+def pack_catalogue(classes: Dict[str, dict]) -> bytes:
+    '''
+    Packs the classes dict (keyed by "<course code>-<term>", as in classes.json) into a binary catalogue.
+    Keys of the classes that are not described above are left out.
+    '''
+    string_indexes: Dict[str, int] = {}
+    strings: List[bytes] = []
+
+    def add_string(value: str | None) -> int:
+        if value is None:
+            return NONE
+        index = string_indexes.get(value)
+        if index is None:
+            index = string_indexes[value] = len(strings)
+            strings.append(value.encode("UTF-8"))
+        return index
+
+    courses, sections, meeting_dates, groups, group_items = [], [], [], [], []
+
+    def add_sections(section_list: List[dict]) -> List[int]:
+        first_section = len(sections)
+        for section in section_list:
+            first_meeting_date, first_group = len(meeting_dates), len(groups)
+            for meeting_date in section.get("MeetingDates", []):
+                meeting_dates.append(MEETING_DATE.pack(*[add_string(meeting_date.get(column)) for column in MEETING_DATE_COLUMNS]))
+            for group in section.get("AlsoRegister", []):
+                groups.append(GROUP.pack(len(group_items), len(group)))
+                group_items.extend(OFFSET.pack(add_string(section_id)) for section_id in group)
+
+            sections.append(SECTION.pack(
+                *[add_string(section.get(column)) for column in SECTION_COLUMNS],
+                first_meeting_date, len(meeting_dates) - first_meeting_date, first_group, len(groups) - first_group
+            ))
+        return [first_section, len(section_list)]
+
+    # Keys are compared as UTF-8 bytes when they are searched, so they are sorted the same way
+    for key in sorted(classes, key=lambda key: key.encode("UTF-8")):
+        course = classes[key]
+        courses.append(COURSE.pack(
+            add_string(key), *[add_string(course.get(column)) for column in COURSE_COLUMNS],
+            *add_sections(course.get("LectureSections", [])), *add_sections(course.get("LabSections", []))
+        ))
+
+    string_offsets = [0]
+    for string in strings:
+        string_offsets.append(string_offsets[-1] + len(string))
+    string_blob = b"".join(strings)
+    padding = b"\0" * (-len(string_blob) % 4) # keeps the tables after the strings aligned
+
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION, 0, len(strings), len(courses), len(sections), len(meeting_dates), len(groups), len(group_items)),
+        *[OFFSET.pack(offset) for offset in string_offsets], string_blob, padding,
+        *courses, *sections, *meeting_dates, *groups, *group_items
+    ])
+
+
+class CatalogueReader:
+    '''
+    Reads the classes of a binary catalogue (bytes, or a mmap of the file), only decoding the classes that are read.
+    '''
+    def __init__(self, buffer: bytes):
+        if len(buffer) < HEADER.size:
+            raise CatalogueFormatError("The catalogue is too short!")
+        magic, version, _, string_count, course_count, section_count, meeting_date_count, group_count, group_item_count = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise CatalogueFormatError("The file is not a catalogue!")
+        if version != VERSION:
+            raise CatalogueFormatError(f"Version {version} of the catalogue is not supported!")
+
+        self.buffer = buffer
+        self.course_count = course_count
+        self.string_offsets = HEADER.size
+        self.strings = self.string_offsets + (string_count + 1) * OFFSET.size
+        strings_size = OFFSET.unpack_from(buffer, self.strings - OFFSET.size)[0] if string_count else 0
+        self.courses = self.strings + strings_size + (-strings_size % 4)
+        self.sections = self.courses + course_count * COURSE.size
+        self.meeting_dates = self.sections + section_count * SECTION.size
+        self.groups = self.meeting_dates + meeting_date_count * MEETING_DATE.size
+        self.group_items = self.groups + group_count * GROUP.size
+        if len(buffer) < self.group_items + group_item_count * OFFSET.size:
+            raise CatalogueFormatError("The catalogue is too short!")
+
+    def get_bytes(self, index: int) -> bytes:
+        start, end = struct.unpack_from("<2I", self.buffer, self.string_offsets + index * OFFSET.size)
+        return bytes(self.buffer[self.strings + start:self.strings + end])
+
+    def get_string(self, index: int) -> str | None:
+        return None if index == NONE else self.get_bytes(index).decode("UTF-8")
+
+    def get_course_index(self, key: str) -> int | None:
+        '''
+        Binary searches the courses for the one with the given key.
+        '''
+        key_bytes = key.encode("UTF-8")
+        low, high = 0, self.course_count
+        while low < high:
+            middle = (low + high) // 2
+            middle_key = self.get_bytes(OFFSET.unpack_from(self.buffer, self.courses + middle * COURSE.size)[0])
+            if middle_key < key_bytes:
+                low = middle + 1
+            elif middle_key > key_bytes:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def get(self, key: str) -> dict | None:
+        '''
+        Gets the class with the given key ("<course code>-<term>") as it is in classes.json,
+        or None if there is no class with that key.
+        '''
+        index = self.get_course_index(key)
+        if index is None:
+            return None
+
+        _, *columns, first_lecture, lecture_count, first_lab, lab_count = COURSE.unpack_from(self.buffer, self.courses + index * COURSE.size)
+        course = self.get_columns(COURSE_COLUMNS, columns)
+        course["LectureSections"] = [self.get_section(section) for section in range(first_lecture, first_lecture + lecture_count)]
+        course["LabSections"] = [self.get_section(section) for section in range(first_lab, first_lab + lab_count)]
+        return course
+
+    def get_section(self, index: int) -> dict:
+        *columns, first_meeting_date, meeting_date_count, first_group, group_count = SECTION.unpack_from(self.buffer, self.sections + index * SECTION.size)
+        section = self.get_columns(SECTION_COLUMNS, columns)
+        section["MeetingDates"] = [
+            self.get_columns(MEETING_DATE_COLUMNS, MEETING_DATE.unpack_from(self.buffer, self.meeting_dates + meeting_date * MEETING_DATE.size))
+            for meeting_date in range(first_meeting_date, first_meeting_date + meeting_date_count)
+        ]
+        section["AlsoRegister"] = [self.get_group(group) for group in range(first_group, first_group + group_count)]
+        return section
+
+    def get_group(self, index: int) -> List[str]:
+        first_item, item_count = GROUP.unpack_from(self.buffer, self.groups + index * GROUP.size)
+        return [self.get_string(OFFSET.unpack_from(self.buffer, self.group_items + item * OFFSET.size)[0]) for item in range(first_item, first_item + item_count)]
+
+    def get_columns(self, names: List[str], indexes: List[int]) -> dict:
+        return {name: self.get_string(index) for name, index in zip(names, indexes) if index != NONE}
+
+    def keys(self) -> Iterator[str]:
+        for index in range(self.course_count):
+            yield self.get_string(OFFSET.unpack_from(self.buffer, self.courses + index * COURSE.size)[0])
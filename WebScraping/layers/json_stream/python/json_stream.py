@@ -0,0 +1,93 @@
+import codecs
+import json
+import re
+from typing import Iterator, Tuple
+
+CHUNK_SIZE = 64 * 1024 # Number of bytes read from the stream at a time
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_REST = re.compile(r"[0-9.eE+\-]*\Z") # text that could still be part of a number that was cut off
+DECODER = json.JSONDecoder()
+
+def iter_json_object_items(stream: object) -> Iterator[Tuple[str, object]]:
+    '''
+    Yields the (key, value) pairs of the JSON object in a stream (e.g. the Body of an S3 object) one at a time,
+    so only one value and one chunk of the stream are held in memory instead of the whole object.
+
+    Parameters:
+    stream: a binary stream of UTF-8 encoded JSON, with a read(size) method.
+
+    Returns
+    Iterator[Tuple[str, object]]: the keys and the decoded values of the object, in order.
+    '''
+    reader = _JsonStreamReader(stream)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+
+    while True:
+        key = reader.decode()
+        reader.expect(":")
+        value = reader.decode()
+        yield key, value
+
+        if reader.peek() == "}":
+            reader.expect("}")
+            return
+        reader.expect(",")
+
+def iter_json_object_values(stream: object) -> Iterator[object]:
+    '''
+    Yields the values of the JSON object in a stream one at a time (see iter_json_object_items).
+    '''
+    for _, value in iter_json_object_items(stream):
+        yield value
+
+
+class _JsonStreamReader:
+    '''
+    Buffers the text of a stream and decodes one JSON value at a time from it.
+    '''
+    def __init__(self, stream: object):
+        self.stream = stream
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.position = 0
+        self.is_eof = False
+
+    def read_more(self) -> None:
+        chunk = self.stream.read(CHUNK_SIZE)
+        self.is_eof = not chunk
+        # Drop the text that has already been decoded so the buffer does not grow with the stream
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(chunk, final=self.is_eof)
+        self.position = 0
+
+    def peek(self) -> str:
+        '''
+        Skips whitespace and returns the next character (empty at the end of the stream).
+        '''
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer) or self.is_eof:
+                return self.buffer[self.position:self.position + 1]
+            self.read_more()
+
+    def expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise json.JSONDecodeError(f"Expecting '{character}'", self.buffer, self.position)
+        self.position += 1
+
+    def decode(self) -> object:
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.position)
+                # A number can be cut off at the end of the buffer (e.g. "1." is decoded as 1), so a value is only
+                # complete once it is followed by something that cannot continue it
+                if self.is_eof or not NUMBER_REST.match(self.buffer, end):
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.is_eof:
+                    raise
+            self.read_more()
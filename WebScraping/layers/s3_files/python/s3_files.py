@@ -0,0 +1,55 @@
+import gzip
+import os
+
+GZIP_ENCODING = "gzip"
+COMPRESSION = os.environ.get("compression", "") # "gzip" compresses the files written to s3 (files are decompressed when read either way)
+COMPRESSION_LEVEL = 6
+
+def put_file(s3_object: object, body: bytes) -> None:
+    '''
+    Writes a file to s3, compressed if the compression environment variable is set
+    (with the ContentEncoding of the file set to the compression).
+
+    Parameters:
+    s3_object: The s3 file object to write.
+    body: The contents of the file.
+    '''
+    if COMPRESSION == GZIP_ENCODING:
+        # mtime=0 so the same contents always compress to the same bytes (and ETag)
+        s3_object.put(Body=gzip.compress(body, COMPRESSION_LEVEL, mtime=0), ContentEncoding=GZIP_ENCODING)
+    elif COMPRESSION:
+        raise ValueError(f"Unsupported compression: {COMPRESSION}!")
+    else:
+        s3_object.put(Body=body)
+
+
+def open_file(s3_object: object) -> object:
+    '''
+    Reads a file from s3, decompressing it while it is read if it was written compressed.
+
+    Parameters:
+    s3_object: The s3 file object to read.
+
+    Returns
+    object: A binary stream of the contents of the file.
+    '''
+    return open_body(s3_object.get())
+
+
+def open_body(response: dict) -> object:
+    '''
+    Gets the body of a file read from s3 (the response of a get request), decompressing it 
+    while it is read if it was written compressed.
+
+    Parameters:
+    response: The response of the get request of the file.
+
+    Returns
+    object: A binary stream of the contents of the file.
+    '''
+    content_encoding = response.get("ContentEncoding", "")
+    if content_encoding == GZIP_ENCODING:
+        return gzip.GzipFile(fileobj=response["Body"], mode="rb")
+    if content_encoding:
+        raise ValueError(f"Unsupported ContentEncoding: {content_encoding}!")
+    return response["Body"]
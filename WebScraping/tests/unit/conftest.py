@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Lambda layers are mounted on the path of the functions that use them (see webscraping-template.yaml)
+LAYERS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "layers")
+sys.path.append(os.path.join(LAYERS_PATH, "json_stream", "python"))
+sys.path.append(os.path.join(LAYERS_PATH, "catalogue", "python"))
+sys.path.append(os.path.join(LAYERS_PATH, "s3_files", "python"))
@@ -0,0 +1,51 @@
+import pytest
+import struct
+from catalogue_format import *
+
+CLASSES_DICT = {
+    "SYSC 4810-Fall 2023": {
+        "Subject": "SYSC 4810", "Term": "Fall 2023", "Title": "Introduction to Network and Software Security",
+        "Prerequisite": "fourth-year status in Communications, Computer Systems or Software Engineering.",
+        "LectureSections": [{
+            "SectionID": "A", "CRN": "35659", "Status": "Registration Closed", "SectionType": "In person", "Instructor": "Test Professor",
+            "MeetingDates": [{"DayOfWeek": "Wed", "StartTime": "11:35", "EndTime": "12:55"}, {"DayOfWeek": "Fri", "StartTime": "11:35", "EndTime": "12:55"}],
+            "TermDuration": "Full Term", "AlsoRegister": [["A1", "A2", "A3"], ["B1"]], "StartDate": "2023-09-06", "EndDate": "2023-12-08"
+        }],
+        "LabSections": [{
+            "SectionID": "A1", "CRN": "35660", "Status": "Open", "SectionType": "Online", "Instructor": "",
+            "MeetingDates": [], "TermDuration": "Early Term", "AlsoRegister": [], "WeekSchedule": "Odd Week"
+        }]
+    },
+    "SYSC 4810-Winter 2024": {"Subject": "SYSC 4810", "Term": "Winter 2024", "Title": "Sécurité 安全", "Prerequisite": "", "LectureSections": [], "LabSections": []},
+    "AERO 2001-Fall 2023": {"Subject": "AERO 2001", "Term": "Fall 2023", "Title": "A", "Prerequisite": "", "LectureSections": [], "LabSections": []}
+}
+
+def test_pack_catalogue():
+    reader = CatalogueReader(pack_catalogue(CLASSES_DICT))
+
+    for key, course in CLASSES_DICT.items():
+        assert reader.get(key) == course
+    assert list(reader.keys()) == sorted(CLASSES_DICT)
+    assert reader.get("SYSC 4810-Summer 2024") == None
+    assert reader.get("") == None
+    assert reader.get("ZZZZ 9999-Fall 2023") == None
+
+def test_pack_empty_catalogue():
+    reader = CatalogueReader(pack_catalogue({}))
+    assert list(reader.keys()) == []
+    assert reader.get("SYSC 4810-Fall 2023") == None
+
+def test_pack_catalogue_leaves_out_unknown_keys():
+    reader = CatalogueReader(pack_catalogue({"KEY": {"Subject": "SYSC 4810", "Unknown": "value"}}))
+    assert reader.get("KEY") == {"Subject": "SYSC 4810", "LectureSections": [], "LabSections": []}
+
+def test_invalid_catalogue():
+    catalogue = pack_catalogue(CLASSES_DICT)
+    with pytest.raises(CatalogueFormatError):
+        CatalogueReader(b"")
+    with pytest.raises(CatalogueFormatError):
+        CatalogueReader(b"JSON" + catalogue[4:])
+    with pytest.raises(CatalogueFormatError):
+        CatalogueReader(catalogue[:4] + struct.pack("<H", VERSION + 1) + catalogue[6:])
+    with pytest.raises(CatalogueFormatError):
+        CatalogueReader(catalogue[:-1])
@@ -24,6 +24,15 @@ def test_lambda_handler():
                 {'AttributeName': 'Subject', 'AttributeType': 'S'},
                 {'AttributeName': 'Term', 'AttributeType': 'S'}
             ],
+            GlobalSecondaryIndexes=[{
+                'IndexName': 'TermIndex',
+                'KeySchema': [
+                    {'AttributeName': 'Term', 'KeyType': 'HASH'},
+                    {'AttributeName': 'Subject', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'INCLUDE', 'NonKeyAttributes': ['LectureSectionIDs']},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 10, 'WriteCapacityUnits': 10}
+            }],
             ProvisionedThroughput={'ReadCapacityUnits': 10, 'WriteCapacityUnits': 10}
         )
         mock_table.wait_until_exists.assert_called_once()
@@ -1,6 +1,7 @@
 from WebScraping.functions.createTermsCoursesJson.lambda_function import *
 from botocore.stub import Stubber
 from unittest.mock import MagicMock, patch
+import io
 
 FILE_PATH = "WebScraping.functions.createTermsCoursesJson.lambda_function"
 TEST_TERM_COURSE = {"Fall 2023": ["SYSC 4310 A"], "Winter 2024": ["SYSC 4504"]}
@@ -28,7 +29,7 @@ CLASSES_DICT = {"AERO 2001-Fall 2023":
 def test_lambda_handler():
     class_list = list(CLASSES_DICT.values())
 
-    with patch(f"{FILE_PATH}.get_classes_list", return_value=class_list):
+    with patch(f"{FILE_PATH}.iter_classes", return_value=iter(class_list)):
         with patch(f"{FILE_PATH}.write_terms_courses_to_s3") as mock_write_terms:
             lambda_handler(event=None, context=None)
 
@@ -52,16 +53,16 @@ def test_get_s3_object():
     assert result.key == expected_key
 
 
-def test_get_classes_list():
+def test_iter_classes():
     s3_object = MagicMock()
     class_dict = json.dumps(CLASSES_DICT)
-    s3_object.get.return_value = {"Body": MagicMock(read=lambda: class_dict)}
+    s3_object.get.return_value = {"Body": io.BytesIO(class_dict.encode("UTF-8"))}
 
     with patch(f"{FILE_PATH}.get_s3_object", return_value=s3_object) as mock_s3:
-        result = get_classes_list()
+        result = iter_classes()
         mock_s3.assert_called_once_with(CLASSES_FILENAME)
 
-        assert result == list(CLASSES_DICT.values())
+        assert list(result) == list(CLASSES_DICT.values())
 
 
 def test_write_terms_courses_to_s3():
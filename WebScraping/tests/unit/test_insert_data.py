@@ -1,5 +1,7 @@
 from WebScraping.functions.insertData.lambda_function import *
 from unittest.mock import Mock, patch
+import pytest
+import io
 
 FILE_PATH = "WebScraping.functions.insertData.lambda_function"
 CLASS_DICT = {
@@ -23,28 +25,79 @@ CLASS_DICT = {
     "LabSections": []
 }
 
+def get_put_request(course: dict) -> dict:
+    return {"PutRequest": {"Item": {k: SERIALIZER.serialize(v) for k, v in add_lecture_section_ids(course).items()}}}
+
 def test_lambda_handler():
+    classes_list = [{**CLASS_DICT, "Subject": f"SYSC {4000 + i}"} for i in range(MAX_BATCH_WRITE_ITEMS * MAX_PENDING_BATCHES + 1)]
 
-    with patch(f"{FILE_PATH}.get_classes_list") as mock_get_classes_list:
-        mock_get_classes_list.return_value = [CLASS_DICT]
+    with patch(f"{FILE_PATH}.iter_classes") as mock_iter_classes:
+        mock_iter_classes.return_value = iter(classes_list)
 
-        with patch("boto3.resource") as mock_dynamodb:
-            mock_table = mock_dynamodb().Table.return_value
+        with patch("boto3.client") as mock_client:
+            mock_dynamodb = mock_client.return_value
+            mock_dynamodb.batch_write_item.return_value = {"UnprocessedItems": {}}
 
             result = lambda_handler(event={}, context={})
 
-            mock_get_classes_list.assert_called_once()
-            mock_table.put_item.assert_called_once_with(Item=CLASS_DICT)
+            mock_iter_classes.assert_called_once()
+            assert mock_client.call_args.args == ("dynamodb",)
+            assert mock_client.call_args.kwargs["config"].retries == {"max_attempts": CLIENT_MAX_ATTEMPTS, "mode": "adaptive"}
+            requests = sorted((call.kwargs["RequestItems"][TABLE_NAME] for call in mock_dynamodb.batch_write_item.call_args_list), key=len)
+            assert len(requests) == MAX_PENDING_BATCHES + 1
+            assert requests[0] == [get_put_request(classes_list[-1])]
+            written = sorted((request for batch in requests for request in batch), key=lambda request: request["PutRequest"]["Item"]["Subject"]["S"])
+            assert written == [get_put_request(course) for course in classes_list]
             assert result == {"Response": json.dumps("Classes inserted into carleton-courses DynamoDB table!")}
 
 
-def test_get_classes_list():
+def test_write_batch_retries():
+    unprocessed_items = {TABLE_NAME: [get_put_request(CLASS_DICT)]}
+    throttling_error = ClientError({"Error": {"Code": "ProvisionedThroughputExceededException"}}, "BatchWriteItem")
+    mock_dynamodb = Mock()
+    mock_dynamodb.batch_write_item.side_effect = [{"UnprocessedItems": unprocessed_items}, throttling_error, {}]
+
+    with patch(f"{FILE_PATH}.time.sleep") as mock_sleep:
+        write_batch(mock_dynamodb, [CLASS_DICT])
+
+    assert mock_dynamodb.batch_write_item.call_count == 3
+    assert all(call.kwargs["RequestItems"] == unprocessed_items for call in mock_dynamodb.batch_write_item.call_args_list)
+    assert mock_sleep.call_count == 2
+
+
+def test_write_batch_errors():
+    mock_dynamodb = Mock()
+    mock_dynamodb.batch_write_item.side_effect = ClientError({"Error": {"Code": "ValidationException"}}, "BatchWriteItem")
+    with pytest.raises(ClientError):
+        write_batch(mock_dynamodb, [CLASS_DICT])
+
+    mock_dynamodb.batch_write_item.side_effect = None
+    mock_dynamodb.batch_write_item.return_value = {"UnprocessedItems": {TABLE_NAME: [get_put_request(CLASS_DICT)]}}
+    with patch(f"{FILE_PATH}.time.sleep"), pytest.raises(RuntimeError):
+        write_batch(mock_dynamodb, [CLASS_DICT])
+    assert mock_dynamodb.batch_write_item.call_count == MAX_BATCH_RETRIES + 2
+
+
+def test_add_lecture_section_ids():
+    result = add_lecture_section_ids(CLASS_DICT)
+
+    assert result["LectureSectionIDs"] == ["A"]
+    assert "LectureSectionIDs" not in CLASS_DICT
+    assert add_lecture_section_ids({**CLASS_DICT, "LectureSections": []})["LectureSectionIDs"] == []
+
+def test_lambda_handler_errors():
+    with patch(f"{FILE_PATH}.iter_classes", return_value=iter([CLASS_DICT])), patch("boto3.client") as mock_client:
+        mock_client.return_value.batch_write_item.side_effect = ClientError({"Error": {"Code": "ValidationException"}}, "BatchWriteItem")
+        with pytest.raises(ClientError):
+            lambda_handler(event={}, context={})
+
+
+def test_iter_classes():
     with patch("boto3.resource") as mock_s3:
         mock_s3_object = mock_s3().Object.return_value
-        mock_s3_object.get.return_value = {"Body": Mock()}
-        return_val = {"SYSC 4810-Fall 2023": CLASS_DICT}
+        mock_s3_object.get.return_value = {"Body": io.BytesIO(json.dumps({"SYSC 4810-Fall 2023": CLASS_DICT}).encode("UTF-8"))}
 
-        with patch("json.load", return_value=return_val):
-            result = get_classes_list()
+        result = iter_classes()
 
-            assert result == [CLASS_DICT]
+        mock_s3().Object.assert_called_with(BUCKET_NAME, KEY_PATH)
+        assert list(result) == [CLASS_DICT]
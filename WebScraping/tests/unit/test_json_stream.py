@@ -0,0 +1,49 @@
+import io
+import json
+import pytest
+from unittest.mock import patch
+from json_stream import iter_json_object_items, iter_json_object_values
+
+FILE_PATH = "json_stream"
+CLASSES_DICT = {
+    "SYSC 4810-Fall 2023": {"Subject": "SYSC 4810", "Term": "Fall 2023", "Title": "Network Security é中", "Credits": 0.5, "LabSections": []},
+    "SYSC 4001-Fall 2023": {"Subject": "SYSC 4001", "Term": "Fall 2023", "Title": "Operating Systems", "Credits": 12345, "LabSections": [{"SectionID": "L1"}]},
+    "EMPTY": {},
+    "NUMBER": 1234567890
+}
+
+def get_stream(value: object, indent: int | None = None) -> io.BytesIO:
+    return io.BytesIO(json.dumps(value, indent=indent, ensure_ascii=False).encode("UTF-8"))
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64 * 1024])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_json_object_items(chunk_size, indent):
+    with patch(f"{FILE_PATH}.CHUNK_SIZE", chunk_size):
+        items = list(iter_json_object_items(get_stream(CLASSES_DICT, indent)))
+
+    assert items == list(CLASSES_DICT.items())
+
+@pytest.mark.parametrize("chunk_size", range(1, 12))
+def test_iter_json_object_items_with_numbers(chunk_size):
+    text = b'{"a":1.5, "b": -12.5e3, "c": 1E+2,"d":0, "e": [2.25e-1, 3]}'
+    with patch(f"{FILE_PATH}.CHUNK_SIZE", chunk_size):
+        items = list(iter_json_object_items(io.BytesIO(text)))
+
+    assert items == list(json.loads(text).items())
+
+def test_iter_json_object_values():
+    assert list(iter_json_object_values(get_stream(CLASSES_DICT))) == list(CLASSES_DICT.values())
+    assert list(iter_json_object_values(get_stream({}))) == []
+    assert list(iter_json_object_values(io.BytesIO(b" { } "))) == []
+
+def test_iter_json_object_values_is_lazy():
+    stream = get_stream({str(i): {"Subject": f"SYSC {i}"} for i in range(10000)})
+    with patch(f"{FILE_PATH}.CHUNK_SIZE", 1024):
+        values = iter_json_object_values(stream)
+        assert next(values) == {"Subject": "SYSC 0"}
+        assert stream.tell() <= 2 * 1024
+
+@pytest.mark.parametrize("text", [b"", b"[1, 2]", b'{"a": 1', b'{"a": 1,}', b'{"a" 1}', b'{"a": {"b": 1}'])
+def test_iter_json_object_values_invalid(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_object_values(io.BytesIO(text)))
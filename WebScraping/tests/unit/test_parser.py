@@ -18,13 +18,36 @@ def test_lambda_handler():
     s3_classes_object.key = KEY_PATH + "classes.json"
     s3_classes_object.get.return_value = {"Body": MagicMock()}
 
-    with patch(f"{FILE_PATH}.get_s3_object", side_effect=[s3_href_object, s3_classes_object]):
+    s3_catalogue_object = MagicMock()
+
+    with patch(f"{FILE_PATH}.get_s3_object", side_effect=[s3_href_object, s3_classes_object, s3_catalogue_object]) as mock_get_s3_object:
         result = lambda_handler(event={}, context={})
         s3_href_object.get.assert_called_once_with()
         s3_classes_object.put.assert_called_once_with(Body=b"{}")
+        mock_get_s3_object.assert_called_with("classes.bin")
+        s3_catalogue_object.put.assert_called_once_with(Body=pack_catalogue({}))
         assert result == {"Response": json.dumps("classes JSON written to s3")}
 
 
+def test_write_term_classes():
+    classes = {
+        "SYSC 4810-Fall 2023": {"Subject": "SYSC 4810", "Term": "Fall 2023"},
+        "SYSC 4001-Fall 2023": {"Subject": "SYSC 4001", "Term": "Fall 2023"},
+        "SYSC 4810-Winter 2024": {"Subject": "SYSC 4810", "Term": "Winter 2024"}
+    }
+    s3_objects = {}
+    with patch(f"{FILE_PATH}.get_s3_object", side_effect=lambda filename: s3_objects.setdefault(filename, MagicMock())):
+        write_term_classes(classes)
+
+    assert sorted(s3_objects) == ["classes/Fall 2023.json", "classes/Winter 2024.json"]
+    s3_objects["classes/Fall 2023.json"].put.assert_called_once_with(
+        Body=bytes(json.dumps({key: classes[key] for key in ["SYSC 4810-Fall 2023", "SYSC 4001-Fall 2023"]}).encode("UTF-8"))
+    )
+    s3_objects["classes/Winter 2024.json"].put.assert_called_once_with(
+        Body=bytes(json.dumps({"SYSC 4810-Winter 2024": classes["SYSC 4810-Winter 2024"]}).encode("UTF-8"))
+    )
+
+
 def test_get_data():
     href_dict = {"href": "test-course-href", "also_register": "test-also-register-str"}
     test_html = "<html><body>Mocked HTML</body></html>"
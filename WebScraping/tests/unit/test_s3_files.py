@@ -0,0 +1,46 @@
+import gzip
+import io
+import pytest
+from unittest.mock import MagicMock, patch
+from s3_files import *
+
+FILE_PATH = "s3_files"
+BODY = b'{"SYSC 4810-Fall 2023": {"Subject": "SYSC 4810"}}'
+
+def test_put_file():
+    s3_object = MagicMock()
+    with patch(f"{FILE_PATH}.COMPRESSION", ""):
+        put_file(s3_object, BODY)
+    s3_object.put.assert_called_once_with(Body=BODY)
+
+def test_put_file_compressed():
+    s3_object = MagicMock()
+    with patch(f"{FILE_PATH}.COMPRESSION", "gzip"):
+        put_file(s3_object, BODY)
+        put_file(s3_object, BODY)
+
+    first_call, second_call = s3_object.put.call_args_list
+    assert first_call.kwargs["ContentEncoding"] == "gzip"
+    assert gzip.decompress(first_call.kwargs["Body"]) == BODY
+    assert first_call == second_call
+
+    with patch(f"{FILE_PATH}.COMPRESSION", "br"), pytest.raises(ValueError):
+        put_file(s3_object, BODY)
+
+def test_open_file():
+    s3_object = MagicMock()
+    s3_object.get.return_value = {"Body": io.BytesIO(BODY)}
+    assert open_file(s3_object).read() == BODY
+
+    s3_object.get.return_value = {"Body": io.BytesIO(gzip.compress(BODY)), "ContentEncoding": "gzip"}
+    assert open_file(s3_object).read() == BODY
+
+    s3_object.get.return_value = {"Body": io.BytesIO(BODY), "ContentEncoding": "br"}
+    with pytest.raises(ValueError):
+        open_file(s3_object)
+
+def test_open_body():
+    assert open_body({"Body": io.BytesIO(BODY)}).read() == BODY
+    assert open_body({"Body": io.BytesIO(gzip.compress(BODY)), "ContentEncoding": "gzip"}).read() == BODY
+    with pytest.raises(ValueError):
+        open_body({"Body": io.BytesIO(BODY), "ContentEncoding": "br"})